@@ -33,12 +33,16 @@ class IPtagResource:
 
         # the identifier that states what type of data is being transmitted
         # through this IP tag
-        "_traffic_identifier")
+        "_traffic_identifier",
+
+        # An estimate of the rate of traffic through this IP tag, or None if
+        # not known
+        "_rate")
 
     def __init__(
             self, ip_address: str, port: int,
             strip_sdp: bool, tag: int | None = None,
-            traffic_identifier: str = "DEFAULT"):
+            traffic_identifier: str = "DEFAULT", rate: float | None = None):
         """
         :param ip_address:
             The IP address of the host that will receive data from this tag
@@ -49,12 +53,17 @@ class IPtagResource:
         :param traffic_identifier: The traffic to be sent using this tag;
             traffic with the same traffic_identifier can be sent using
             the same tag
+        :param rate: An estimate of the rate of traffic to be sent using
+            this tag, in any units as long as they are the same for all tags,
+            or `None` if not known; used to balance the traffic between the
+            Ethernet chips
         """
         self._ip_address = ip_address
         self._port = port
         self._strip_sdp = strip_sdp
         self._tag = tag
         self._traffic_identifier = traffic_identifier
+        self._rate = rate
 
     @property
     def ip_address(self) -> str:
@@ -77,6 +86,13 @@ class IPtagResource:
         """
         return self._traffic_identifier
 
+    @property
+    def rate(self) -> float | None:
+        """
+        The estimated rate of traffic for this IP tag, or `None` if not known.
+        """
+        return self._rate
+
     @property
     def strip_sdp(self) -> bool:
         """
@@ -92,10 +108,11 @@ class IPtagResource:
         return self._tag
 
     def __repr__(self) -> str:
+        rate = "" if self._rate is None else f", rate={self._rate}"
         return (
             f"IPTagResource(ip_address={self._ip_address}, port={self._port}, "
             f"strip_sdp={self._strip_sdp}, tag={self._tag}, "
-            f"traffic_identifier={self._traffic_identifier})")
+            f"traffic_identifier={self._traffic_identifier}{rate})")
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -105,12 +122,13 @@ class IPtagResource:
                 self._port == other._port and
                 self._strip_sdp == other._strip_sdp and
                 self._tag == other._tag and
-                self._traffic_identifier == other._traffic_identifier)
+                self._traffic_identifier == other._traffic_identifier and
+                self._rate == other._rate)
 
     def __hash__(self) -> int:
         return hash((
             self._ip_address, self._port, self._strip_sdp, self._tag,
-            self._traffic_identifier))
+            self._traffic_identifier, self._rate))
 
     def __ne__(self, other: Any) -> bool:
         return not self.__eq__(other)
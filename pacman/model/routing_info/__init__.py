@@ -18,6 +18,7 @@ from .fixed_app_vertex_routing_info import FixedAppVertexRoutingInfo
 from .fixed_machine_vertex_routing_info import FixedMachineVertexRoutingInfo
 from .global_app_vertex_routing_info import GlobalAppVertexRoutingInfo
 from .global_machine_vertex_routing_info import GlobalMachineVertexRoutingInfo
+from .key_to_vertex_index import NO_VERTEX, KeyToVertexIndex
 from .machine_vertex_routing_info import MachineVertexRoutingInfo
 from .routing_info import RoutingInfo
 from .specific_app_vertex_routing_info import SpecificAppVertexRoutingInfo
@@ -29,6 +30,7 @@ from .vertex_routing_info import VertexRoutingInfo
 __all__ = ["AppVertexRoutingInfo", "BaseKeyAndMask",
            "FixedAppVertexRoutingInfo", "FixedMachineVertexRoutingInfo",
            "GlobalAppVertexRoutingInfo", "GlobalMachineVertexRoutingInfo",
+           "KeyToVertexIndex", "NO_VERTEX",
            "MachineVertexRoutingInfo", "RoutingInfo",
            "SpecificAppVertexRoutingInfo", "SpecificMachineVertexRoutingInfo",
            "VertexRoutingInfo"]
@@ -0,0 +1,187 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import numpy
+
+from pacman.exceptions import PacmanRouteInfoAllocationException
+from pacman.utilities.constants import BITS_IN_KEY, FULL_MASK
+from pacman.utilities.utility_calls import can_shift
+
+from .machine_vertex_routing_info import MachineVertexRoutingInfo
+
+if TYPE_CHECKING:
+    from pacman.model.graphs.machine import MachineVertex
+
+#: Value returned by :py:meth:`KeyToVertexIndex.decode` for unknown keys
+NO_VERTEX = -1
+
+
+class KeyToVertexIndex:
+    """
+    A reverse index from multicast keys to the machine vertex, partition and
+    atom that sent them.
+
+    The index is built once from the machine level routing information.
+    Keys with a mask whose zero bits are all at the bottom (the normal case)
+    are held as sorted, non-overlapping intervals and found by binary search.
+    Any other (fixed) masks are matched directly, which is fine as there are
+    expected to be very few of these.
+    """
+
+    __slots__ = (
+        # The routing infos in the order they are indexed
+        "__infos",
+        # Base key of each interval, sorted ascending
+        "__lo_keys",
+        # Last key of each interval
+        "__hi_keys",
+        # Index into __infos of each interval
+        "__interval_info",
+        # Key, mask and index into __infos of each irregular mask
+        "__irregular",
+    )
+
+    def __init__(self, infos: Iterable[MachineVertexRoutingInfo]):
+        """
+        :param infos: The machine vertex routing information to index
+        :raise PacmanRouteInfoAllocationException:
+            If two of the infos have overlapping keys
+        """
+        self.__infos = list(infos)
+        regular: list[tuple[int, int, int]] = list()
+        self.__irregular: list[tuple[int, int, int]] = list()
+        for index, info in enumerate(self.__infos):
+            if can_shift(info.mask):
+                regular.append(
+                    (info.key, info.key | (info.mask ^ FULL_MASK), index))
+            else:
+                self.__irregular.append((info.key, info.mask, index))
+        regular.sort()
+
+        self.__lo_keys = numpy.array(
+            [lo for lo, _, _ in regular], dtype=numpy.uint32)
+        self.__hi_keys = numpy.array(
+            [hi for _, hi, _ in regular], dtype=numpy.uint32)
+        self.__interval_info = numpy.array(
+            [index for _, _, index in regular], dtype=numpy.int64)
+
+        overlaps = numpy.flatnonzero(
+            self.__lo_keys[1:] <= self.__hi_keys[:-1])
+        if overlaps.size:
+            self.__overlap(
+                int(self.__interval_info[overlaps[0]]),
+                int(self.__interval_info[overlaps[0] + 1]))
+
+        # The irregular masks are few, so are checked against each interval
+        # and each other directly
+        interval_masks = ~(self.__lo_keys ^ self.__hi_keys)
+        for i, (key, mask, index) in enumerate(self.__irregular):
+            overlaps = numpy.flatnonzero(
+                (self.__lo_keys & numpy.uint32(mask)) ==
+                (numpy.uint32(key) & interval_masks))
+            if overlaps.size:
+                self.__overlap(int(self.__interval_info[overlaps[0]]), index)
+            for o_key, o_mask, o_index in self.__irregular[:i]:
+                if (key & o_mask) == (o_key & mask):
+                    self.__overlap(o_index, index)
+
+    def __overlap(self, first: int, second: int) -> None:
+        raise PacmanRouteInfoAllocationException(
+            f"Keys of {self.__infos[first]} overlap those of "
+            f"{self.__infos[second]}")
+
+    @property
+    def infos(self) -> list[MachineVertexRoutingInfo]:
+        """
+        The routing information indexed, in the order matching the vertex
+        indices returned by :py:meth:`decode`.
+        """
+        return self.__infos
+
+    @property
+    def vertices(self) -> list[MachineVertex]:
+        """
+        The machine vertices indexed, in the order matching the vertex
+        indices returned by :py:meth:`decode`.
+        """
+        return [info.vertex for info in self.__infos]
+
+    def __len__(self) -> int:
+        return len(self.__infos)
+
+    def decode(
+            self, keys: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Decode a batch of keys into vertices and atoms.
+
+        :param keys: The multicast keys received
+        :return: A tuple of two arrays the same length as keys.
+            The first is the index into :py:attr:`infos` of the routing
+            information matching each key, or ``NO_VERTEX`` if no vertex
+            sends that key.
+            The second is the atom id within that vertex of each key, or
+            ``NO_VERTEX`` if no vertex sends that key.
+        """
+        keys = numpy.asarray(keys, dtype=numpy.uint32)
+        vertex_ids = numpy.full(len(keys), NO_VERTEX, dtype=numpy.int64)
+        atoms = numpy.full(len(keys), NO_VERTEX, dtype=numpy.int64)
+
+        if len(self.__lo_keys):
+            # Last interval starting at or before each key
+            pos = numpy.searchsorted(self.__lo_keys, keys, side="right") - 1
+            safe_pos = numpy.maximum(pos, 0)
+            lo_keys = self.__lo_keys[safe_pos]
+            found = (pos >= 0) & (keys <= self.__hi_keys[safe_pos])
+            vertex_ids[found] = self.__interval_info[safe_pos[found]]
+            atoms[found] = keys[found] - lo_keys[found]
+
+        for key, mask, index in self.__irregular:
+            found = (keys & numpy.uint32(mask)) == key
+            vertex_ids[found] = index
+            atoms[found] = self.__extract_bits(
+                keys[found], mask ^ FULL_MASK)
+
+        return vertex_ids, atoms
+
+    def decode_key(
+            self, key: int) -> tuple[MachineVertexRoutingInfo, int] | None:
+        """
+        Decode a single key.
+
+        :param key: The multicast key received
+        :return: The routing information and atom id for the key,
+            or None if no vertex sends that key
+        """
+        vertex_ids, atoms = self.decode(numpy.array([key]))
+        if vertex_ids[0] == NO_VERTEX:
+            return None
+        return self.__infos[vertex_ids[0]], int(atoms[0])
+
+    @staticmethod
+    def __extract_bits(keys: numpy.ndarray, bits: int) -> numpy.ndarray:
+        """
+        Pack the bits of the keys selected by bits into the low bits,
+        in the same order as :py:meth:`BaseKeyAndMask.get_keys` spreads them.
+        """
+        result = numpy.zeros(len(keys), dtype=numpy.int64)
+        out_bit = 0
+        for in_bit in range(BITS_IN_KEY):
+            if bits & (1 << in_bit):
+                result |= ((keys >> in_bit) & 1).astype(numpy.int64) << out_bit
+                out_bit += 1
+        return result
@@ -23,6 +23,9 @@ from pacman.exceptions import (
 )
 from pacman.utilities.constants import FULL_MASK
 
+from .key_to_vertex_index import KeyToVertexIndex
+from .machine_vertex_routing_info import MachineVertexRoutingInfo
+
 if TYPE_CHECKING:
     from pacman.model.graphs import AbstractVertex
 
@@ -43,6 +46,7 @@ class RoutingInfo:
         "_has_global_machine_masks",
         "_info",
         "_is_machine_shiftable",
+        "_key_index",
         "_max_bits_atoms",
         "_max_bits_machine",
         "_min_bits_machine_and_atoms",
@@ -72,6 +76,8 @@ class RoutingInfo:
         self._has_app_keys_overlap = False
         self._has_global_app_masks = True
         self._has_global_machine_masks = True
+        # Reverse index built on demand
+        self._key_index: KeyToVertexIndex | None = None
 
     def add_routing_info(self, info: VertexRoutingInfo) -> None:
         """
@@ -88,6 +94,7 @@ class RoutingInfo:
                 "Routing information", str(info))
 
         self._info[info.vertex][info.partition_id] = info
+        self._key_index = None
         if self._global_app_mask is not None:
             self._check_info(info)
 
@@ -196,6 +203,24 @@ class RoutingInfo:
             return None
         return info.key
 
+    def get_key_index(self) -> KeyToVertexIndex:
+        """
+        Get a reverse index from keys to the machine vertex and atom which
+        send them.
+
+        The index is built on the first call and kept until more routing
+        information is added.
+
+        :returns: The index over all the machine vertex routing information
+        :raise PacmanRouteInfoAllocationException:
+            If the keys of two machine vertices overlap
+        """
+        if self._key_index is None:
+            self._key_index = KeyToVertexIndex(
+                info for info in self
+                if isinstance(info, MachineVertexRoutingInfo))
+        return self._key_index
+
     def __iter__(self) -> Iterator[VertexRoutingInfo]:
         """
         Gets an iterator for the routing information.
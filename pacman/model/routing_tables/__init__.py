@@ -12,12 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from .abstract_multicast_routing_table import AbstractMulticastRoutingTable
+from .columnar_multicast_routing_table import (
+    ColumnarMulticastRoutingTable,
+    to_columnar,
+)
 from .compressed_multicast_routing_table import CompressedMulticastRoutingTable
 from .multicast_routing_tables import MulticastRoutingTables
+from .routing_table_index import RoutingTableIndex
 from .uncompressed_multicast_routing_table import (
     UnCompressedMulticastRoutingTable,
 )
 
 __all__ = [
-    "AbstractMulticastRoutingTable", "CompressedMulticastRoutingTable",
-    "MulticastRoutingTables", "UnCompressedMulticastRoutingTable"]
+    "AbstractMulticastRoutingTable", "ColumnarMulticastRoutingTable",
+    "CompressedMulticastRoutingTable", "MulticastRoutingTables",
+    "RoutingTableIndex", "UnCompressedMulticastRoutingTable", "to_columnar"]
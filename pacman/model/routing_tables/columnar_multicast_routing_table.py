@@ -0,0 +1,250 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+from typing import Any
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_utilities.overrides import overrides
+
+from spinn_machine import MulticastRoutingEntry, RoutingEntry
+
+from pacman.exceptions import PacmanInvalidParameterException
+from pacman.model.routing_tables import AbstractMulticastRoutingTable
+
+# Number of entries space is first made for
+_INITIAL_CAPACITY = 16
+
+
+class ColumnarMulticastRoutingTable(AbstractMulticastRoutingTable):
+    """
+    A routing table for a chip which stores the key, mask, route and
+    defaultable flag of every entry in separate numpy arrays, rather than
+    as one :py:class:`MulticastRoutingEntry` per entry.
+
+    This takes far less memory for big tables, and the arrays can be
+    worked on directly by vectorised code.
+    Like :py:class:`CompressedMulticastRoutingTable` the entries are kept in
+    the order they are added and duplicates are not checked for.
+    The :py:attr:`multicast_routing_entries` are created on request.
+    """
+
+    __slots__ = (
+        # Routing keys; only the first _n_entries are used
+        "_keys",
+        # Routing masks; only the first _n_entries are used
+        "_masks",
+        # Encoded SpiNNaker routes; only the first _n_entries are used
+        "_routes",
+        # Defaultable flags; only the first _n_entries are used
+        "_defaultable",
+        # The number of entries in the table
+        "_n_entries",
+        # The coordinates of the chip for which this is the routing table
+        "_x", "_y",
+    )
+
+    def __init__(
+            self, x: int, y: int,
+            multicast_routing_entries: Iterable[MulticastRoutingEntry] = ()):
+        """
+        :param x:
+            The x-coordinate of the chip for which this is the routing table
+        :param y:
+            The y-coordinate of the chip for which this is the routing tables
+        :param multicast_routing_entries:
+            The routing entries to add to the table
+        """
+        self._x = x
+        self._y = y
+        self._n_entries = 0
+        self._keys = numpy.zeros(_INITIAL_CAPACITY, dtype=numpy.uint32)
+        self._masks = numpy.zeros(_INITIAL_CAPACITY, dtype=numpy.uint32)
+        self._routes = numpy.zeros(_INITIAL_CAPACITY, dtype=numpy.uint32)
+        self._defaultable = numpy.zeros(_INITIAL_CAPACITY, dtype=numpy.bool_)
+
+        entries = list(multicast_routing_entries)
+        if entries:
+            self.add_entries(
+                [entry.key for entry in entries],
+                [entry.mask for entry in entries],
+                [entry.spinnaker_route for entry in entries],
+                [entry.defaultable for entry in entries])
+
+    def __ensure_capacity(self, n_entries: int) -> None:
+        capacity = len(self._keys)
+        if n_entries <= capacity:
+            return
+        while capacity < n_entries:
+            capacity *= 2
+        self._keys = numpy.resize(self._keys, capacity)
+        self._masks = numpy.resize(self._masks, capacity)
+        self._routes = numpy.resize(self._routes, capacity)
+        self._defaultable = numpy.resize(self._defaultable, capacity)
+
+    def add_entries(
+            self, keys: ArrayLike, masks: ArrayLike, routes: ArrayLike,
+            defaultable: ArrayLike | None = None) -> None:
+        """
+        Add many entries at once.
+
+        :param keys: The routing keys of the entries
+        :param masks: The routing masks of the entries
+        :param routes: The encoded SpiNNaker routes of the entries
+        :param defaultable:
+            Whether each entry is defaultable; if None none are
+        :raise PacmanInvalidParameterException:
+            If the arrays are not all the same length, or any key has bits
+            set which are not set in its mask
+        """
+        keys = numpy.asarray(keys, dtype=numpy.uint32)
+        masks = numpy.asarray(masks, dtype=numpy.uint32)
+        routes = numpy.asarray(routes, dtype=numpy.uint32)
+        if defaultable is None:
+            defaultable = numpy.zeros(len(keys), dtype=numpy.bool_)
+        else:
+            defaultable = numpy.asarray(defaultable, dtype=numpy.bool_)
+        if not len(keys) == len(masks) == len(routes) == len(defaultable):
+            raise PacmanInvalidParameterException(
+                "keys, masks, routes, defaultable",
+                f"{len(keys)}, {len(masks)}, {len(routes)}, "
+                f"{len(defaultable)}",
+                "The arrays must all be the same length")
+        bad = numpy.nonzero((keys & masks) != keys)[0]
+        if len(bad):
+            raise PacmanInvalidParameterException(
+                "keys and masks",
+                f"0x{keys[bad[0]]:08X} and 0x{masks[bad[0]]:08X}",
+                "The key is changed when masked with the mask")
+
+        start = self._n_entries
+        end = start + len(keys)
+        self.__ensure_capacity(end)
+        self._keys[start:end] = keys
+        self._masks[start:end] = masks
+        self._routes[start:end] = routes
+        self._defaultable[start:end] = defaultable
+        self._n_entries = end
+
+    @overrides(AbstractMulticastRoutingTable.add_multicast_routing_entry)
+    def add_multicast_routing_entry(
+            self, multicast_routing_entry: MulticastRoutingEntry) -> None:
+        index = self._n_entries
+        self.__ensure_capacity(index + 1)
+        self._keys[index] = multicast_routing_entry.key
+        self._masks[index] = multicast_routing_entry.mask
+        self._routes[index] = multicast_routing_entry.spinnaker_route
+        self._defaultable[index] = multicast_routing_entry.defaultable
+        self._n_entries = index + 1
+
+    @property
+    @overrides(AbstractMulticastRoutingTable.x)
+    def x(self) -> int:
+        return self._x
+
+    @property
+    @overrides(AbstractMulticastRoutingTable.y)
+    def y(self) -> int:
+        return self._y
+
+    def __read_only(self, array: NDArray) -> NDArray:
+        view = array[:self._n_entries]
+        view.setflags(write=False)
+        return view
+
+    @property
+    def keys(self) -> NDArray[numpy.uint32]:
+        """
+        The routing keys of the entries, as a read-only array.
+        """
+        return self.__read_only(self._keys)
+
+    @property
+    def masks(self) -> NDArray[numpy.uint32]:
+        """
+        The routing masks of the entries, as a read-only array.
+        """
+        return self.__read_only(self._masks)
+
+    @property
+    def routes(self) -> NDArray[numpy.uint32]:
+        """
+        The encoded SpiNNaker routes of the entries, as a read-only array.
+        """
+        return self.__read_only(self._routes)
+
+    @property
+    def defaultable(self) -> NDArray[numpy.bool_]:
+        """
+        Whether each entry is defaultable, as a read-only array.
+        """
+        return self.__read_only(self._defaultable)
+
+    @property
+    @overrides(AbstractMulticastRoutingTable.multicast_routing_entries)
+    def multicast_routing_entries(self) -> Collection[MulticastRoutingEntry]:
+        n_entries = self._n_entries
+        return [
+            MulticastRoutingEntry(key, mask, RoutingEntry(
+                spinnaker_route=route, defaultable=defaultable))
+            for key, mask, route, defaultable in zip(
+                self._keys[:n_entries].tolist(),
+                self._masks[:n_entries].tolist(),
+                self._routes[:n_entries].tolist(),
+                self._defaultable[:n_entries].tolist())]
+
+    @property
+    @overrides(AbstractMulticastRoutingTable.number_of_entries)
+    def number_of_entries(self) -> int:
+        return self._n_entries
+
+    @property
+    @overrides(AbstractMulticastRoutingTable.number_of_defaultable_entries)
+    def number_of_defaultable_entries(self) -> int:
+        return int(numpy.count_nonzero(
+            self._defaultable[:self._n_entries]))
+
+    @overrides(AbstractMulticastRoutingTable.__eq__)
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ColumnarMulticastRoutingTable):
+            return False
+        if self._x != other.x or self._y != other.y:
+            return False
+        return (
+            numpy.array_equal(self.keys, other.keys) and
+            numpy.array_equal(self.masks, other.masks) and
+            numpy.array_equal(self.routes, other.routes) and
+            numpy.array_equal(self.defaultable, other.defaultable))
+
+    @overrides(AbstractMulticastRoutingTable.__hash__)
+    def __hash__(self) -> int:
+        return id(self)
+
+
+def to_columnar(
+        table: AbstractMulticastRoutingTable) -> ColumnarMulticastRoutingTable:
+    """
+    Get a routing table as a columnar routing table.
+
+    :param table: The table to convert
+    :returns: The same table if already columnar, or else a columnar copy
+        with the same entries in the same order
+    """
+    if isinstance(table, ColumnarMulticastRoutingTable):
+        return table
+    return ColumnarMulticastRoutingTable(
+        table.x, table.y, table.multicast_routing_entries)
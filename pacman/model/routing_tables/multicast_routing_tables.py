@@ -15,20 +15,49 @@
 import gzip
 import json
 from collections.abc import Collection, Iterable, Iterator
-from typing import cast
+from typing import TextIO, cast
+
+import numpy
 
 from spinn_utilities.typing.coords import XY
-from spinn_utilities.typing.json import JsonObjectArray
+from spinn_utilities.typing.json import JsonObject, JsonObjectArray
 
 from spinn_machine import MulticastRoutingEntry, RoutingEntry
 
-from pacman.exceptions import PacmanAlreadyExistsException
+from pacman.exceptions import (
+    PacmanAlreadyExistsException,
+    PacmanInvalidParameterException,
+)
 
 from .abstract_multicast_routing_table import AbstractMulticastRoutingTable
+from .columnar_multicast_routing_table import (
+    ColumnarMulticastRoutingTable,
+    to_columnar,
+)
 from .uncompressed_multicast_routing_table import (
     UnCompressedMulticastRoutingTable,
 )
 
+#: Identifies a file written by :py:func:`to_binary`
+BINARY_MAGIC = b"PMRT"
+#: The version of the binary format written by :py:func:`to_binary`
+BINARY_VERSION = 1
+
+# How many characters of a json file to read at a time
+_JSON_READ_SIZE = 1 << 16
+
+# The start of a binary file
+_BINARY_HEADER = numpy.dtype([
+    ("magic", "S4"), ("version", "<u4"), ("n_tables", "<u4"),
+    ("n_entries", "<u8")])
+# One per table, after the header; offset is in entries, not bytes
+_BINARY_INDEX = numpy.dtype([
+    ("x", "<u4"), ("y", "<u4"), ("offset", "<u8"), ("n_entries", "<u4")])
+# One per entry, after the index, grouped by table in index order
+_BINARY_ENTRY = numpy.dtype([
+    ("key", "<u4"), ("mask", "<u4"), ("route", "<u4"),
+    ("defaultable", "u1")])
+
 
 class MulticastRoutingTables:
     """
@@ -174,16 +203,202 @@ def from_json(j_router: str | JsonObjectArray) -> MulticastRoutingTables:
             with open(j_router, encoding="utf-8") as j_file:
                 j_router = cast(JsonObjectArray, json.load(j_file))
 
-    tables = MulticastRoutingTables()
-    for j_table in j_router:
-        x = cast(int, j_table["x"])
-        y = cast(int, j_table["y"])
-        table = UnCompressedMulticastRoutingTable(x, y)
-        tables.add_routing_table(table)
-        for j_entry in cast(JsonObjectArray, j_table["entries"]):
-            entry = RoutingEntry(
-                defaultable=cast(bool, j_entry["defaultable"]),
-                spinnaker_route=cast(int, j_entry["spinnaker_route"]))
-            table.add_multicast_routing_entry(MulticastRoutingEntry(
-                cast(int, j_entry["key"]), cast(int, j_entry["mask"]), entry))
-    return tables
+    return MulticastRoutingTables(
+        _table_from_json(j_table) for j_table in j_router)
+
+
+def _table_from_json(j_table: JsonObject) -> UnCompressedMulticastRoutingTable:
+    x = cast(int, j_table["x"])
+    y = cast(int, j_table["y"])
+    table = UnCompressedMulticastRoutingTable(x, y)
+    for j_entry in cast(JsonObjectArray, j_table["entries"]):
+        entry = RoutingEntry(
+            defaultable=cast(bool, j_entry["defaultable"]),
+            spinnaker_route=cast(int, j_entry["spinnaker_route"]))
+        table.add_multicast_routing_entry(MulticastRoutingEntry(
+            cast(int, j_entry["key"]), cast(int, j_entry["mask"]), entry))
+    return table
+
+
+def iter_json_tables(
+        file_name: str) -> Iterator[UnCompressedMulticastRoutingTable]:
+    """
+    Reads Routing Tables from a json file one chip at a time.
+
+    Unlike :py:func:`from_json` the whole file is never held in memory,
+    only the json of the table being read, so this can be used on files
+    describing more tables than fit in memory.
+
+    :param file_name: The path of the file to read; ending .gz if gzipped
+    :returns: The routing table of each chip in the order in the file
+    :raise json.JSONDecodeError: If the file is not a json array of tables
+    """
+    if file_name.endswith(".gz"):
+        with gzip.open(file_name, mode="rt", encoding="utf-8") as j_file:
+            yield from _iter_json_tables(j_file)
+    else:
+        with open(file_name, encoding="utf-8") as j_file:
+            yield from _iter_json_tables(j_file)
+
+
+def _iter_json_tables(
+        j_file: TextIO) -> Iterator[UnCompressedMulticastRoutingTable]:
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    at_end = False
+    in_array = False
+    read_size = _JSON_READ_SIZE
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        if pos == len(buffer):
+            if at_end:
+                raise json.JSONDecodeError(
+                    "Expecting ']'" if in_array else "Expecting '['",
+                    buffer, pos)
+            buffer = j_file.read(_JSON_READ_SIZE)
+            pos = 0
+            at_end = not buffer
+            continue
+
+        if not in_array:
+            if buffer[pos] != "[":
+                raise json.JSONDecodeError("Expecting '['", buffer, pos)
+            in_array = True
+            pos += 1
+        elif buffer[pos] == "]":
+            return
+        elif buffer[pos] == ",":
+            pos += 1
+        else:
+            try:
+                j_table, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Assume the table is not all read yet; read more, reading
+                # twice as much each time so big tables are not re-parsed
+                # too often
+                more = "" if at_end else j_file.read(read_size)
+                if not more:
+                    raise
+                buffer = buffer[pos:] + more
+                pos = 0
+                read_size *= 2
+                continue
+            if not isinstance(j_table, dict):
+                raise json.JSONDecodeError(
+                    "Expecting a routing table object", buffer, pos)
+            yield _table_from_json(j_table)
+            buffer = buffer[pos:]
+            pos = 0
+            read_size = _JSON_READ_SIZE
+
+
+def to_binary(router_table: MulticastRoutingTables, file_name: str) -> None:
+    """
+    Writes RoutingTables to a binary file, in one pass over the tables.
+
+    The file holds a header, an index with the chip, position and size of
+    each table, and then the packed entries of all the tables.
+    Use :py:func:`from_binary` or :py:func:`read_binary_table` to read it.
+
+    :param router_table: The tables to write
+    :param file_name: The path of the file to write
+    """
+    tables = list(router_table)
+    header = numpy.zeros(1, dtype=_BINARY_HEADER)
+    index = numpy.zeros(len(tables), dtype=_BINARY_INDEX)
+    offset = 0
+    for i, table in enumerate(tables):
+        index[i] = (table.x, table.y, offset, table.number_of_entries)
+        offset += table.number_of_entries
+    header[0] = (BINARY_MAGIC, BINARY_VERSION, len(tables), offset)
+
+    with open(file_name, "wb") as f:
+        f.write(header.tobytes())
+        f.write(index.tobytes())
+        for table in tables:
+            columnar = to_columnar(table)
+            entries = numpy.zeros(
+                columnar.number_of_entries, dtype=_BINARY_ENTRY)
+            entries["key"] = columnar.keys
+            entries["mask"] = columnar.masks
+            entries["route"] = columnar.routes
+            entries["defaultable"] = columnar.defaultable
+            f.write(entries.tobytes())
+
+
+def _open_binary(file_name: str) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Map the index and entries of a file written by :py:func:`to_binary`.
+    """
+    header = numpy.fromfile(file_name, dtype=_BINARY_HEADER, count=1)
+    if (len(header) != 1 or header["magic"][0] != BINARY_MAGIC or
+            header["version"][0] != BINARY_VERSION):
+        raise PacmanInvalidParameterException(
+            "file_name", file_name,
+            f"Not a version {BINARY_VERSION} binary routing table file")
+    n_tables = int(header["n_tables"][0])
+    n_entries = int(header["n_entries"][0])
+    if n_tables == 0:
+        index = numpy.zeros(0, dtype=_BINARY_INDEX)
+    else:
+        index = numpy.memmap(
+            file_name, dtype=_BINARY_INDEX, mode="r",
+            offset=_BINARY_HEADER.itemsize, shape=(n_tables,))
+    if n_entries == 0:
+        entries = numpy.zeros(0, dtype=_BINARY_ENTRY)
+    else:
+        entries = numpy.memmap(
+            file_name, dtype=_BINARY_ENTRY, mode="r",
+            offset=_BINARY_HEADER.itemsize + index.nbytes,
+            shape=(n_entries,))
+    return index, entries
+
+
+def _table_from_binary(
+        index_entry: numpy.void,
+        entries: numpy.ndarray) -> ColumnarMulticastRoutingTable:
+    start = int(index_entry["offset"])
+    table_entries = entries[start:start + int(index_entry["n_entries"])]
+    table = ColumnarMulticastRoutingTable(
+        int(index_entry["x"]), int(index_entry["y"]))
+    table.add_entries(
+        table_entries["key"], table_entries["mask"], table_entries["route"],
+        table_entries["defaultable"])
+    return table
+
+
+def from_binary(file_name: str) -> MulticastRoutingTables:
+    """
+    Reads all the RoutingTables in a file written by :py:func:`to_binary`.
+
+    :param file_name: The path of the file to read
+    :returns: The routing tables, as columnar tables
+    :raise PacmanInvalidParameterException:
+        If the file is not a binary routing table file
+    """
+    index, entries = _open_binary(file_name)
+    return MulticastRoutingTables(
+        _table_from_binary(index_entry, entries) for index_entry in index)
+
+
+def read_binary_table(file_name: str, x: int, y: int
+                      ) -> ColumnarMulticastRoutingTable | None:
+    """
+    Reads the routing table of one chip from a file written by
+    :py:func:`to_binary`, without reading the tables of the other chips.
+
+    :param file_name: The path of the file to read
+    :param x: The X-coordinate of the chip
+    :param y: The Y-coordinate of the chip
+    :returns: The routing table of the chip, or None if the file has no
+        table for the chip
+    :raise PacmanInvalidParameterException:
+        If the file is not a binary routing table file
+    """
+    index, entries = _open_binary(file_name)
+    found = numpy.nonzero((index["x"] == x) & (index["y"] == y))[0]
+    if len(found) == 0:
+        return None
+    return _table_from_binary(index[found[0]], entries)
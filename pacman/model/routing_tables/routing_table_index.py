@@ -0,0 +1,164 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections.abc import Sequence
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+from spinn_machine import MulticastRoutingEntry
+
+from .abstract_multicast_routing_table import AbstractMulticastRoutingTable
+from .columnar_multicast_routing_table import to_columnar
+
+#: The index given by :py:meth:`RoutingTableIndex.lookup_keys` for a key
+#: which matches no entry
+NO_MATCH = -1
+
+# Most key-entry pairs compared at once by lookup_keys
+_MAX_COMPARISONS = 1 << 20
+
+
+class RoutingTableIndex(object):
+    """
+    Finds the entries of a routing table that a key matches, as the
+    router's ternary content addressable memory would.
+
+    A key matches an entry if the key masked with the entry's mask is the
+    entry's key; the router uses the first matching entry in table order.
+    The keys and masks are held as numpy arrays, so a key is compared with
+    every entry at once, and many keys can be looked up together.
+
+    The index is of the table as it was when the index was made.
+    """
+
+    __slots__ = (
+        # The routing table indexed
+        "_table",
+        # The routing keys of the entries
+        "_keys",
+        # The routing masks of the entries
+        "_masks",
+        # The encoded SpiNNaker routes of the entries
+        "_routes",
+        # The entries of the table, made when first needed
+        "_entries")
+
+    def __init__(self, table: AbstractMulticastRoutingTable):
+        """
+        :param table: The routing table to index
+        """
+        self._table = table
+        columnar = to_columnar(table)
+        self._keys = columnar.keys.copy()
+        self._masks = columnar.masks.copy()
+        self._routes = columnar.routes.copy()
+        for array in (self._keys, self._masks, self._routes):
+            array.setflags(write=False)
+        self._entries: list[MulticastRoutingEntry] | None = None
+
+    @property
+    def table(self) -> AbstractMulticastRoutingTable:
+        """
+        The routing table indexed.
+        """
+        return self._table
+
+    @property
+    def keys(self) -> NDArray[numpy.uint32]:
+        """
+        The routing keys of the entries in table order, as a read-only array.
+        """
+        return self._keys
+
+    @property
+    def masks(self) -> NDArray[numpy.uint32]:
+        """
+        The routing masks of the entries in table order, as a read-only
+        array.
+        """
+        return self._masks
+
+    @property
+    def routes(self) -> NDArray[numpy.uint32]:
+        """
+        The encoded SpiNNaker routes of the entries in table order, as a
+        read-only array.
+        """
+        return self._routes
+
+    @property
+    def entries(self) -> Sequence[MulticastRoutingEntry]:
+        """
+        The entries of the table in table order, so that the indices found
+        can be turned into entries.
+        """
+        if self._entries is None:
+            self._entries = list(self._table.multicast_routing_entries)
+        return self._entries
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def matches(self, key: int) -> NDArray[numpy.intp]:
+        """
+        Find all the entries that a key matches.
+
+        :param key: The key to look up
+        :return: The indices of the matching entries in table order
+        """
+        return numpy.flatnonzero((self._masks & key) == self._keys)
+
+    def lookup(self, key: int) -> int | None:
+        """
+        Find the entry the router would use for a key.
+
+        :param key: The key to look up
+        :return: The index of the first matching entry, or None if no entry
+            matches
+        """
+        hits = (self._masks & key) == self._keys
+        first = int(hits.argmax()) if hits.size else 0
+        if hits.size == 0 or not hits[first]:
+            return None
+        return first
+
+    def lookup_entry(self, key: int) -> MulticastRoutingEntry | None:
+        """
+        Find the entry the router would use for a key.
+
+        :param key: The key to look up
+        :return: The first matching entry, or None if no entry matches
+        """
+        index = self.lookup(key)
+        return None if index is None else self.entries[index]
+
+    def lookup_keys(self, keys: ArrayLike) -> NDArray[numpy.intp]:
+        """
+        Find the entries the router would use for many keys at once.
+
+        :param keys: The keys to look up, as a one dimensional array
+        :return: The index of the first matching entry for each key, or
+            :py:data:`NO_MATCH` where no entry matches
+        """
+        keys = numpy.asarray(keys, dtype=numpy.uint32)
+        result = numpy.full(len(keys), NO_MATCH, dtype=numpy.intp)
+        if self._keys.size == 0:
+            return result
+        chunk_size = max(1, _MAX_COMPARISONS // len(self._keys))
+        for start in range(0, len(keys), chunk_size):
+            end = start + chunk_size
+            hits = (keys[start:end, numpy.newaxis] & self._masks) == self._keys
+            result[start:end] = numpy.where(
+                hits.any(axis=1), hits.argmax(axis=1), NO_MATCH)
+        return result
@@ -14,6 +14,7 @@
 
 
 from spinn_utilities.progress_bar import ProgressBar
+from spinn_utilities.typing.coords import XY
 
 from spinn_machine import Chip, RoutingEntry
 
@@ -40,15 +41,30 @@ def fixed_route_router(
     return router.build_fixed_routes()
 
 
+# The links to try, starting with the most direct to 0,0
+_LINK_ORDER = (4, 3, 5, 2, 0, 1)
+
+# The chips of a board and the links between them, relative to the
+# Ethernet chip of the board; for each chip the links to other chips of the
+# board in the order they are tried, with the chip each goes to
+_BoardShape = frozenset[tuple[XY, tuple[tuple[int, XY], ...]]]
+
+
 class _FixedRouteRouter:
     """
     Computes the fixed routes used to direct data out traffic to the
     board-local gatherer processors.
+
+    Boards with the same chips and links relative to their Ethernet chip
+    get the same routes, so the routes of each shape of board are only
+    worked out once.
     """
 
     __slots__ = (
         "_destination_class", "_fixed_route_tables",
-        "_machine")
+        "_machine",
+        # The relative routes of each shape of board already routed
+        "_templates")
 
     def __init__(self, destination_class: type):
         """
@@ -59,6 +75,7 @@ class _FixedRouteRouter:
         self._destination_class = destination_class
         self._fixed_route_tables: dict[tuple[int, int], RoutingEntry] = \
             {}
+        self._templates: dict[_BoardShape, dict[XY, RoutingEntry]] = {}
 
     def build_fixed_routes(self) -> dict[tuple[int, int], RoutingEntry]:
         """
@@ -89,52 +106,81 @@ class _FixedRouteRouter:
         """
         eth_x = ethernet_chip.x
         eth_y = ethernet_chip.y
+        width = self._machine.width
+        height = self._machine.height
+
+        board = set(self._machine.get_existing_xys_by_ethernet(eth_x, eth_y))
+        links: dict[XY, tuple[tuple[int, XY], ...]] = {}
+        for x, y in board:
+            relative: list[tuple[int, XY]] = []
+            for link_id in _LINK_ORDER:
+                destination = self._machine.xy_over_link(x, y, link_id)
+                if (destination in board and
+                        self._machine.is_link_at(x, y, link_id)):
+                    dest_x, dest_y = destination
+                    relative.append((link_id, (
+                        (dest_x - eth_x) % width, (dest_y - eth_y) % height)))
+            links[(x - eth_x) % width, (y - eth_y) % height] = tuple(relative)
+
+        shape = frozenset(links.items())
+        if shape not in self._templates:
+            self._templates[shape] = self.__route_shape(links, ethernet_chip)
+        for (x, y), entry in self._templates[shape].items():
+            self.__add_fixed_route_entry(
+                ((x + eth_x) % width, (y + eth_y) % height), entry)
+
+        # create final fixed route entry
+        # locate where to put data on Ethernet chip
+        processor_id = self.__locate_destination(ethernet_chip)
+        # build entry and add to tables
+        self.__add_fixed_route_entry((eth_x, eth_y), RoutingEntry(
+            link_ids=[], processor_ids=[processor_id]))
 
-        to_route = set(
-            self._machine.get_existing_xys_by_ethernet(eth_x, eth_y))
-        routed = {(eth_x, eth_y)}
-        to_route.remove((eth_x, eth_y))
+    @staticmethod
+    def __route_shape(links: dict[XY, tuple[tuple[int, XY], ...]],
+                      ethernet_chip: Chip) -> dict[XY, RoutingEntry]:
+        """
+        Work out the routes towards the Ethernet chip of a shape of board.
+
+        :param links: The links of each chip of the board to other chips of
+            the board, relative to the Ethernet chip
+        :param ethernet_chip: The Ethernet chip of the board being routed
+        :return: The route of each chip other than the Ethernet chip,
+            relative to the Ethernet chip
+        :raises PacmanRoutingException:
+        """
+        entries: dict[XY, RoutingEntry] = {}
+        to_route = set(links)
+        routed = {(0, 0)}
+        to_route.remove((0, 0))
 
         while len(to_route) > 0:
             found = set()
-            for x, y in to_route:
-                # Check links starting with the most direct to 0,0
-                for link_id in [4, 3, 5, 2, 0, 1]:
-                    # Get potential destination
-                    destination = self._machine.xy_over_link(x, y, link_id)
-                    # If it is useful
+            for xy in to_route:
+                # Use the first useful link, in the order they are tried
+                for link_id, destination in links[xy]:
                     if destination in routed:
-                        # check it actually exits
-                        if self._machine.is_link_at(x, y, link_id):
-                            # build entry and add to table and add to tables
-                            key = (x, y)
-                            self.__add_fixed_route_entry(key, [link_id], [])
-                            found.add(key)
-                            break
+                        entries[xy] = RoutingEntry(
+                            link_ids=[link_id], processor_ids=[])
+                        found.add(xy)
+                        break
             if len(found) == 0:
                 raise PacmanRoutingException(
                     "Unable to do fixed point routing "
                     f"on {ethernet_chip.ip_address}.")
             to_route -= found
             routed |= found
+        return entries
 
-        # create final fixed route entry
-        # locate where to put data on Ethernet chip
-        processor_id = self.__locate_destination(ethernet_chip)
-        # build entry and add to tables
-        self.__add_fixed_route_entry((eth_x, eth_y), [], [processor_id])
-
-    def __add_fixed_route_entry(self, key: tuple[int, int],
-                                link_ids: list[int],
-                                processor_ids: list[int]) -> None:
+    def __add_fixed_route_entry(
+            self, key: tuple[int, int], entry: RoutingEntry) -> None:
         """
         :raises PacmanAlreadyExistsException:
         """
         if key in self._fixed_route_tables:
             raise PacmanAlreadyExistsException(
                 "fixed route entry", str(key))
-        self._fixed_route_tables[key] = RoutingEntry(
-            link_ids=link_ids, processor_ids=processor_ids)
+        self._fixed_route_tables[key] = entry
 
     def __locate_destination(self, chip: Chip) -> int:
         """
@@ -19,6 +19,9 @@ from collections import defaultdict
 from collections.abc import Iterable
 from typing import NamedTuple
 
+import numpy
+from numpy.typing import NDArray
+
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.ordered_set import OrderedSet
 from spinn_utilities.progress_bar import ProgressBar
@@ -31,13 +34,21 @@ from pacman.exceptions import (
     PacmanRoutingException,
 )
 from pacman.model.graphs import AbstractVirtual
-from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.application import (
+    ApplicationEdgePartition,
+    ApplicationVertex,
+)
 from pacman.model.graphs.machine import MachineVertex
 from pacman.model.placements import Placement
 from pacman.model.routing_info import BaseKeyAndMask
 from pacman.model.routing_tables import (
     AbstractMulticastRoutingTable,
     MulticastRoutingTables,
+    RoutingTableIndex,
+)
+from pacman.utilities.algorithm_utilities.parallel_utilities import (
+    get_n_mapping_processes,
+    map_in_processes,
 )
 from pacman.utilities.algorithm_utilities.routing_algorithm_utilities import (
     get_app_partitions,
@@ -67,83 +78,196 @@ class _Failure(NamedTuple):
     source_mask: int
 
 
-def validate_routes(routing_tables: MulticastRoutingTables) -> None:
+class _IndexedTable(RoutingTableIndex):
+    """
+    A routing table index which also knows the range of keys of each entry
+    whose mask is in range_masks.
+    """
+    __slots__ = (
+        # The keys of the entries, wide enough to add to
+        "first_keys",
+        # The last key matched by each entry if all keys between the key
+        # and the last key are matched
+        "last_keys",
+        # Whether each mask is in range_masks
+        "is_range")
+
+    def __init__(self, table: AbstractMulticastRoutingTable):
+        """
+        :param table: The routing table to index
+        """
+        super().__init__(table)
+        # int64 so that key ranges can go past the last 32-bit key
+        self.first_keys = self.keys.astype(numpy.int64)
+        inverse = (~self.masks).astype(numpy.int64)
+        self.last_keys: NDArray[numpy.int64] = self.first_keys + inverse
+        # A range mask is some ones followed by at least one zero
+        self.is_range: NDArray[numpy.bool_] = (
+            (inverse != 0) & ((inverse & (inverse + 1)) == 0))
+
+
+class _TableIndexes(object):
+    """
+    The indexed routing tables of the chips, made when first needed.
+    """
+    __slots__ = (
+        # The routing tables to index
+        "_routing_tables",
+        # The indexed tables by chip coordinates; None if no table
+        "_indexes")
+
+    def __init__(self, routing_tables: MulticastRoutingTables):
+        """
+        :param routing_tables: The routing tables to index
+        """
+        self._routing_tables = routing_tables
+        self._indexes: dict[tuple[int, int], _IndexedTable | None] = dict()
+
+    def get(self, x: int, y: int) -> _IndexedTable | None:
+        """
+        Get the indexed routing table of a chip.
+
+        :param x: The x-coordinate of the chip
+        :param y: The y-coordinate of the chip
+        :returns: The indexed table, or None if the chip has no table
+        """
+        if (x, y) not in self._indexes:
+            table = self._routing_tables.get_routing_table_for_chip(x, y)
+            self._indexes[x, y] = (
+                None if table is None else _IndexedTable(table))
+        return self._indexes[x, y]
+
+
+class _Checking(object):
+    """
+    What :py:func:`validate_routes` is checking, kept here so that worker
+    processes forked to check some of the partitions can see it.
+    """
+    #: The partitions being checked
+    partitions: list[ApplicationEdgePartition] = []
+    #: The indexed routing tables being checked against
+    indexes: _TableIndexes | None = None
+
+
+def validate_routes(
+        routing_tables: MulticastRoutingTables,
+        n_processes: int | None = None) -> None:
     """
     Go through the app partitions and check that the routing entries
     within the routing tables support reach the correction destinations
     as well as not producing any cycles.
 
+    All the partitions are checked before any failures are reported, so
+    that all the failures are reported together.
+
     :param routing_tables:
         the routing tables generated by the routing algorithm
+    :param n_processes:
+        the number of worker processes to check the partitions in; if None
+        ``n_mapping_processes`` in the ``Mapping`` section of the
+        configuration is used
     :raises PacmanRoutingException: when either no routing table entry is
-        found by the search on a given router, or a cycle is detected
+        found by the search on a given router, or a cycle is detected, or
+        the routes do not reach the correct destinations
     """
     # Find all partitions that need to be dealt with
     partitions = get_app_partitions()
+    if n_processes is None:
+        n_processes = get_n_mapping_processes()
+    # Set before the workers are forked so that they can see them
+    _Checking.partitions = partitions
+    _Checking.indexes = _TableIndexes(routing_tables)
+    errors: list[str] = []
+    try:
+        # Now go through the app edges and route app vertex by app vertex
+        progress = ProgressBar(len(partitions), "Checking Routes")
+        for partition_errors in progress.over(map_in_processes(
+                _check_partition, range(len(partitions)), n_processes)):
+            errors.extend(partition_errors)
+    finally:
+        _Checking.partitions = []
+        _Checking.indexes = None
+    if errors:
+        raise PacmanRoutingException(
+            "\n".join(error.rstrip("\n") for error in errors))
+
+
+def _check_partition(index: int) -> list[str]:
+    """
+    Check the routes of one partition; at module level so worker processes
+    can find it.
+
+    :param index: the index of the partition in the partitions to check
+    :return: the description of each route which failed
+    """
+    partition = _Checking.partitions[index]
+    indexes = _Checking.indexes
+    assert indexes is not None
     routing_infos = PacmanDataView.get_routing_infos()
-    # Now go through the app edges and route app vertex by app vertex
-    progress = ProgressBar(len(partitions), "Checking Routes")
-    for partition in progress.over(partitions):
-        source = partition.pre_vertex
-
-        # Destination cores by source machine vertices
-        destinations: dict[MachineVertex, OrderedSet[PlacementTuple]] = \
-            defaultdict(OrderedSet)
-
-        for edge in partition.edges:
-            target = edge.post_vertex
-            target_vertices = \
-                target.splitter.get_source_specific_in_coming_vertices(
-                    source, partition.identifier)
-
-            for tgt, srcs in target_vertices:
-                if isinstance(tgt, AbstractVirtual):
-                    continue
-                if isinstance(srcs, AbstractVirtual):
-                    continue
-                place = PacmanDataView.get_placement_of_vertex(tgt)
-                for src in srcs:
-                    if isinstance(src, ApplicationVertex):
-                        for s in src.splitter.get_out_going_vertices(
-                                partition.identifier):
-                            destinations[s].add(PlacementTuple(
-                                x=place.x, y=place.y, p=place.p))
-                    else:
-                        destinations[src].add(PlacementTuple(
-                            x=place.x, y=place.y, p=place.p))
+    errors: list[str] = []
+    source = partition.pre_vertex
 
-        outgoing: OrderedSet[MachineVertex] = OrderedSet(
-            source.splitter.get_out_going_vertices(partition.identifier))
-        internal = source.splitter.get_internal_multicast_partitions()
-        for in_part in internal:
-            if in_part.identifier == partition.identifier:
-                outgoing.add(in_part.pre_vertex)
-                for edge in in_part.edges:
-                    place = PacmanDataView.get_placement_of_vertex(
-                        edge.post_vertex)
-                    destinations[in_part.pre_vertex].add(PlacementTuple(
-                        x=place.x, y=place.y, p=place.p))
+    # Destination cores by source machine vertices
+    destinations: dict[MachineVertex, OrderedSet[PlacementTuple]] = \
+        defaultdict(OrderedSet)
+
+    for edge in partition.edges:
+        target = edge.post_vertex
+        target_vertices = \
+            target.splitter.get_source_specific_in_coming_vertices(
+                source, partition.identifier)
 
-        # locate all placements to which this placement/vertex will
-        # communicate with for a given key_and_mask and search its
-        # determined destinations
-        for m_vertex in outgoing:
-            if isinstance(m_vertex, AbstractVirtual):
+        for tgt, srcs in target_vertices:
+            if isinstance(tgt, AbstractVirtual):
+                continue
+            if isinstance(srcs, AbstractVirtual):
                 continue
-            placement = PacmanDataView.get_placement_of_vertex(m_vertex)
-            r_info = routing_infos.get_info_from(
-                m_vertex, partition.identifier)
+            place = PacmanDataView.get_placement_of_vertex(tgt)
+            for src in srcs:
+                if isinstance(src, ApplicationVertex):
+                    for s in src.splitter.get_out_going_vertices(
+                            partition.identifier):
+                        destinations[s].add(PlacementTuple(
+                            x=place.x, y=place.y, p=place.p))
+                else:
+                    destinations[src].add(PlacementTuple(
+                        x=place.x, y=place.y, p=place.p))
 
-            # search for these destinations
-            _search_route(
-                placement, destinations[m_vertex], r_info.key_and_mask,
-                routing_tables, m_vertex.vertex_slice.n_atoms)
+    outgoing: OrderedSet[MachineVertex] = OrderedSet(
+        source.splitter.get_out_going_vertices(partition.identifier))
+    internal = source.splitter.get_internal_multicast_partitions()
+    for in_part in internal:
+        if in_part.identifier == partition.identifier:
+            outgoing.add(in_part.pre_vertex)
+            for edge in in_part.edges:
+                place = PacmanDataView.get_placement_of_vertex(
+                    edge.post_vertex)
+                destinations[in_part.pre_vertex].add(PlacementTuple(
+                    x=place.x, y=place.y, p=place.p))
+
+    # locate all placements to which this placement/vertex will
+    # communicate with for a given key_and_mask and search its
+    # determined destinations
+    for m_vertex in outgoing:
+        if isinstance(m_vertex, AbstractVirtual):
+            continue
+        placement = PacmanDataView.get_placement_of_vertex(m_vertex)
+        r_info = routing_infos.get_info_from(
+            m_vertex, partition.identifier)
+
+        # search for these destinations
+        error_message = _search_route(
+            placement, destinations[m_vertex], r_info.key_and_mask,
+            indexes, m_vertex.vertex_slice.n_atoms)
+        if error_message:
+            errors.append(error_message)
+    return errors
 
 
 def _search_route(
         source_placement: Placement, dest_placements: Iterable[PlacementTuple],
-        key_and_mask: BaseKeyAndMask, routing_tables: MulticastRoutingTables,
-        n_atoms: int) -> None:
+        key_and_mask: BaseKeyAndMask, indexes: _TableIndexes,
+        n_atoms: int) -> str:
     """
     Locate if the routing tables work for the source to desks as defined.
 
@@ -153,10 +277,9 @@ def _search_route(
         the placements to which this trace should visit only once
     :param key_and_mask:
         the key and mask associated with this set of edges
-    :param routing_tables:
+    :param indexes: the indexed routing tables
     :param n_atoms: the number of atoms going through this path
-    :raise PacmanRoutingException:
-        when the trace completes and there are still destinations not visited
+    :return: why the routes failed, or an empty string if they did not
     """
     if logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"{source_placement=}")
@@ -167,9 +290,15 @@ def _search_route(
 
     failed_to_cover_all_keys_routers: list[_Failure] = []
 
-    _start_trace_via_routing_tables(
-        source_placement, key_and_mask, located_destinations, routing_tables,
-        n_atoms, failed_to_cover_all_keys_routers)
+    try:
+        _start_trace_via_routing_tables(
+            source_placement, key_and_mask, located_destinations, indexes,
+            n_atoms, failed_to_cover_all_keys_routers)
+    except (PacmanRoutingException, PacmanConfigurationException) as ex:
+        return (
+            f"Trace from vertex {source_placement.vertex.label} on processor "
+            f"[{source_placement.x}:{source_placement.y}:{source_placement.p}]"
+            f" with keys {key_and_mask} failed: {ex}")
 
     # start removing from located_destinations and check if destinations not
     #  reached
@@ -216,17 +345,17 @@ def _search_route(
             f" on processor [{source_placement.x}:{source_placement.y}:"
             f"{source_placement.p}] and the failed routers are {failures}")
 
-    # raise error if required
-    if error_message != "":
-        raise PacmanRoutingException(error_message)
-    logger.debug(f"successful test between {source_placement.vertex.label} "
-                 f"and {dest_placements}")
+    if error_message == "":
+        logger.debug(
+            f"successful test between {source_placement.vertex.label} "
+            f"and {dest_placements}")
+    return error_message
 
 
 def _start_trace_via_routing_tables(
         source_placement: Placement, key_and_mask: BaseKeyAndMask,
         reached_placements: set[PlacementTuple],
-        routing_tables: MulticastRoutingTables, n_atoms: int,
+        indexes: _TableIndexes, n_atoms: int,
         failed_to_cover_all_keys_routers: list[_Failure]) -> None:
     """
     Start the trace, by using the source placement's router and tracing
@@ -237,26 +366,24 @@ def _start_trace_via_routing_tables(
         the key being used by the vertex which resides on the source placement
     :param reached_placements:
         the placements reached during the trace
-    :param routing_tables:
+    :param indexes: the indexed routing tables
     :param n_atoms: the number of atoms going through this path
     :param failed_to_cover_all_keys_routers:
         list of failed routers for all keys
     """
-    current_router_table = routing_tables.get_routing_table_for_chip(
-        source_placement.x, source_placement.y)
-    if current_router_table is None:
+    current_router = indexes.get(source_placement.x, source_placement.y)
+    if current_router is None:
         return
     visited_routers: set[Chip] = set()
-    visited_routers.add(current_router_table.chip)
+    visited_routers.add(current_router.table.chip)
 
     # get src router
-    entry = _locate_routing_entry(
-        current_router_table, key_and_mask.key, n_atoms)
+    entry = _locate_routing_entry(current_router, key_and_mask.key, n_atoms)
 
-    _recursive_trace_to_destinations(
-        entry, current_router_table, source_placement.x,
+    _trace_to_destinations(
+        entry, current_router.table, source_placement.x,
         source_placement.y, key_and_mask, visited_routers,
-        reached_placements, routing_tables, n_atoms,
+        reached_placements, indexes, n_atoms,
         failed_to_cover_all_keys_routers)
 
 
@@ -269,33 +396,38 @@ def _check_all_keys_hit_entry(
     :param base_key: the base key of the partition
     :return: the list of keys which this entry doesn't cover which it should
     """
-    bad_entries = []
-    for atom_id in range(n_atoms):
-        key = base_key + atom_id
-        if entry.mask & key != entry.key:
-            bad_entries.append(key)
-    return bad_entries
-
-
-# locates the next dest position to check
-def _recursive_trace_to_destinations(
+    mask = entry.mask
+    inverse = ~mask & FULL_MASK
+    if (inverse & (inverse + 1)) == 0:
+        # The mask matches a single range of keys, so only the ends count
+        last_key = entry.key + inverse
+        if entry.key <= base_key and base_key + n_atoms - 1 <= last_key:
+            return []
+    keys = numpy.arange(base_key, base_key + n_atoms, dtype=numpy.int64)
+    return keys[(keys & mask) != entry.key].tolist()
+
+
+def _trace_to_destinations(
         entry: MulticastRoutingEntry,
         current_router: AbstractMulticastRoutingTable,
         chip_x: int, chip_y: int, key_and_mask: BaseKeyAndMask,
         visited_routers: set[Chip], reached_placements: set[PlacementTuple],
-        routing_tables: MulticastRoutingTables, n_atoms: int,
+        indexes: _TableIndexes, n_atoms: int,
         failed_to_cover_all_keys_routers: list[_Failure]) -> None:
     """
-    Recursively search though routing tables until no more entries are
-    registered with this key.
+    Search though routing tables until no more entries are registered with
+    this key.
+
+    The links are followed depth first, but with a list of links still to
+    follow rather than by recursion, so long routes can be followed.
 
     :param entry:
         the original entry used by the first router which resides on the
         source placement chip.
     :param current_router:
-        the router currently being visited during the trace
-    :param chip_x: the x coordinate of the chip being considered
-    :param chip_y: the y coordinate of the chip being considered
+        the router of the source placement chip
+    :param chip_x: the x coordinate of the source placement chip
+    :param chip_y: the y coordinate of the source placement chip
     :param key_and_mask:
         the key and mask being used by the vertex which resides on the source
         placement
@@ -303,55 +435,67 @@ def _recursive_trace_to_destinations(
         the list of routers which have been visited during this trace so far
     :param reached_placements:
         the placements reached during the trace
-    :param routing_tables:
+    :param indexes: the indexed routing tables
     :param n_atoms: the number of atoms going through this path
     :param failed_to_cover_all_keys_routers:
         list of failed routers for all keys
     """
-    # determine where the route takes us
-    chip_links = entry.link_ids
-    processor_values = entry.processor_ids
-
-    # if goes down a chip link
-    if chip_links:
-        # also goes to a processor
-        if processor_values:
-            _is_dest(processor_values, current_router, reached_placements)
-        # only goes to new chip
-        for link_id in chip_links:
-            # locate next chips router
-            machine_router = PacmanDataView.get_chip_at(chip_x, chip_y).router
-            link = machine_router.get_link(link_id)
-            if link is None:
-                continue
-            next_router = routing_tables.get_routing_table_for_chip(
-                link.destination_x, link.destination_y)
-            if next_router is None:
-                continue
-
-            # check that we've not visited this router before
-            _check_visited_routers(next_router.chip, visited_routers)
-
-            # locate next entry
-            entry = _locate_routing_entry(
-                next_router, key_and_mask.key, n_atoms)
-
-            bad_entries = _check_all_keys_hit_entry(
-                entry, n_atoms, key_and_mask.key)
-            if bad_entries:
-                failed_to_cover_all_keys_routers.append(
-                    _Failure(next_router.x, next_router.y,
-                             bad_entries, key_and_mask.mask))
-
-            # get next route value from the new router
-            _recursive_trace_to_destinations(
-                entry, next_router, link.destination_x, link.destination_y,
-                key_and_mask, visited_routers, reached_placements,
-                routing_tables, n_atoms, failed_to_cover_all_keys_routers)
+    # The links still to follow, as the chip coordinates and link ID, with
+    # the next to follow last
+    to_follow: list[tuple[int, int, int]] = []
+    _follow_entry(entry, current_router, chip_x, chip_y, reached_placements,
+                  to_follow)
+    while to_follow:
+        chip_x, chip_y, link_id = to_follow.pop()
+        # locate next chips router
+        machine_router = PacmanDataView.get_chip_at(chip_x, chip_y).router
+        link = machine_router.get_link(link_id)
+        if link is None:
+            continue
+        next_router = indexes.get(link.destination_x, link.destination_y)
+        if next_router is None:
+            continue
+
+        # check that we've not visited this router before
+        _check_visited_routers(next_router.table.chip, visited_routers)
+
+        # locate next entry
+        entry = _locate_routing_entry(next_router, key_and_mask.key, n_atoms)
+
+        bad_entries = _check_all_keys_hit_entry(
+            entry, n_atoms, key_and_mask.key)
+        if bad_entries:
+            failed_to_cover_all_keys_routers.append(
+                _Failure(next_router.table.x, next_router.table.y,
+                         bad_entries, key_and_mask.mask))
+
+        _follow_entry(entry, next_router.table, link.destination_x,
+                      link.destination_y, reached_placements, to_follow)
+
+
+def _follow_entry(
+        entry: MulticastRoutingEntry,
+        current_router: AbstractMulticastRoutingTable,
+        chip_x: int, chip_y: int, reached_placements: set[PlacementTuple],
+        to_follow: list[tuple[int, int, int]]) -> None:
+    """
+    Collect the processors an entry goes to and add the links it goes down
+    to those to follow.
 
-    # only goes to a processor
-    elif processor_values:
-        _is_dest(processor_values, current_router, reached_placements)
+    :param entry: the entry used by the router
+    :param current_router: the router the entry is on
+    :param chip_x: the x coordinate of the chip being considered
+    :param chip_y: the y coordinate of the chip being considered
+    :param reached_placements:
+        the placements reached during the trace
+    :param to_follow: the links still to follow, the next to follow last
+    """
+    if entry.processor_ids:
+        _is_dest(entry.processor_ids, current_router, reached_placements)
+    # The first link is followed first
+    to_follow.extend(
+        (chip_x, chip_y, link_id)
+        for link_id in reversed(list(entry.link_ids)))
 
 
 def _check_visited_routers(chip: Chip, visited_routers: set[Chip]) -> None:
@@ -390,46 +534,51 @@ def _is_dest(processor_ids: Iterable[int],
 
 
 def _locate_routing_entry(
-        current_router: AbstractMulticastRoutingTable, key: int,
+        current_router: _IndexedTable, key: int,
         n_atoms: int) -> MulticastRoutingEntry:
     """
     Locate the entry from the router based off the edge.
 
     :param current_router:
-        the current router being used in the trace
+        the indexed table of the current router being used in the trace
     :param key: the key being used by the source placement
     :param n_atoms: the number of atoms
     :raise PacmanRoutingException:
         when there is no entry located on this router
     """
-    found_entry = None
-    for entry in current_router.multicast_routing_entries:
+    matches = (current_router.masks & key) == current_router.keys
+    # Range entries which match but do not cover all the keys
+    too_short = (
+        matches & current_router.is_range &
+        (current_router.last_keys < key + n_atoms - 1))
+    # Range entries which do not match but do overlap some of the keys
+    overlapping = (
+        ~matches & current_router.is_range &
+        (numpy.minimum(current_router.last_keys, key + n_atoms) -
+         numpy.maximum(current_router.first_keys, key) + 1 > 0))
+    bad = numpy.flatnonzero(too_short | overlapping)
+    # Only entries before the first bad one would have been seen
+    end = int(bad[0]) if len(bad) else len(current_router)
+    found = numpy.flatnonzero(matches[:end + 1 if len(bad) else end])
+    for _ in found[1:]:
+        logger.warning(
+            "Found more than one entry for key {}. This could be "
+            "an error, as currently no router supports overloading"
+            " of entries.", hex(key))
+    if len(bad):
+        entry = current_router.entries[end]
         key_combo = entry.mask & key
         e_key = entry.key
-        if key_combo == e_key:
-            if found_entry is None:
-                found_entry = entry
-            else:
-                logger.warning(
-                    "Found more than one entry for key {}. This could be "
-                    "an error, as currently no router supports overloading"
-                    " of entries.", hex(key))
-            if entry.mask in range_masks:
-                last_atom = key + n_atoms - 1
-                last_key = e_key + (~entry.mask & FULL_MASK)
-                if last_key < last_atom:
-                    raise PacmanRoutingException(
-                        f"Full key range not covered: key:0x{key:x} "
-                        f"key_combo:0x{key_combo:x} mask:0x{entry.mask:x}, "
-                        f"last_key:0x{last_key:x}, e_key:0x{e_key:x}")
-        elif entry.mask in range_masks:
-            last_atom = key + n_atoms
-            last_key = e_key + (~entry.mask & FULL_MASK)
-            if min(last_key, last_atom) - max(e_key, key) + 1 > 0:
-                raise PacmanConfigurationException(
-                    f"Key range partially covered:  key:0x{key:x}, "
-                    f"key_combo:0x{key_combo:x} mask:0x{entry.mask:x}, "
-                    f"last_key:0x{last_key:x}, e_key:0x{e_key:x}")
-    if found_entry is None:
+        last_key = int(current_router.last_keys[end])
+        if too_short[end]:
+            raise PacmanRoutingException(
+                f"Full key range not covered: key:0x{key:x} "
+                f"key_combo:0x{key_combo:x} mask:0x{entry.mask:x}, "
+                f"last_key:0x{last_key:x}, e_key:0x{e_key:x}")
+        raise PacmanConfigurationException(
+            f"Key range partially covered:  key:0x{key:x}, "
+            f"key_combo:0x{key_combo:x} mask:0x{entry.mask:x}, "
+            f"last_key:0x{last_key:x}, e_key:0x{e_key:x}")
+    if found.size == 0:
         raise PacmanRoutingException("no entry located")
-    return found_entry
+    return current_router.entries[int(found[0])]
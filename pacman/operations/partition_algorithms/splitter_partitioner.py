@@ -15,9 +15,11 @@
 from spinn_utilities.progress_bar import ProgressBar
 
 from pacman.data import PacmanDataView
+from pacman.utilities.instrumentation import span
 from pacman.utilities.utility_objs.chip_counter import ChipCounter
 
 
+@span("splitter_partitioner")
 def splitter_partitioner() -> int:
     """
     Call the splitter of each application vertex to create the machine vertices
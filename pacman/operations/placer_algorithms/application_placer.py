@@ -33,12 +33,14 @@ from pacman.model.graphs.application import ApplicationVertex
 from pacman.model.graphs.machine import MachineVertex
 from pacman.model.placements import Placement, Placements
 from pacman.model.resources import AbstractSDRAM, ConstantSDRAM
+from pacman.utilities.instrumentation import span
 
 from .draw_placements import draw_placements as dp
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
 
+@span("place_application_graph")
 def place_application_graph(system_placements: Placements) -> Placements:
     """
     Perform placement of an application graph on the machine.
@@ -158,14 +160,19 @@ class ApplicationPlacer:
         progress = ProgressBar(
             PacmanDataView.get_n_vertices() * 2, "Placing Vertices")
         try:
-            for app_vertex in progress.over(
-                    PacmanDataView.iterate_vertices(), finish_at_end=False):
-                if app_vertex.has_fixed_location():
-                    self._place_fixed_vertex(app_vertex)
-
-            for app_vertex in progress.over(PacmanDataView.iterate_vertices()):
-                # as this checks if placed already not need to check if fixed
-                self._place_vertex(app_vertex)
+            with span("place fixed vertices"):
+                for app_vertex in progress.over(
+                        PacmanDataView.iterate_vertices(),
+                        finish_at_end=False):
+                    if app_vertex.has_fixed_location():
+                        self._place_fixed_vertex(app_vertex)
+
+            with span("place vertices"):
+                for app_vertex in progress.over(
+                        PacmanDataView.iterate_vertices()):
+                    # as this checks if placed already not need to check if
+                    # fixed
+                    self._place_vertex(app_vertex)
         except PacmanPlaceException as e:
             raise self._place_error(system_placements, e) from e
 
@@ -36,6 +36,7 @@ from pacman.utilities.algorithm_utilities.routing_algorithm_utilities import (
     vertex_xy_and_route,
 )
 from pacman.utilities.algorithm_utilities.routing_tree import RoutingTree
+from pacman.utilities.instrumentation import span
 
 _Node: TypeAlias = tuple[int, XY]
 _OptInt: TypeAlias = int | None
@@ -159,6 +160,7 @@ class _Targets:
         return vertex, self.__targets_by_source[vertex]
 
 
+@span("route_application_graph")
 def route_application_graph() -> MulticastRoutingTableByPartition:
     """
     Route the current application graph.
@@ -167,7 +169,8 @@ def route_application_graph() -> MulticastRoutingTableByPartition:
     """
     routing_tables = MulticastRoutingTableByPartition()
 
-    partitions = get_app_partitions()
+    with span("find partitions"):
+        partitions = get_app_partitions()
     machine = PacmanDataView.get_machine()
     # Now go through the app edges and route app vertex by app vertex
     progress = ProgressBar(len(partitions), "Routing")
@@ -13,12 +13,21 @@
 # limitations under the License.
 
 from .abstract_compressor import AbstractCompressor
+from .budgeted_compressor import budgeted_compressor
+from .compression_cache import CompressionCache
+from .key_mask_index import KeyMaskIndex
 from .pair_compressor import pair_compressor
+from .portfolio_compressor import PortfolioCompressor, portfolio_compressor
 from .ranged_compressor import RangeCompressor, range_compressor
 
 __all__ = [
            'AbstractCompressor',
+           'CompressionCache',
+           'KeyMaskIndex',
+           'PortfolioCompressor',
            'RangeCompressor',
+           'budgeted_compressor',
            'pair_compressor',
+           'portfolio_compressor',
            'range_compressor',
 ]
@@ -16,6 +16,7 @@
 based on https://github.com/project-rig/
 """
 
+import functools
 import logging
 from abc import abstractmethod
 from typing import cast
@@ -29,10 +30,19 @@ from spinn_machine import MulticastRoutingEntry
 from pacman.data import PacmanDataView
 from pacman.exceptions import MinimisationFailedError
 from pacman.model.routing_tables import (
+    AbstractMulticastRoutingTable,
     CompressedMulticastRoutingTable,
     MulticastRoutingTables,
     UnCompressedMulticastRoutingTable,
 )
+from pacman.utilities.algorithm_utilities.parallel_utilities import (
+    get_n_mapping_processes,
+    map_in_processes,
+)
+from pacman.utilities.instrumentation import span
+
+from .compression_cache import get_compression_cache, log_cache_statistics
+from .routing_compression_checker import compare_tables
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -87,6 +97,16 @@ class AbstractCompressor:
         """
         raise NotImplementedError
 
+    def _cache_description(self) -> str:
+        """
+        Describe this compressor and any settings which change its results,
+        so that only its own results are found in the compression cache.
+
+        :returns: The description
+        """
+        return f"{self.__class__.__name__}(ordered={self._ordered})"
+
+    @span("compress_tables")
     def compress_tables(
             self, router_tables: MulticastRoutingTables,
             progress: ProgressBar) -> MulticastRoutingTables:
@@ -95,27 +115,78 @@ class AbstractCompressor:
 
         Tables who start of smaller than global_target are not compressed
 
+        The tables are shared between the number of processes set by
+        ``n_mapping_processes`` in the ``Mapping`` section of the
+        configuration, each of which compresses with a copy of this
+        compressor.  The results are always in the order of the tables.
+
+        If ``compression_cache_directory`` is set in the ``Mapping`` section
+        of the configuration, tables compressed in earlier runs are taken
+        from the :py:class:`CompressionCache` rather than compressed again.
+
         :param router_tables: Routing tables
         :param progress: Progress bar to show while working
         :return: The compressed but still unordered routing tables
         :raises MinimisationFailedError: on failure
+        :raises PacmanRoutingException:
+            If ``router_table_compression_check`` is set and a compressed
+            table does not route the same as the original
         """
         compressed_tables = MulticastRoutingTables()
         as_needed = not (get_config_bool(
             "Mapping", "router_table_compress_as_far_as_possible"))
+
+        def needs_compression(table: AbstractMulticastRoutingTable) -> bool:
+            chip = PacmanDataView.get_chip_at(table.x, table.y)
+            target = chip.router.n_available_multicast_entries
+            return not as_needed or table.number_of_entries > target
+
+        # Look up the results of earlier runs, and note where to save new ones
+        cache = get_compression_cache()
+        cached: dict[tuple[int, int], list[MulticastRoutingEntry]] = {}
+        cache_keys: dict[tuple[int, int], str] = {}
+        to_compress: list[UnCompressedMulticastRoutingTable] = []
+        for table in router_tables.routing_tables:
+            if not needs_compression(table):
+                continue
+            if cache is not None:
+                chip = PacmanDataView.get_chip_at(table.x, table.y)
+                key = cache.cache_key(
+                    table, self._cache_description(),
+                    chip.router.n_available_multicast_entries
+                    if as_needed else None)
+                entries = cache.get(key)
+                if entries is not None:
+                    cached[table.x, table.y] = entries
+                    continue
+                cache_keys[table.x, table.y] = key
+            to_compress.append(cast(UnCompressedMulticastRoutingTable, table))
+
+        check = get_config_bool("Mapping", "router_table_compression_check")
+        # Lazily compressed in the same order as the loop below uses them
+        compressed_entries = map_in_processes(
+            functools.partial(_compress_table_entries, self), to_compress,
+            get_n_mapping_processes())
         for table in progress.over(router_tables.routing_tables):
             chip = PacmanDataView.get_chip_at(table.x, table.y)
             target = chip.router.n_available_multicast_entries
-            if as_needed and table.number_of_entries <= target:
+            if not needs_compression(table):
                 new_table = table
             else:
-                compressed_table = self.compress_table(cast(
-                    UnCompressedMulticastRoutingTable, table))
+                if (table.x, table.y) in cached:
+                    compressed_table = cached[table.x, table.y]
+                else:
+                    compressed_table = next(compressed_entries)
+                    if cache is not None:
+                        cache.put(
+                            cache_keys[table.x, table.y], compressed_table)
 
                 new_table = CompressedMulticastRoutingTable(table.x, table.y)
 
                 for entry in compressed_table:
                     new_table.add_multicast_routing_entry(entry)
+                if check:
+                    compare_tables(table, new_table)
                 if new_table.number_of_entries > target:
                     self._problems += (
                         f"(x:{new_table.x},y:{new_table.y})="
@@ -123,6 +194,8 @@ class AbstractCompressor:
 
             compressed_tables.add_routing_table(new_table)
 
+        if cache is not None:
+            log_cache_statistics(cache)
         if len(self._problems) > 0:
             if self._ordered and not self._accept_overflow:
                 raise MinimisationFailedError(
@@ -131,3 +204,13 @@ class AbstractCompressor:
             else:
                 logger.warning(self._problems)
         return compressed_tables
+
+
+def _compress_table_entries(
+        compressor: AbstractCompressor,
+        router_table: UnCompressedMulticastRoutingTable
+        ) -> list[MulticastRoutingEntry]:
+    """
+    Compress one table; at module level so worker processes can find it.
+    """
+    return compressor.compress_table(router_table)
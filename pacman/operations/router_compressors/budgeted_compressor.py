@@ -0,0 +1,190 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+import logging
+import time
+from typing import cast
+
+from spinn_utilities.config_holder import (
+    get_config_bool,
+    get_config_float_or_none,
+)
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.progress_bar import ProgressBar
+
+from pacman.data import PacmanDataView
+from pacman.exceptions import MinimisationFailedError
+from pacman.model.routing_tables import (
+    AbstractMulticastRoutingTable,
+    CompressedMulticastRoutingTable,
+    MulticastRoutingTables,
+    UnCompressedMulticastRoutingTable,
+)
+from pacman.utilities.algorithm_utilities.parallel_utilities import (
+    get_n_mapping_processes,
+    map_in_processes,
+)
+from pacman.utilities.instrumentation import span
+
+from .ordered_covering_router_compressor.ordered_covering import (
+    ordered_covering,
+)
+from .ordered_covering_router_compressor.utils import remove_default_routes
+from .ranged_compressor import RangeCompressor
+from .routing_compression_checker import compare_tables
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+
+@span("budgeted_compressor")
+def budgeted_compressor(
+        time_budget: float | None = None,
+        accept_overflow: bool = False) -> MulticastRoutingTables:
+    """
+    Compresses all the tables within a time limit for the whole machine.
+
+    First every table is compressed with :py:class:`RangeCompressor`, which
+    is quick.  Then the original tables of those still too big are
+    compressed by :py:func:`ordered_covering` in order of how far they are
+    over their target, largest first, until each fits or the time runs out.
+    Each table is left as the smaller of the range compressed table and the
+    best ordered covering found before the time ran out, rather than
+    raising an error.
+
+    If ``router_table_compress_as_far_as_possible`` is set in the
+    ``Mapping`` section of the configuration every table is given to
+    ordered covering, largest first, and made as small as the time allows.
+
+    The tables are shared between the number of processes set by
+    ``n_mapping_processes`` in the ``Mapping`` section of the configuration,
+    which all work to the same deadline.
+
+    :param time_budget:
+        The number of seconds to spend on compression, which may only be
+        obeyed approximately; if None ``compression_time_budget`` in the
+        ``Mapping`` section of the configuration is used, and if that is
+        None there is no limit
+    :param accept_overflow:
+        A flag which should only be used in testing to stop raising an
+        exception if result is too big
+    :returns: Compressed routing tables
+    :raises MinimisationFailedError:
+        If a table does not fit and overflow is not accepted
+    """
+    if time_budget is None:
+        time_budget = get_config_float_or_none(
+            "Mapping", "compression_time_budget")
+    start = time.monotonic()
+    deadline = None if time_budget is None else start + time_budget
+    as_needed = not get_config_bool(
+        "Mapping", "router_table_compress_as_far_as_possible")
+
+    router_tables = PacmanDataView.get_precompressed()
+    n_processes = get_n_mapping_processes()
+    progress = ProgressBar(
+        len(router_tables.routing_tables) * 2,
+        "Compressing routing tables within a time budget")
+
+    # Cheaply bring as many tables as possible under their targets
+    tables: dict[tuple[int, int], AbstractMulticastRoutingTable] = {}
+    with span("range compress"):
+        for table in progress.over(map_in_processes(
+                _range_compress, [
+                    cast(UnCompressedMulticastRoutingTable, table)
+                    for table in router_tables.routing_tables],
+                n_processes), finish_at_end=False):
+            tables[table.x, table.y] = table
+
+    # Spend the rest of the time on the tables furthest over first
+    def over_target(table: AbstractMulticastRoutingTable) -> int:
+        chip = PacmanDataView.get_chip_at(table.x, table.y)
+        return (table.number_of_entries -
+                chip.router.n_available_multicast_entries)
+
+    originals = {
+        (table.x, table.y): table for table in router_tables.routing_tables}
+    to_cover = [originals[table.x, table.y] for table in sorted((
+        table for table in tables.values()
+        if not as_needed or over_target(table) > 0),
+        key=lambda table: (over_target(table), table.number_of_entries),
+        reverse=True)]
+    progress.update(len(tables) - len(to_cover))
+    with span("ordered covering"):
+        for table in progress.over(map_in_processes(
+                functools.partial(_cover_until, deadline), to_cover,
+                n_processes)):
+            # Stopping early may leave a bigger table than the range
+            # compressor
+            ranged = tables[table.x, table.y]
+            if table.number_of_entries < ranged.number_of_entries:
+                tables[table.x, table.y] = table
+
+    compressed_tables = MulticastRoutingTables()
+    problems = ""
+    check = get_config_bool("Mapping", "router_table_compression_check")
+    for table in router_tables.routing_tables:
+        new_table = tables[table.x, table.y]
+        if check and new_table is not table:
+            compare_tables(table, new_table)
+        if over_target(new_table) > 0:
+            problems += (f"(x:{new_table.x},y:{new_table.y})="
+                         f"{new_table.number_of_entries} ")
+        compressed_tables.add_routing_table(new_table)
+    logger.info(
+        f"Budgeted compression took {time.monotonic() - start:.3f} seconds "
+        f"of {time_budget} allowed")
+
+    if problems:
+        if not accept_overflow:
+            raise MinimisationFailedError(
+                "The routing table after compression will still not fit"
+                f" within the machines router: {problems}")
+        logger.warning(problems)
+    return compressed_tables
+
+
+def _range_compress(
+        table: UnCompressedMulticastRoutingTable
+        ) -> AbstractMulticastRoutingTable:
+    """
+    Compress one table with the range compressor; at module level so
+    worker processes can find it.
+    """
+    return RangeCompressor().compress_table(table)
+
+
+def _cover_until(
+        deadline: float | None, table: AbstractMulticastRoutingTable
+        ) -> AbstractMulticastRoutingTable:
+    """
+    Compress one original table with ordered covering until it fits or the
+    deadline passes; at module level so worker processes can find it.
+    """
+    time_to_run_for = None
+    if deadline is not None:
+        time_to_run_for = deadline - time.monotonic()
+        if time_to_run_for <= 0:
+            return table
+    if get_config_bool("Mapping", "router_table_compress_as_far_as_possible"):
+        target_length: int | None = None
+    else:
+        chip = PacmanDataView.get_chip_at(table.x, table.y)
+        target_length = chip.router.n_available_multicast_entries
+    entries, _ = ordered_covering(
+        routing_table=table.multicast_routing_entries,
+        target_length=target_length, aliases={}, no_raise=True,
+        time_to_run_for=time_to_run_for)
+    # The target is checked by the caller as it may not have been reached
+    entries = remove_default_routes(entries, None)
+    return CompressedMulticastRoutingTable(table.x, table.y, entries)
@@ -0,0 +1,235 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterable
+
+import numpy
+
+from spinn_utilities.config_holder import (
+    get_config_int,
+    get_config_str_or_none,
+)
+from spinn_utilities.log import FormatAdapter
+
+from spinn_machine import MulticastRoutingEntry, RoutingEntry
+
+from pacman.model.routing_tables import AbstractMulticastRoutingTable
+from pacman.utilities.utility_calls import md5
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+# The file extension of the cached tables
+_SUFFIX = ".npy"
+
+
+class CompressionCache:
+    """
+    An on-disk cache of compressed routing table entries, so a table
+    compressed in an earlier run need not be compressed again.
+
+    The entries are found by a hash of the sorted uncompressed entries, the
+    compressor and the target size, so a table only matches if compressing
+    it again would give the same result.
+    Each result is a file in the cache directory; when the files take more
+    than the maximum size the least recently used are deleted.
+    """
+
+    __slots__ = (
+        # The directory holding the cached results
+        "_directory",
+        # The most bytes the cached results may take
+        "_max_bytes",
+        # Size in bytes of each cached file by name, least recently used first
+        "_files",
+        # The bytes taken by all the cached files
+        "_n_bytes",
+        # The number of lookups which found a result
+        "_n_hits",
+        # The number of lookups which did not find a result
+        "_n_misses")
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        :param directory:
+            The directory to keep the cached results in;
+            created if it does not exist
+        :param max_bytes: The most bytes the cached results may take
+        """
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._n_hits = 0
+        self._n_misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+        # Files used longest ago first, as their times are set when used
+        found = []
+        for entry in os.scandir(directory):
+            if entry.is_file() and entry.name.endswith(_SUFFIX):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name, stat.st_size))
+        found.sort()
+        self._files: OrderedDict[str, int] = OrderedDict(
+            (name, size) for _, name, size in found)
+        self._n_bytes = sum(self._files.values())
+        self.__evict()
+
+    @staticmethod
+    def cache_key(
+            table: AbstractMulticastRoutingTable, compressor: str,
+            target: int | None) -> str:
+        """
+        Get the key under which the compressed entries of a table are cached.
+
+        :param table: The uncompressed table
+        :param compressor:
+            A description of the compressor, including any settings that
+            change the result
+        :param target:
+            The size the table is compressed to,
+            or None if compressed as far as possible
+        :returns: The hash of the entries, compressor and target
+        """
+        entries = sorted(
+            (entry.key, entry.mask, entry.spinnaker_route, entry.defaultable)
+            for entry in table.multicast_routing_entries)
+        return md5(f"{compressor}:{target}:{entries}")
+
+    def get(self, key: str) -> list[MulticastRoutingEntry] | None:
+        """
+        Get the cached compressed entries of a table.
+
+        :param key: The key from :py:meth:`cache_key`
+        :returns: The compressed entries, or None if not in the cache
+        """
+        name = key + _SUFFIX
+        path = os.path.join(self._directory, name)
+        if name in self._files:
+            try:
+                data = numpy.load(path, allow_pickle=False)
+                os.utime(path)
+            except (OSError, ValueError):
+                # Removed or damaged by another process
+                self.__forget(name)
+            else:
+                self._files.move_to_end(name)
+                self._n_hits += 1
+                return [
+                    MulticastRoutingEntry(e_key, mask, RoutingEntry(
+                        spinnaker_route=route, defaultable=bool(defaultable)))
+                    for e_key, mask, route, defaultable in data.tolist()]
+        self._n_misses += 1
+        return None
+
+    def put(self, key: str, entries: Iterable[MulticastRoutingEntry]) -> None:
+        """
+        Add the compressed entries of a table to the cache, deleting the
+        least recently used entries if the cache is then too big.
+
+        :param key: The key from :py:meth:`cache_key`
+        :param entries: The compressed entries, in order
+        """
+        data = numpy.array(
+            [(entry.key, entry.mask, entry.spinnaker_route,
+              entry.defaultable) for entry in entries],
+            dtype=numpy.uint32).reshape(-1, 4)
+        name = key + _SUFFIX
+        # Write to a temporary file first so no one reads half a file
+        handle, temp_path = tempfile.mkstemp(
+            suffix=".tmp", dir=self._directory)
+        with os.fdopen(handle, "wb") as f:
+            numpy.save(f, data, allow_pickle=False)
+        os.replace(temp_path, os.path.join(self._directory, name))
+
+        self.__forget(name)
+        self._files[name] = os.path.getsize(
+            os.path.join(self._directory, name))
+        self._n_bytes += self._files[name]
+        self.__evict()
+
+    def __forget(self, name: str) -> None:
+        self._n_bytes -= self._files.pop(name, 0)
+
+    def __evict(self) -> None:
+        while self._n_bytes > self._max_bytes and self._files:
+            name, size = self._files.popitem(last=False)
+            self._n_bytes -= size
+            try:
+                os.remove(os.path.join(self._directory, name))
+            except FileNotFoundError:
+                pass
+
+    @property
+    def n_hits(self) -> int:
+        """
+        The number of lookups which found a cached result.
+        """
+        return self._n_hits
+
+    @property
+    def n_misses(self) -> int:
+        """
+        The number of lookups which did not find a cached result.
+        """
+        return self._n_misses
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of the lookups which found a cached result.
+        """
+        n_lookups = self._n_hits + self._n_misses
+        if n_lookups == 0:
+            return 0.0
+        return self._n_hits / n_lookups
+
+    @property
+    def n_bytes(self) -> int:
+        """
+        The number of bytes taken by the cached results.
+        """
+        return self._n_bytes
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+def get_compression_cache() -> CompressionCache | None:
+    """
+    Get the compression cache set by ``compression_cache_directory`` and
+    ``compression_cache_size`` in the ``Mapping`` section of the
+    configuration.
+
+    :returns: The cache, or None if no cache directory is configured
+    """
+    directory = get_config_str_or_none(
+        "Mapping", "compression_cache_directory")
+    if directory is None:
+        return None
+    max_bytes = get_config_int("Mapping", "compression_cache_size") * 1024 ** 2
+    return CompressionCache(directory, max_bytes)
+
+
+def log_cache_statistics(cache: CompressionCache) -> None:
+    """
+    Log how well a compression cache has been used.
+
+    :param cache: The cache to report on
+    """
+    logger.info(
+        f"Compression cache found {cache.n_hits} of "
+        f"{cache.n_hits + cache.n_misses} tables ({cache.hit_rate:.0%}); "
+        f"holding {len(cache)} tables in {cache.n_bytes} bytes")
@@ -0,0 +1,153 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections.abc import Iterator
+from typing import Any, Generic, TypeVar
+
+from pacman.utilities.constants import BITS_IN_KEY
+
+#: :meta private:
+V = TypeVar("V")
+
+# Index of the child of a node for a 0, 1 or X in the bit of the node
+_ZERO = 0
+_ONE = 1
+_X = 2
+
+
+class KeyMaskIndex(Generic[V]):
+    """
+    A ternary trie of key-mask pairs which finds the pairs which intersect
+    (i.e., would both match some of the same keys as) a given key-mask pair.
+
+    Each level of the trie is one bit of the key, most significant first,
+    with a child for entries with a 0, a 1 or an *X* in that bit.  A search
+    follows the child matching the bit and the *X* child, or all three
+    children where the searched for mask has an *X*, so the time taken
+    depends on the number of entries sharing the searched bits rather than
+    the number of entries in the index.
+
+    Each key-mask pair is stored with a value, such as the routing entry it
+    came from, and the same pair may be stored with many values.
+    """
+
+    __slots__ = (
+        # Root node; each node is a list of three children, or at the
+        # bottom level a list of the values stored for that key-mask pair
+        "_root",
+        # The number of values stored
+        "_n_values")
+
+    def __init__(self) -> None:
+        self._root: list[Any] = [None, None, None]
+        self._n_values = 0
+
+    def __len__(self) -> int:
+        return self._n_values
+
+    @staticmethod
+    def __child_index(key: int, mask: int, bit: int) -> int:
+        if not mask & bit:
+            return _X
+        return _ONE if key & bit else _ZERO
+
+    def add(self, key: int, mask: int, value: V) -> None:
+        """
+        Store a key-mask pair.
+
+        :param key: The key of the pair
+        :param mask: The mask of the pair
+        :param value: The value to return when the pair is found
+        """
+        node = self._root
+        for bit_no in range(BITS_IN_KEY - 1, -1, -1):
+            index = self.__child_index(key, mask, 1 << bit_no)
+            child = node[index]
+            if child is None:
+                child = [] if bit_no == 0 else [None, None, None]
+                node[index] = child
+            node = child
+        node.append(value)
+        self._n_values += 1
+
+    def remove(self, key: int, mask: int, value: V) -> None:
+        """
+        Remove a key-mask pair stored with :py:meth:`add`.
+
+        :param key: The key of the pair
+        :param mask: The mask of the pair
+        :param value: The value the pair was stored with
+        :raise KeyError: If the pair is not stored with that value
+        """
+        path: list[tuple[list[Any], int]] = []
+        node = self._root
+        for bit_no in range(BITS_IN_KEY - 1, -1, -1):
+            index = self.__child_index(key, mask, 1 << bit_no)
+            path.append((node, index))
+            node = node[index]
+            if node is None:
+                raise KeyError(f"0x{key:08X}/0x{mask:08X}: {value}")
+        try:
+            node.remove(value)
+        except ValueError as ex:
+            raise KeyError(f"0x{key:08X}/0x{mask:08X}: {value}") from ex
+        self._n_values -= 1
+
+        # Remove nodes left without children
+        if node:
+            return
+        for parent, index in reversed(path):
+            parent[index] = None
+            if parent is self._root or any(
+                    child is not None for child in parent):
+                return
+
+    def intersecting(self, key: int, mask: int) -> Iterator[V]:
+        """
+        Find the stored key-mask pairs which intersect a key-mask pair.
+
+        :param key: The key of the pair to search for
+        :param mask: The mask of the pair to search for
+        :returns: The values stored with each intersecting pair,
+            in no particular order
+        """
+        stack: list[tuple[list[Any], int]] = [(self._root, BITS_IN_KEY - 1)]
+        while stack:
+            node, bit_no = stack.pop()
+            if bit_no < 0:
+                yield from node
+                continue
+            bit = 1 << bit_no
+            child = node[_X]
+            if child is not None:
+                stack.append((child, bit_no - 1))
+            if mask & bit:
+                child = node[_ONE if key & bit else _ZERO]
+                if child is not None:
+                    stack.append((child, bit_no - 1))
+            else:
+                for child in node[_ZERO:_X]:
+                    if child is not None:
+                        stack.append((child, bit_no - 1))
+
+    def any_intersecting(self, key: int, mask: int) -> bool:
+        """
+        Check if any stored key-mask pair intersects a key-mask pair.
+
+        :param key: The key of the pair to search for
+        :param mask: The mask of the pair to search for
+        :returns: True if at least one stored pair intersects
+        """
+        for _ in self.intersecting(key, mask):
+            return True
+        return False
@@ -13,6 +13,8 @@
 # limitations under the License.
 from __future__ import annotations
 
+import heapq
+from collections import defaultdict
 from collections.abc import Collection, Iterable, Mapping
 from typing import (
     TypeAlias,
@@ -33,6 +35,7 @@ from pacman.model.routing_tables import (
 from pacman.operations.router_compressors import AbstractCompressor
 from pacman.utilities.constants import FULL_MASK
 
+from .table_index import _TableIndex
 from .utils import intersect, remove_default_routes
 
 #: A key,mask pair
@@ -100,7 +103,7 @@ def ordered_covering(
         routing_table: Iterable[MulticastRoutingEntry],
         target_length: int | None,
         aliases: _Aliases, *, no_raise: bool = False,
-        time_to_run_for: float | None = None
+        time_to_run_for: float | None = None, incremental: bool = True
         ) -> tuple[list[MulticastRoutingEntry], _Aliases]:
     """
     Reduce the size of a routing table by merging together entries where
@@ -141,7 +144,14 @@ def ordered_covering(
         size of the final table.
     :param time_to_run_for:
         If supplied, a maximum number of seconds to run for before giving an
-        error. May only be obeyed approximately.
+        error, or if `no_raise` is True before returning the table as it is.
+        May only be obeyed approximately.
+    :param incremental:
+        If True (the default) the best merge of each route is remembered
+        between iterations and only found again when an applied merge could
+        have changed it; see :py:class:`_MergeQueue`.
+        If False every merge is found and refined again on each iteration.
+        Both give the same table.
     :return: new routing table, A new _aliases dictionary.
     :raises MinimisationFailedError:
         If the smallest table that can be produced is larger than
@@ -156,10 +166,14 @@ def ordered_covering(
     # Perform an initial sort of the routing table in order of increasing
     # generality.
     routing_table = sorted(routing_table, key=_get_entry_generality)
+    merge_queue = _MergeQueue() if incremental else None
 
     while target_length is None or len(routing_table) > target_length:
         # Get the best merge
-        merge = _get_best_merge(routing_table, aliases)
+        if merge_queue is None:
+            merge = _get_best_merge(routing_table, aliases)
+        else:
+            merge = merge_queue.get_best_merge(routing_table, aliases)
 
         # If there is no merge then stop
         if merge.goodness <= 0:
@@ -168,11 +182,15 @@ def ordered_covering(
         # Otherwise apply the merge; this returns a new routing table and
         # updates the aliases dictionary.
         routing_table = merge.apply(aliases)
+        if merge_queue is not None:
+            merge_queue.merge_applied(merge, routing_table, aliases)
 
         # control for limiting the search
         if time_to_run_for is not None:
             diff = timer.take_sample()
             if diff.total_seconds() >= time_to_run_for:
+                if no_raise:
+                    break
                 raise MinimisationFailedError(
                     f"Best compression is {len(routing_table)} which is "
                     f"still higher than the target {target_length}")
@@ -263,6 +281,118 @@ def _get_best_merge(
     return best_merge
 
 
+class _MergeQueue:
+    """
+    Finds the same merge as :py:func:`_get_best_merge`, but remembers the
+    refined merge of each route between iterations.
+
+    The candidate merges are one per route, of all the entries with that
+    route.  Refining a merge only looks at entries which intersect the
+    key-mask of the unrefined merge, and a merged entry covers all the
+    entries (and aliases) it replaces.  So applying a merge can only change
+    the refined merge of its own route and of the routes whose unrefined
+    key-mask intersects the new entry; only those are refined again.
+
+    The remembered merges are kept in a priority queue keyed by goodness.
+    Ties are broken by the position of the first entry of each route, as
+    that is the order in which :py:func:`_get_best_merge` considers them.
+
+    The refinement finds the intersecting entries using a
+    :py:class:`_TableIndex` kept up to date as merges are applied.
+    """
+
+    __slots__ = (
+        # Index of the current routing table; made on first use
+        "_index",
+        # route -> (key, mask) of the merge of all entries with that route
+        "_unrefined",
+        # route -> entries of the refined merge; empty if not worth merging
+        "_refined",
+        # Heap of (-goodness, route, version) for the refined merges
+        "_queue",
+        # route -> version of its refined merge, to detect stale queue items
+        "_versions",
+    )
+
+    def __init__(self) -> None:
+        self._index: _TableIndex | None = None
+        self._unrefined: dict[int, _KeyMask] = dict()
+        self._refined: dict[int, list[MulticastRoutingEntry]] = dict()
+        self._queue: list[tuple[int, int, int]] = []
+        self._versions: dict[int, int] = defaultdict(int)
+
+    def get_best_merge(
+            self, routing_table: list[MulticastRoutingEntry],
+            aliases: _ROAliases) -> _Merge:
+        """
+        Get the merge which would combine the greatest number of entries.
+
+        :param routing_table: Routing entries to be merged.
+        :param aliases: As for :py:func:`_get_best_merge`
+        :return: Merge
+        """
+        if self._index is None:
+            self._index = _TableIndex(routing_table, aliases)
+        by_route: dict[int, list[int]] = defaultdict(list)
+        for i, entry in enumerate(routing_table):
+            by_route[entry.spinnaker_route].append(i)
+
+        for route, indices in by_route.items():
+            if len(indices) < 2 or route in self._refined:
+                continue
+            merge = _Merge(routing_table, indices)
+            self._unrefined[route] = (merge.key, merge.mask)
+            merge = _refine_merge(
+                merge, aliases, min_goodness=0, index=self._index)
+            if merge.goodness > 0:
+                self._refined[route] = [
+                    routing_table[i] for i in merge.entries]
+                heapq.heappush(self._queue, (
+                    -merge.goodness, route, self._versions[route]))
+            else:
+                self._refined[route] = []
+
+        # Take all the best merges, choose the first in the table and put
+        # the others back
+        best: list[tuple[int, int, int]] = []
+        while self._queue:
+            item = self._queue[0]
+            _, route, version = item
+            if version != self._versions[route]:
+                heapq.heappop(self._queue)
+            elif not best or item[0] == best[0][0]:
+                best.append(heapq.heappop(self._queue))
+            else:
+                break
+        if not best:
+            return _Merge(routing_table)
+        for item in best:
+            heapq.heappush(self._queue, item)
+        route = min(
+            (item[1] for item in best), key=lambda r: by_route[r][0])
+
+        return _Merge(routing_table, [
+            self._index.position(entry) for entry in self._refined[route]])
+
+    def merge_applied(
+            self, merge: _Merge, routing_table: list[MulticastRoutingEntry],
+            aliases: _ROAliases) -> None:
+        """
+        Forget the refined merges which the applied merge could change.
+
+        :param merge: The merge which has been applied
+        :param routing_table: The routing table after the merge
+        :param aliases: The aliases after the merge
+        """
+        if self._index is not None:
+            self._index.merge_applied(merge, routing_table, aliases)
+        route = merge.routing_table[next(iter(merge.entries))].spinnaker_route
+        for other, (key, mask) in self._unrefined.items():
+            if other == route or intersect(key, mask, merge.key, merge.mask):
+                self._refined.pop(other, None)
+                self._versions[other] += 1
+
+
 def _get_all_merges(routing_table: list[MulticastRoutingEntry]
                     ) -> Iterable['_Merge']:
     """
@@ -447,7 +577,8 @@ class _Merge:
 
 
 def _refine_merge(
-        merge: _Merge, aliases: _ROAliases, min_goodness: int) -> _Merge:
+        merge: _Merge, aliases: _ROAliases, min_goodness: int,
+        index: _TableIndex | None = None) -> _Merge:
     """
     Remove entries from a merge to generate a valid merge which may be
     applied to the routing table.
@@ -462,27 +593,32 @@ def _refine_merge(
         already minimised table.
     :param min_goodness:
         Reject merges which are worse than the minimum goodness.
+    :param index:
+        Index of the routing table and aliases to find intersecting entries
+        with, or None to check every entry
     :return: Valid merge which may be applied to the routing table
     """
     # Perform the down-check
-    merge = _refine_downcheck(merge, aliases, min_goodness)
+    merge = _refine_downcheck(merge, aliases, min_goodness, index)
 
     # If the merge is still sufficiently good then continue to refine it.
     if merge.goodness > min_goodness:
         # Perform the up-check
-        merge, changed = _refine_upcheck(merge, min_goodness)
+        merge, changed = _refine_upcheck(merge, min_goodness, index)
 
         if changed and merge.goodness > min_goodness:
             # If the up-check removed any entries we need to re-perform the
             # down-check; but we do not need to re-perform the up-check as the
             # down check can only move the resultant merge nearer the top of
             # the routing table.
-            merge = _refine_downcheck(merge, aliases, min_goodness)
+            merge = _refine_downcheck(merge, aliases, min_goodness, index)
 
     return merge
 
 
-def _refine_upcheck(merge: _Merge, min_goodness: int) -> tuple[_Merge, bool]:
+def _refine_upcheck(
+        merge: _Merge, min_goodness: int,
+        index: _TableIndex | None = None) -> tuple[_Merge, bool]:
     """
     Remove from the merge any entries which would be covered by entries
     between their current position and the merge insertion position.
@@ -512,8 +648,15 @@ def _refine_upcheck(merge: _Merge, min_goodness: int) -> tuple[_Merge, bool]:
         # covered up by any of them then we remove it from the merge.
         entry = merge.routing_table[i]
         key, mask = entry.key, entry.mask
-        if any(intersect(key, mask, other.key, other.mask) for other in
-               merge.routing_table[i+1:merge.insertion_index]):
+        if index is None:
+            covered = any(
+                intersect(key, mask, other.key, other.mask) for other in
+                merge.routing_table[i+1:merge.insertion_index])
+        else:
+            covered = any(
+                i < index.position(other) < merge.insertion_index
+                for other in index.intersecting_entries(key, mask))
+        if covered:
             # The entry would be partially or wholly covered by another entry,
             # remove it from the merge and return a new merge.
             merge = _Merge(merge.routing_table, merge.entries - {i})
@@ -529,7 +672,8 @@ def _refine_upcheck(merge: _Merge, min_goodness: int) -> tuple[_Merge, bool]:
 
 
 def _refine_downcheck(
-        merge: _Merge, aliases: _ROAliases, min_goodness: int) -> _Merge:
+        merge: _Merge, aliases: _ROAliases, min_goodness: int,
+        index: _TableIndex | None = None) -> _Merge:
     """
     Prune the merge to avoid it covering up any entries which are below the
     merge insertion position.
@@ -652,7 +796,7 @@ def _refine_downcheck(
     # While the merge is still worth considering continue to perform the
     # down-check.
     while merge.goodness > min_goodness:
-        covered = _get_covered_keys_and_masks(merge, aliases)
+        covered = _get_covered_keys_and_masks(merge, aliases, index)
 
         # For each covered entry work out which bits in the key-mask pair which
         # are not Xs are not covered by Xs in the merge key-mask pair. Only
@@ -729,7 +873,8 @@ def _refine_downcheck(
 
 
 def _get_covered_keys_and_masks(
-        merge: _Merge, aliases: _ROAliases) -> list[_KeyMask]:
+        merge: _Merge, aliases: _ROAliases,
+        index: _TableIndex | None = None) -> list[_KeyMask]:
     """
     Get keys and masks which would be covered by the entry resulting from
     the merge.
@@ -738,12 +883,19 @@ def _get_covered_keys_and_masks(
     :param aliases: {(key, mask): {(key, mask), ...}, ...}
         Map of key-mask pairs to the sets of key-mask pairs that they actually
         represent.
+    :param index:
+        Index of the routing table and aliases, or None to check every entry
     :return: (key, mask)
         Pairs of keys and masks which would be covered if the given `merge`
         were to be applied to the routing table.
     """
     # For every entry in the table below the insertion index see which keys
     # and masks would overlap with the key and mask of the merged entry.
+    if index is not None:
+        return [
+            (key, mask) for key, mask, entry in index.intersecting_aliases(
+                merge.key, merge.mask)
+            if index.position(entry) >= merge.insertion_index]
     covered: list[_KeyMask] = []
     for entry in merge.routing_table[merge.insertion_index:]:
         km = (entry.key, entry.mask)
@@ -0,0 +1,149 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+An index of a routing table which ordered covering keeps up to date as it
+merges entries, to find the entries intersecting a merge quickly.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from spinn_machine import MulticastRoutingEntry
+
+from pacman.operations.router_compressors.key_mask_index import KeyMaskIndex
+
+if TYPE_CHECKING:
+    from .ordered_covering import _KeyMask, _Merge, _ROAliases
+
+
+class _TableIndex:
+    """
+    Indices of the entries of a routing table, and of the key-mask pairs
+    each entry stands for (its aliases), with the position of each entry.
+    """
+
+    __slots__ = (
+        # KeyMaskIndex of the entries in the table
+        "_entries",
+        # KeyMaskIndex of (key, mask, entry) for each alias of each entry
+        "_aliases",
+        # id(entry) -> the aliases of the entry in _aliases
+        "_registered",
+        # (key, mask) -> entries in the table with that key and mask
+        "_by_key_mask",
+        # id(entry) -> position in the table
+        "_positions",
+    )
+
+    def __init__(self, routing_table: list[MulticastRoutingEntry],
+                 aliases: _ROAliases):
+        """
+        :param routing_table: The table to index
+        :param aliases: The aliases of the entries in the table
+        """
+        self._entries: KeyMaskIndex[MulticastRoutingEntry] = KeyMaskIndex()
+        self._aliases: KeyMaskIndex[
+            tuple[int, int, MulticastRoutingEntry]] = KeyMaskIndex()
+        self._registered: dict[int, frozenset[_KeyMask]] = dict()
+        self._by_key_mask: dict[
+            _KeyMask, list[MulticastRoutingEntry]] = defaultdict(list)
+        self._positions: dict[int, int] = dict()
+        for entry in routing_table:
+            self.__add(entry, aliases)
+        self.__update_positions(routing_table)
+
+    def __add(self, entry: MulticastRoutingEntry,
+              aliases: _ROAliases) -> None:
+        km = (entry.key, entry.mask)
+        self._entries.add(entry.key, entry.mask, entry)
+        self._by_key_mask[km].append(entry)
+        self.__register_aliases(entry, aliases.get(km, frozenset({km})))
+
+    def __register_aliases(self, entry: MulticastRoutingEntry,
+                           entry_aliases: frozenset[_KeyMask]) -> None:
+        self._registered[id(entry)] = entry_aliases
+        for key, mask in entry_aliases:
+            self._aliases.add(key, mask, (key, mask, entry))
+
+    def __unregister_aliases(self, entry: MulticastRoutingEntry) -> None:
+        for key, mask in self._registered.pop(id(entry)):
+            self._aliases.remove(key, mask, (key, mask, entry))
+
+    def __update_positions(
+            self, routing_table: list[MulticastRoutingEntry]) -> None:
+        self._positions = {
+            id(entry): i for i, entry in enumerate(routing_table)}
+
+    def position(self, entry: MulticastRoutingEntry) -> int:
+        """
+        :param entry: An entry in the table
+        :returns: The position of the entry in the table
+        """
+        return self._positions[id(entry)]
+
+    def intersecting_entries(
+            self, key: int, mask: int) -> Iterable[MulticastRoutingEntry]:
+        """
+        :param key:
+        :param mask: The key-mask pair to look for
+        :returns: The entries in the table intersecting the key-mask pair
+        """
+        return self._entries.intersecting(key, mask)
+
+    def intersecting_aliases(
+            self, key: int, mask: int
+            ) -> Iterable[tuple[int, int, MulticastRoutingEntry]]:
+        """
+        :param key:
+        :param mask: The key-mask pair to look for
+        :returns: The key and mask of each alias intersecting the key-mask
+            pair, and the entry in the table with that alias
+        """
+        return self._aliases.intersecting(key, mask)
+
+    def merge_applied(
+            self, merge: _Merge, routing_table: list[MulticastRoutingEntry],
+            aliases: _ROAliases) -> None:
+        """
+        Update the index after a merge has been applied.
+
+        :param merge: The merge which has been applied
+        :param routing_table: The routing table after the merge
+        :param aliases: The aliases after the merge
+        """
+        changed = {(merge.key, merge.mask)}
+        for i in merge.entries:
+            entry = merge.routing_table[i]
+            km = (entry.key, entry.mask)
+            changed.add(km)
+            self._entries.remove(entry.key, entry.mask, entry)
+            self._by_key_mask[km].remove(entry)
+            self.__unregister_aliases(entry)
+
+        # The new entry goes where the merge would insert it, less the
+        # entries removed from above that
+        position = merge.insertion_index - sum(
+            1 for i in merge.entries if i < merge.insertion_index)
+        self.__add(routing_table[position], aliases)
+
+        # Entries with the same key and mask as those changed share aliases
+        for km in changed:
+            for entry in self._by_key_mask[km]:
+                entry_aliases = aliases.get(km, frozenset({km}))
+                if self._registered[id(entry)] != entry_aliases:
+                    self.__unregister_aliases(entry)
+                    self.__register_aliases(entry, entry_aliases)
+        self.__update_positions(routing_table)
@@ -22,6 +22,7 @@ https://github.com/project-rig/rig/blob/master/rig/routing_table/remove_default_
 from spinn_machine import MulticastRoutingEntry
 
 from pacman.exceptions import MinimisationFailedError
+from pacman.operations.router_compressors.key_mask_index import KeyMaskIndex
 
 
 def intersect(key_a: int, mask_a: int, key_b: int, mask_b: int) -> bool:
@@ -91,15 +92,19 @@ def remove_default_routes(
         # Optimised case: no alias check so just remove default-routed entries
         new_table = [entry for entry in table if not entry.defaultable]
     else:
+        # Index of the entries after the one being looked at
+        later: KeyMaskIndex[MulticastRoutingEntry] = KeyMaskIndex()
+        for entry in table:
+            later.add(entry.key, entry.mask, entry)
         new_table = []
-        for i, entry in enumerate(table):
+        for entry in table:
+            later.remove(entry.key, entry.mask, entry)
             if not entry.defaultable:
                 # If the entry cannot be removed then add it to the table
                 new_table.append(entry)
             else:
                 # If there is an intersect with a later entry we must keep it
-                if any(intersect(entry.key, entry.mask, d.key, d.mask) for
-                       d in table[i + 1:]):
+                if later.any_intersecting(entry.key, entry.mask):
                     new_table.append(entry)
 
     if target_length and len(new_table) > target_length:
@@ -15,6 +15,8 @@
 import functools
 from typing import cast
 
+from spinn_utilities.overrides import overrides
+
 from spinn_machine import MulticastRoutingEntry, RoutingEntry
 
 from pacman.data import PacmanDataView
@@ -25,6 +27,7 @@ from pacman.model.routing_tables import (
 )
 
 from .abstract_compressor import AbstractCompressor
+from .key_mask_index import KeyMaskIndex
 
 
 def pair_compressor(
@@ -149,6 +152,10 @@ class _PairCompressor(AbstractCompressor):
 
     Step 2 is change in that the previous entries
     (0 to _previous_pointer(-1)) are not considered for clash checking
+
+    Unlike the C the clash checks look the entries up in a
+    :py:class:`KeyMaskIndex` rather than checking them all, which gives the
+    same answer.
     """
 
     __slots__ = (
@@ -159,8 +166,12 @@ class _PairCompressor(AbstractCompressor):
         "_c_sort",
         # Inclusive index of last entry in the array (length in python)
         "_max_index",
+        # Index of the entries 0 to _previous_index(-1); unordered only
+        "_previous_entries",
         # Exclusive pointer to the end of the entries for previous buckets
         "_previous_index",
+        # Index of the entries _remaining_index to _max_index
+        "_remaining_entries",
         # Inclusive index to the first entry for later buckets
         "_remaining_index",
         # C does not support dict so to get the histogram we use arrays
@@ -192,6 +203,10 @@ class _PairCompressor(AbstractCompressor):
         self._max_index = 0
         self._previous_index = 0
         self._remaining_index = 0
+        self._previous_entries: KeyMaskIndex[MulticastRoutingEntry] = \
+            KeyMaskIndex()
+        self._remaining_entries: KeyMaskIndex[MulticastRoutingEntry] = \
+            KeyMaskIndex()
         self._routes: list[int] = []
         self._routes_frequency: list[int] = []
         self._routes_count = 0
@@ -346,18 +361,10 @@ class _PairCompressor(AbstractCompressor):
         m_key, m_mask, defaultable = self.merge(
             self._all_entries[left], self._all_entries[index])
         if not self.ordered:
-            for check in range(self._previous_index):
-                if self.intersect(
-                        self._all_entries[check].key,
-                        self._all_entries[check].mask,
-                        m_key, m_mask):
-                    return False
-        for check in range(self._remaining_index, self._max_index + 1):
-            if self.intersect(
-                    self._all_entries[check].key,
-                    self._all_entries[check].mask,
-                    m_key, m_mask):
+            if self._previous_entries.any_intersecting(m_key, m_mask):
                 return False
+        if self._remaining_entries.any_intersecting(m_key, m_mask):
+            return False
         self._all_entries[left] = MulticastRoutingEntry(
             m_key, m_mask, RoutingEntry(
                 defaultable=defaultable,
@@ -404,6 +411,10 @@ class _PairCompressor(AbstractCompressor):
         self._routes_frequency[self._routes_count] = 1
         self._routes_count += 1
 
+    @overrides(AbstractCompressor._cache_description)
+    def _cache_description(self) -> str:
+        return f"{super()._cache_description()}(c_sort={self._c_sort})"
+
     def compress_table(
             self, router_table: AbstractMulticastRoutingTable
             ) -> list[MulticastRoutingEntry]:
@@ -452,6 +463,10 @@ class _PairCompressor(AbstractCompressor):
         self._write_index = 0
         self._max_index = len(self._all_entries) - 1
         self._previous_index = 0
+        self._previous_entries = KeyMaskIndex()
+        self._remaining_entries = KeyMaskIndex()
+        for entry in self._all_entries:
+            self._remaining_entries.add(entry.key, entry.mask, entry)
         left = 0
 
         while left <= self._max_index:
@@ -461,8 +476,14 @@ class _PairCompressor(AbstractCompressor):
                    == self._all_entries[left].spinnaker_route):
                 right += 1
             self._remaining_index = right + 1
+            for entry in self._all_entries[left:right + 1]:
+                self._remaining_entries.remove(entry.key, entry.mask, entry)
             self._compress_by_route(left, right)
             left = right + 1
+            if not self.ordered:
+                for entry in self._all_entries[
+                        self._previous_index:self._write_index]:
+                    self._previous_entries.add(entry.key, entry.mask, entry)
             self._previous_index = self._write_index
 
         return self._all_entries[0:self._write_index]
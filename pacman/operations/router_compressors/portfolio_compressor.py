@@ -0,0 +1,274 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+from collections import Counter
+from datetime import timedelta
+from typing import NamedTuple, cast
+
+from spinn_utilities.config_holder import get_config_bool
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.progress_bar import ProgressBar
+from spinn_utilities.timer import Timer
+
+from pacman.data import PacmanDataView
+from pacman.exceptions import MinimisationFailedError
+from pacman.model.routing_tables import (
+    AbstractMulticastRoutingTable,
+    CompressedMulticastRoutingTable,
+    MulticastRoutingTables,
+    UnCompressedMulticastRoutingTable,
+)
+from pacman.utilities.algorithm_utilities.parallel_utilities import (
+    get_n_mapping_processes,
+    map_in_processes,
+)
+from pacman.utilities.instrumentation import span
+
+from .ordered_covering_router_compressor.ordered_covering import (
+    ordered_covering,
+)
+from .ordered_covering_router_compressor.utils import remove_default_routes
+from .pair_compressor import _PairCompressor
+from .ranged_compressor import RangeCompressor
+from .routing_compression_checker import compare_tables
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The strategy name of a table which no compressor made smaller
+NONE = "none"
+#: The strategy name of :py:class:`RangeCompressor`
+RANGE = "range"
+#: The strategy name of the pair compressor
+PAIR = "pair"
+#: The strategy name of the ordered covering compressor
+ORDERED_COVERING = "ordered_covering"
+
+
+class PortfolioRecord(NamedTuple):
+    """
+    How the portfolio compressor compressed the table of one chip.
+    """
+    #: The x-coordinate of the chip
+    x: int
+    #: The y-coordinate of the chip
+    y: int
+    #: The number of entries before compression
+    n_original: int
+    #: The number of entries in the table used
+    n_compressed: int
+    #: The strategy whose table was used
+    strategy: str
+    #: The time taken by each strategy tried, in the order they were tried
+    times: dict[str, timedelta]
+
+
+@span("portfolio_compressor")
+def portfolio_compressor(
+        accept_overflow: bool = False) -> MulticastRoutingTables:
+    """
+    Compresses each table with the cheapest of several compressors which
+    makes it small enough.
+
+    :param accept_overflow:
+        A flag which should only be used in testing to stop raising an
+        exception if result is too big
+    :returns: Compressed routing tables
+    """
+    compressor = PortfolioCompressor(accept_overflow)
+    router_tables = PacmanDataView.get_precompressed()
+    progress = ProgressBar(
+        router_tables.routing_tables,
+        "Compressing routing Tables using the portfolio compressor")
+    compressed = compressor.compress_tables(router_tables, progress)
+    compressor.log_summary()
+    return compressed
+
+
+class PortfolioCompressor:
+    """
+    A compressor which tries the compressors in order of cost on each
+    table, stopping as soon as the table will fit in the router.
+
+    First :py:class:`RangeCompressor` is tried, then the ordered pair
+    compressor and last ordered covering, each on the original table.
+    The pair compressor is skipped if the table has more routes than the
+    router has entries, as it can only hold that many routes.
+    If no compressor makes the table small enough the smallest table is
+    used, and :py:meth:`compress_tables` decides if that is an error.
+
+    If ``router_table_compress_as_far_as_possible`` is set in the
+    ``Mapping`` section of the configuration all are tried and the
+    smallest table is used, preferring the cheaper compressor when equal.
+
+    Use via :py:func:`portfolio_compressor`, or directly to see the
+    :py:attr:`records` of which compressor was used for each table.
+    """
+
+    __slots__ = (
+        # Flag to say that results too large should be ignored
+        "_accept_overflow",
+        # What was done with each table compressed by compress_tables
+        "_records")
+
+    def __init__(self, accept_overflow: bool = False):
+        """
+        :param accept_overflow:
+            Flag to say that results too large should be ignored
+        """
+        self._accept_overflow = accept_overflow
+        self._records: list[PortfolioRecord] = []
+
+    @property
+    def records(self) -> list[PortfolioRecord]:
+        """
+        What was done with each table by :py:meth:`compress_tables`.
+        """
+        return self._records
+
+    def compress_table(
+            self, router_table: AbstractMulticastRoutingTable
+            ) -> tuple[AbstractMulticastRoutingTable, PortfolioRecord]:
+        """
+        Compress the table for one chip.
+
+        :param router_table: Original unordered routing table for a chip
+        :return: The compressed table, which may be ordered, and a record of
+            how it was compressed
+        """
+        chip = PacmanDataView.get_chip_at(router_table.x, router_table.y)
+        target = chip.router.n_available_multicast_entries
+        as_needed = not get_config_bool(
+            "Mapping", "router_table_compress_as_far_as_possible")
+        times: dict[str, timedelta] = {}
+        best = router_table
+        strategy = NONE
+
+        def fits() -> bool:
+            return as_needed and best.number_of_entries <= target
+
+        def try_strategy(
+                name: str, table: AbstractMulticastRoutingTable,
+                timer: Timer) -> None:
+            nonlocal best, strategy
+            assert timer.measured_interval is not None
+            times[name] = timer.measured_interval
+            if table.number_of_entries < best.number_of_entries:
+                best = table
+                strategy = name
+
+        if fits():
+            return best, PortfolioRecord(
+                router_table.x, router_table.y, router_table.number_of_entries,
+                best.number_of_entries, strategy, times)
+
+        with Timer() as timer:
+            ranged = RangeCompressor().compress_table(
+                cast(UnCompressedMulticastRoutingTable, router_table))
+        try_strategy(RANGE, ranged, timer)
+
+        # The pair compressor has space for only as many routes as entries
+        n_routes = len({entry.spinnaker_route
+                        for entry in router_table.multicast_routing_entries})
+        if not fits() and n_routes <= target:
+            with Timer() as timer:
+                paired = CompressedMulticastRoutingTable(
+                    router_table.x, router_table.y,
+                    _PairCompressor(ordered=True).compress_table(
+                        router_table))
+            try_strategy(PAIR, paired, timer)
+
+        if not fits():
+            with Timer() as timer:
+                entries, _ = ordered_covering(
+                    routing_table=router_table.multicast_routing_entries,
+                    target_length=target if as_needed else None,
+                    aliases={}, no_raise=True)
+                # The target is checked by compress_tables as it may not
+                # have been reached
+                covered = CompressedMulticastRoutingTable(
+                    router_table.x, router_table.y,
+                    remove_default_routes(entries, None))
+            try_strategy(ORDERED_COVERING, covered, timer)
+
+        return best, PortfolioRecord(
+            router_table.x, router_table.y, router_table.number_of_entries,
+            best.number_of_entries, strategy, times)
+
+    def compress_tables(
+            self, router_tables: MulticastRoutingTables,
+            progress: ProgressBar) -> MulticastRoutingTables:
+        """
+        Compress the given unordered routing tables, adding a record of
+        each to :py:attr:`records`.
+
+        The tables are shared between the number of processes set by
+        ``n_mapping_processes`` in the ``Mapping`` section of the
+        configuration.
+
+        :param router_tables: Routing tables
+        :param progress: Progress bar to show while working
+        :return: The compressed and possibly ordered routing tables
+        :raises MinimisationFailedError:
+            If a table does not fit and overflow is not accepted
+        """
+        compressed_tables = MulticastRoutingTables()
+        problems = ""
+        check = get_config_bool("Mapping", "router_table_compression_check")
+        for table, (new_table, record) in progress.over(zip(
+                router_tables.routing_tables, map_in_processes(
+                    _compress_table, list(router_tables.routing_tables),
+                    get_n_mapping_processes()))):
+            self._records.append(record)
+            if check and new_table is not table:
+                compare_tables(table, new_table)
+            chip = PacmanDataView.get_chip_at(new_table.x, new_table.y)
+            if (new_table.number_of_entries >
+                    chip.router.n_available_multicast_entries):
+                problems += (
+                    f"(x:{new_table.x},y:{new_table.y})="
+                    f"{new_table.number_of_entries} ")
+            compressed_tables.add_routing_table(new_table)
+
+        if problems:
+            if not self._accept_overflow:
+                raise MinimisationFailedError(
+                    "The routing table after compression will still not fit"
+                    f" within the machines router: {problems}")
+            logger.warning(problems)
+        return compressed_tables
+
+    def log_summary(self) -> None:
+        """
+        Log how many tables each strategy was used for, and the total time
+        taken by each strategy.
+        """
+        used = Counter(record.strategy for record in self._records)
+        total_times: dict[str, timedelta] = {}
+        for record in self._records:
+            for name, taken in record.times.items():
+                total_times[name] = total_times.get(name, timedelta()) + taken
+        for name in (NONE, RANGE, PAIR, ORDERED_COVERING):
+            if name in used or name in total_times:
+                logger.info(
+                    f"Portfolio compressor used {name} for {used[name]} "
+                    f"tables, taking {total_times.get(name, timedelta())}")
+
+
+def _compress_table(
+        table: AbstractMulticastRoutingTable
+        ) -> tuple[AbstractMulticastRoutingTable, PortfolioRecord]:
+    """
+    Compress one table; at module level so worker processes can find it.
+    """
+    return PortfolioCompressor().compress_table(table)
@@ -30,12 +30,29 @@ from pacman.model.routing_tables import (
     MulticastRoutingTables,
     UnCompressedMulticastRoutingTable,
 )
+from pacman.utilities.algorithm_utilities.parallel_utilities import (
+    get_n_mapping_processes,
+    map_in_processes,
+)
+from pacman.utilities.instrumentation import span
+
+from .compression_cache import get_compression_cache, log_cache_statistics
+from .routing_compression_checker import compare_tables
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
 
+@span("range_compressor")
 def range_compressor(accept_overflow: bool = True) -> MulticastRoutingTables:
     """
+    Compresses each table by merging ranges of keys with the same route.
+
+    The tables are shared between the number of processes set by
+    ``n_mapping_processes`` in the ``Mapping`` section of the configuration.
+    If ``compression_cache_directory`` is set in the same section, tables
+    compressed in earlier runs are taken from the
+    :py:class:`CompressionCache` rather than compressed again.
+
     :param accept_overflow:
         A flag which should only be used in testing to stop raising an
         exception if result is too big
@@ -48,11 +65,48 @@ def range_compressor(accept_overflow: bool = True) -> MulticastRoutingTables:
     router_tables = PacmanDataView.get_uncompressed()
     assert router_tables is not None
     progress = ProgressBar(len(router_tables.routing_tables), message)
-    compressor = RangeCompressor()
     compressed_tables = MulticastRoutingTables()
+    as_needed = not get_config_bool(
+        "Mapping", "router_table_compress_as_far_as_possible")
+
+    # Look up the results of earlier runs, and note where to save new ones
+    cache = get_compression_cache()
+    cached: dict[tuple[int, int], list[MulticastRoutingEntry]] = {}
+    cache_keys: dict[tuple[int, int], str] = {}
+    to_compress: list[UnCompressedMulticastRoutingTable] = []
+    for table in router_tables.routing_tables:
+        chip = PacmanDataView.get_chip_at(table.x, table.y)
+        target = chip.router.n_available_multicast_entries
+        # Tables left as they are are not worth caching
+        if cache is not None and not (
+                as_needed and table.number_of_entries < target):
+            key = cache.cache_key(
+                table, RangeCompressor.__name__,
+                target if as_needed else None)
+            entries = cache.get(key)
+            if entries is not None:
+                cached[table.x, table.y] = entries
+                continue
+            cache_keys[table.x, table.y] = key
+        to_compress.append(cast(UnCompressedMulticastRoutingTable, table))
+
+    check = get_config_bool("Mapping", "router_table_compression_check")
+    new_tables = map_in_processes(
+        _compress_table, to_compress, get_n_mapping_processes())
     for table in progress.over(router_tables.routing_tables):
-        new_table = compressor.compress_table(cast(
-            UnCompressedMulticastRoutingTable, table))
+        new_table: AbstractMulticastRoutingTable
+        if (table.x, table.y) in cached:
+            new_table = CompressedMulticastRoutingTable(
+                table.x, table.y, cached[table.x, table.y])
+        else:
+            new_table = next(new_tables)
+            if (table.x, table.y) in cache_keys:
+                assert cache is not None
+                cache.put(
+                    cache_keys[table.x, table.y],
+                    new_table.multicast_routing_entries)
+        if check and new_table is not table:
+            compare_tables(table, new_table)
         chip = PacmanDataView.get_chip_at(table.x, table.y)
         target = chip.router.n_available_multicast_entries
         if new_table.number_of_entries > target and not accept_overflow:
@@ -61,11 +115,22 @@ def range_compressor(accept_overflow: bool = True) -> MulticastRoutingTables:
                 f"{table.number_of_entries} entries after compression "
                 f"still has {new_table.number_of_entries} so will not fit")
         compressed_tables.add_routing_table(new_table)
+    if cache is not None:
+        log_cache_statistics(cache)
     logger.info(f"Ranged compressor resulted with the largest table of size "
                 f"{compressed_tables.get_max_number_of_entries()}")
     return compressed_tables
 
 
+def _compress_table(
+        table: UnCompressedMulticastRoutingTable
+        ) -> AbstractMulticastRoutingTable:
+    """
+    Compress one table; at module level so worker processes can find it.
+    """
+    return RangeCompressor().compress_table(table)
+
+
 class RangeCompressor:
     """
     A compressor based on ranges.
@@ -13,8 +13,12 @@
 # limitations under the License.
 
 import logging
+from collections.abc import Sequence
 from typing import TextIO
 
+import numpy
+from numpy.typing import NDArray
+
 from spinn_utilities.log import FormatAdapter
 
 from spinn_machine import MulticastRoutingEntry
@@ -26,6 +30,8 @@ from pacman.utilities.algorithm_utilities.routes_format import format_route
 logger = FormatAdapter(logging.getLogger(__name__))
 WILDCARD = "*"
 LINE_FORMAT = "0x{:08X} 0x{:08X} 0x{:08X} {: <7s} {}\n"
+# Number of original entries matched against the compressed table at once
+_CHUNK_SIZE = 256
 
 
 def codify(route: MulticastRoutingEntry, length: int = 32) -> str:
@@ -163,12 +169,109 @@ def compare_tables(
     """
     Compares the two tables without generating any output.
 
+    This finds the same errors as :py:func:`compare_route` on each original
+    route, but works on the keys and masks as integers, most of them at
+    once, rather than as strings.
+
     :param original: The original routing tables
     :param compressed:
         The compressed routing tables.
         Which will be considered in order.
     :raises: PacmanRoutingException if there is any error
     """
-    compressed_dict = codify_table(compressed)
-    for o_route in original.multicast_routing_entries:
-        compare_route(o_route, compressed_dict)
+    # As in codify_table a later entry with the same key and mask replaces
+    # the earlier one, but keeps its place
+    by_code: dict[tuple[int, int], MulticastRoutingEntry] = {}
+    for c_route in compressed.multicast_routing_entries:
+        by_code[c_route.key & c_route.mask, c_route.mask] = c_route
+    c_routes = list(by_code.values())
+    c_keys = numpy.array([key for key, _ in by_code], dtype=numpy.uint32)
+    c_masks = numpy.array([mask for _, mask in by_code], dtype=numpy.uint32)
+
+    o_routes = list(original.multicast_routing_entries)
+    easy = numpy.zeros(len(o_routes), dtype=numpy.bool_)
+    if c_routes and o_routes:
+        c_spinnaker_routes = numpy.array(
+            [route.spinnaker_route for route in c_routes],
+            dtype=numpy.uint32)
+        c_defaultable = numpy.array(
+            [route.defaultable for route in c_routes], dtype=numpy.bool_)
+        o_masks = numpy.array(
+            [route.mask for route in o_routes], dtype=numpy.uint32)
+        o_keys = numpy.array(
+            [route.key for route in o_routes], dtype=numpy.uint32) & o_masks
+        o_spinnaker_routes = numpy.array(
+            [route.spinnaker_route for route in o_routes],
+            dtype=numpy.uint32)
+        o_defaultable = numpy.array(
+            [route.defaultable for route in o_routes], dtype=numpy.bool_)
+
+        # Most original routes are wholly inside the first compressed route
+        # they meet, with the same route, which needs no more checking
+        for start in range(0, len(o_routes), _CHUNK_SIZE):
+            end = start + _CHUNK_SIZE
+            keys = o_keys[start:end, numpy.newaxis]
+            masks = o_masks[start:end, numpy.newaxis]
+            meets = (keys & c_masks) == (c_keys & masks)
+            first = meets.argmax(axis=1)
+            easy[start:end] = (
+                meets.any(axis=1) &
+                (c_spinnaker_routes[first] == o_spinnaker_routes[start:end]) &
+                (c_masks[first] & ~o_masks[start:end] == 0) &
+                ~(c_defaultable[first] & ~o_defaultable[start:end]))
+
+    for index in numpy.flatnonzero(~easy):
+        _compare_route_bits(o_routes[index], c_routes, c_keys, c_masks)
+
+
+def _compare_route_bits(
+        o_route: MulticastRoutingEntry,
+        c_routes: Sequence[MulticastRoutingEntry],
+        c_keys: NDArray[numpy.uint32], c_masks: NDArray[numpy.uint32]) -> None:
+    """
+    As :py:func:`compare_route`, with the codes of the original route and
+    its remainders as integer key-mask pairs.
+
+    :param o_route: the original route
+    :param c_routes: Compressed routes
+    :param c_keys: The keys of the compressed routes, masked
+    :param c_masks: The masks of the compressed routes
+    """
+    # Codes still to check, each with the index of the first compressed
+    # route to look at; popped in the order compare_route recurses
+    to_check = [(o_route.key & o_route.mask, o_route.mask, 0)]
+    while to_check:
+        key, mask, start = to_check.pop()
+        meets = numpy.flatnonzero(
+            (c_keys[start:] & mask) == (c_masks[start:] & key))
+        if meets.size == 0:
+            if not o_route.defaultable:
+                raise PacmanRoutingException(f"No route found {o_route}")
+            continue
+        index = start + int(meets[0])
+        c_route = c_routes[index]
+        if o_route.processor_ids != c_route.processor_ids:
+            raise PacmanRoutingException(
+                f"Compressed route {c_route} covers original route "
+                f"{o_route} but has a different processor_ids.")
+        if o_route.link_ids != c_route.link_ids:
+            raise PacmanRoutingException(
+                f"Compressed route {c_route} covers original route "
+                f"{o_route} but has a different link_ids.")
+        if not o_route.defaultable and c_route.defaultable:
+            if o_route == c_route:
+                raise PacmanRoutingException(
+                    f"Compressed route {c_route} while original route "
+                    f"{o_route} but has a different defaultable value.")
+            to_check.append((key, mask, index + 1))
+        else:
+            # The parts not covered, lowest bit first like _calc_remainders
+            c_key = int(c_keys[index])
+            split = int(c_masks[index]) & ~mask
+            remainders = []
+            while split:
+                bit = split & -split
+                split ^= bit
+                remainders.append(
+                    (key | (~c_key & bit), mask | bit, index + 1))
+            to_check.extend(reversed(remainders))
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .key_space_report import KeySpaceReport, key_space_report
 from .zoned_routing_info_allocator import ZonedRoutingInfoAllocator
 
-__all__ = ['ZonedRoutingInfoAllocator']
+__all__ = ['KeySpaceReport', 'ZonedRoutingInfoAllocator', 'key_space_report']
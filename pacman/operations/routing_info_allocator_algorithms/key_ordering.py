@@ -0,0 +1,286 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Functions to order the application / partition (``AP``) indices of the
+:py:class:`ZonedRoutingInfoAllocator` so that partitions which follow the
+same routes get adjacent keys, which the compressors can then merge.
+"""
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple, TypeVar
+
+from spinn_utilities.typing.coords import XY
+
+from spinn_machine import RoutingEntry
+
+from pacman.model.graphs.application import (
+    ApplicationEdgePartition,
+    ApplicationVertex,
+)
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.routing_table_by_partition import (
+    MulticastRoutingTableByPartition,
+)
+from pacman.utilities.algorithm_utilities.routing_algorithm_utilities import (
+    vertex_xy_and_route,
+)
+
+#: The application vertex and partition identifier of a partition
+AppPartition = tuple[ApplicationVertex, str]
+
+#: Route word used when a partition needs more than one entry on a chip
+MIXED_ROUTES = -1
+
+#: :meta private:
+K = TypeVar("K")
+
+
+class KeyOrderingReport(NamedTuple):
+    """
+    Estimated routing table sizes with the default and the route based
+    ordering of the application / partition indices.
+    """
+    #: Sum of the estimated table sizes using the default ordering
+    default_total: int
+    #: Largest estimated table size using the default ordering
+    default_max: int
+    #: Sum of the estimated table sizes using the route based ordering
+    ordered_total: int
+    #: Largest estimated table size using the route based ordering
+    ordered_max: int
+
+
+def get_route_signatures(
+        partitions: Sequence[ApplicationEdgePartition],
+        routes: MulticastRoutingTableByPartition | None
+        ) -> dict[AppPartition, dict[XY, int]]:
+    """
+    Get the route word each partition uses on each chip.
+
+    If routes are not available (yet) they are estimated from the placement
+    of the targets of each partition, which gives just the last chip of
+    each route.
+
+    :param partitions: The application partitions to get the routes of
+    :param routes: The routes if known or None to estimate from placements
+    :return: For each application vertex and partition identifier,
+        the route word on each chip.
+        ``MIXED_ROUTES`` marks a chip on which the machine vertices of the
+        partition use different routes.
+    """
+    signatures: dict[AppPartition, dict[XY, int]] = {
+        (p.pre_vertex, p.identifier): dict() for p in partitions}
+    if routes is None:
+        for partition in partitions:
+            __estimate_signature(
+                partition, signatures[partition.pre_vertex,
+                                      partition.identifier])
+        return signatures
+
+    for xy in routes.get_routers():
+        entries = routes.get_entries_for_router(*xy)
+        if entries is None:
+            continue
+        for (vertex, partition_id), entry in entries.items():
+            if isinstance(vertex, MachineVertex):
+                app_vertex = vertex.app_vertex
+            else:
+                assert isinstance(vertex, ApplicationVertex)
+                app_vertex = vertex
+            signature = signatures.get((app_vertex, partition_id))
+            if signature is None:
+                continue
+            route = signature.get(xy)
+            if route is None:
+                signature[xy] = entry.spinnaker_route
+            elif route != entry.spinnaker_route:
+                signature[xy] = MIXED_ROUTES
+    return signatures
+
+
+def __estimate_signature(
+        partition: ApplicationEdgePartition,
+        signature: dict[XY, int]) -> None:
+    processors: dict[XY, set[int]] = defaultdict(set)
+    links: dict[XY, set[int]] = defaultdict(set)
+    for edge in partition.edges:
+        post_splitter = edge.post_vertex.splitter
+        for m_vertex in post_splitter.get_in_coming_vertices(
+                partition.identifier):
+            xy, (_, core, link) = vertex_xy_and_route(m_vertex)
+            if core is not None:
+                processors[xy].add(core)
+            if link is not None:
+                links[xy].add(link)
+    for xy in set(processors) | set(links):
+        signature[xy] = RoutingEntry(
+            processor_ids=processors[xy],
+            link_ids=links[xy]).spinnaker_route
+
+
+def group_by_route_similarity(
+        keys: Sequence[K],
+        signatures: dict[K, dict[XY, int]]) -> list[list[K]]:
+    """
+    Group together the keys with identical routes, and order the groups so
+    that each is followed by the one which shares the most chip routes with
+    it.
+
+    :param keys: The keys in default order, which is used to break ties
+    :param signatures: The route word on each chip for each key
+    :return: The groups of keys in the order to allocate them
+    """
+    groups: list[list[K]] = []
+    group_items: list[frozenset[tuple[XY, int]]] = []
+    by_items: dict[frozenset[tuple[XY, int]], int] = dict()
+    for key in keys:
+        items = frozenset(
+            (xy, route) for xy, route in signatures.get(key, {}).items()
+            if route != MIXED_ROUTES)
+        index = by_items.get(items)
+        if index is None:
+            by_items[items] = len(groups)
+            groups.append([key])
+            group_items.append(items)
+        else:
+            groups[index].append(key)
+
+    # Which groups use each route on each chip
+    groups_by_item: dict[tuple[XY, int], list[int]] = defaultdict(list)
+    for index, items in enumerate(group_items):
+        for item in items:
+            groups_by_item[item].append(index)
+
+    # Chain the groups greedily by most shared items
+    ordered: list[list[K]] = []
+    unvisited = set(range(len(groups)))
+    next_default = 0
+    current = 0
+    while unvisited:
+        unvisited.remove(current)
+        ordered.append(groups[current])
+        shared: dict[int, int] = defaultdict(int)
+        for item in group_items[current]:
+            for other in groups_by_item[item]:
+                if other in unvisited:
+                    shared[other] += 1
+        if shared:
+            current = max(shared, key=lambda g: (shared[g], -g))
+        elif unvisited:
+            while next_default not in unvisited:
+                next_default += 1
+            current = next_default
+    return ordered
+
+
+def assign_indices(
+        groups: Iterable[Sequence[K]], n_indices: int,
+        blocked: Iterable[int], align: bool) -> dict[K, int] | None:
+    """
+    Give each key an index with the keys of each group given adjacent
+    indices.
+
+    :param groups: The groups of keys in the order to allocate them
+    :param n_indices: The number of indices available
+    :param blocked: Indices which may not be used
+    :param align: If True each group is put in a block of indices whose
+        size is a power of two and which starts on a multiple of that size
+    :return: The index of each key, or None if they do not fit
+    """
+    blocked = set(blocked)
+    indices: dict[K, int] = dict()
+    start = 0
+    for group in groups:
+        size = len(group)
+        if align and size > 1:
+            size = 1 << (size - 1).bit_length()
+            start = -(-start // size) * size
+            while any(i in blocked for i in range(start, start + size)):
+                start += size
+        else:
+            while start in blocked:
+                start += 1
+        index = start
+        for key in group:
+            while index in blocked:
+                index += 1
+            indices[key] = index
+            index += 1
+        start = max(index, start + size)
+        if index > n_indices:
+            return None
+    return indices
+
+
+def estimate_table_sizes(
+        signatures: dict[K, dict[XY, int]],
+        indices: dict[K, int]) -> dict[XY, int]:
+    """
+    Estimate the size of each routing table after merging adjacent indices
+    with the same route into aligned power of two blocks.
+
+    Indices not routed through a chip are free to be covered by a block, as
+    no packets with those keys reach that chip.
+
+    :param signatures: The route word on each chip for each key
+    :param indices: The index given to each key
+    :return: The estimated number of entries on each chip
+    """
+    by_chip: dict[XY, list[tuple[int, int]]] = defaultdict(list)
+    for key, index in indices.items():
+        for xy, route in signatures.get(key, {}).items():
+            by_chip[xy].append((index, route))
+
+    sizes: dict[XY, int] = dict()
+    for xy, entries in by_chip.items():
+        entries.sort()
+        n_entries = 0
+        first = 0
+        while first < len(entries):
+            route = entries[first][1]
+            last = first
+            if route != MIXED_ROUTES:
+                while (last + 1 < len(entries) and
+                       entries[last + 1][1] == route):
+                    last += 1
+            low = entries[first - 1][0] + 1 if first > 0 else 0
+            high = (entries[last + 1][0] - 1 if last + 1 < len(entries)
+                    else entries[last][0] + (1 << 32))
+            n_entries += __n_blocks(
+                entries[first][0], entries[last][0], low, high)
+            first = last + 1
+        sizes[xy] = n_entries
+    return sizes
+
+
+def __n_blocks(first: int, last: int, low: int, high: int) -> int:
+    """
+    Count the aligned power of two blocks needed to cover first to last
+    without going outside low to high.
+    """
+    n_blocks = 0
+    current = first
+    while current <= last:
+        size = 1
+        while True:
+            bigger = size << 1
+            start = current - (current % bigger)
+            if start < low or start + bigger - 1 > high:
+                break
+            size = bigger
+            if start + size > last:
+                break
+        current = current - (current % size) + size
+        n_blocks += 1
+    return n_blocks
@@ -0,0 +1,263 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import NamedTuple, TextIO
+
+from pacman.data import PacmanDataView
+from pacman.model.graphs import AbstractVertex
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.routing_info import (
+    AppVertexRoutingInfo,
+    MachineVertexRoutingInfo,
+    RoutingInfo,
+)
+from pacman.utilities.constants import BITS_IN_KEY
+from pacman.utilities.utility_calls import allocator_bits_needed
+
+
+class KeySpaceUsage(NamedTuple):
+    """
+    The keys allocated to and used by one partition of one vertex.
+    """
+    #: The vertex sending the keys
+    vertex: AbstractVertex
+    #: The identifier of the partition
+    partition_id: str
+    #: The number of keys the mask covers
+    n_keys_allocated: int
+    #: The number of keys the vertex asked for
+    n_keys_used: int
+    #: True if the keys were fixed by the vertex rather than the allocator
+    is_fixed: bool
+
+
+class ZoneLimit(NamedTuple):
+    """
+    The bits one application partition needs in each zone.
+    """
+    #: The application vertex sending the keys
+    vertex: ApplicationVertex
+    #: The identifier of the partition
+    partition_id: str
+    #: The bits needed to give each machine vertex a different index
+    machine_bits: int
+    #: The bits needed for the keys of the largest machine vertex
+    atom_bits: int
+
+
+class KeySpaceReport:
+    """
+    An analysis of how much of the 32-bit key space the allocated keys use,
+    and which partitions force the global zone widths.
+
+    Only the keys actually used can be sent, so the rest of each allocated
+    range is wasted.  Reducing the machine vertices or the atoms per core of
+    the partitions that set the zone widths frees bits for all the others.
+    """
+
+    __slots__ = (
+        "_app_usage",
+        "_atom_bits_without_limits",
+        "_machine_bits_without_limits",
+        "_machine_usage",
+        "_routing_info",
+        "_zone_limits")
+
+    def __init__(self, routing_info: RoutingInfo):
+        """
+        :param routing_info: The routing information to analyse
+        """
+        self._routing_info = routing_info
+        self._machine_usage: list[KeySpaceUsage] = []
+        self._app_usage: list[KeySpaceUsage] = []
+        self._zone_limits: list[ZoneLimit] = []
+
+        used_by_app: dict[tuple[AbstractVertex, str], int] = {}
+        for info in routing_info:
+            if not isinstance(info, MachineVertexRoutingInfo):
+                continue
+            n_keys = info.vertex.get_n_keys_for_partition(info.partition_id)
+            self._machine_usage.append(KeySpaceUsage(
+                info.vertex, info.partition_id, info.key_and_mask.n_keys,
+                n_keys, info.has_fixed_keys))
+            app_key = (info.app_vertex, info.partition_id)
+            used_by_app[app_key] = used_by_app.get(app_key, 0) + n_keys
+
+        for info in routing_info:
+            if not isinstance(info, AppVertexRoutingInfo):
+                continue
+            self._app_usage.append(KeySpaceUsage(
+                info.vertex, info.partition_id, info.key_and_mask.n_keys,
+                used_by_app.get((info.vertex, info.partition_id), 0),
+                info.has_fixed_keys))
+            if info.has_fixed_keys:
+                continue
+            machine_vertices = info.vertex.splitter.get_out_going_vertices(
+                info.partition_id)
+            max_keys = max((
+                m_vertex.get_n_keys_for_partition(info.partition_id)
+                for m_vertex in machine_vertices), default=0)
+            self._zone_limits.append(ZoneLimit(
+                info.vertex, info.partition_id,
+                allocator_bits_needed(len(machine_vertices)),
+                allocator_bits_needed(max_keys)))
+
+        self._machine_bits_without_limits = max((
+            limit.machine_bits for limit in self._zone_limits
+            if limit.machine_bits < routing_info.max_bits_machine),
+            default=0)
+        self._atom_bits_without_limits = max((
+            limit.atom_bits for limit in self._zone_limits
+            if limit.atom_bits < routing_info.max_bits_atoms),
+            default=0)
+
+    @property
+    def machine_usage(self) -> list[KeySpaceUsage]:
+        """
+        The keys allocated to and used by each machine vertex partition.
+        """
+        return self._machine_usage
+
+    @property
+    def app_usage(self) -> list[KeySpaceUsage]:
+        """
+        The keys allocated to and used by each application vertex partition.
+        """
+        return self._app_usage
+
+    @property
+    def n_keys_allocated(self) -> int:
+        """
+        The total number of keys allocated to application vertex partitions.
+        """
+        return sum(usage.n_keys_allocated for usage in self._app_usage)
+
+    @property
+    def n_keys_used(self) -> int:
+        """
+        The total number of keys asked for by the machine vertices.
+        """
+        return sum(usage.n_keys_used for usage in self._machine_usage)
+
+    @property
+    def fragmentation(self) -> float:
+        """
+        The fraction of the allocated keys which are never sent.
+        """
+        n_keys_allocated = self.n_keys_allocated
+        if n_keys_allocated == 0:
+            return 0.0
+        return 1.0 - self.n_keys_used / n_keys_allocated
+
+    @property
+    def key_space_allocated(self) -> float:
+        """
+        The fraction of the whole 32-bit key space allocated.
+        """
+        return self.n_keys_allocated / 2 ** BITS_IN_KEY
+
+    @property
+    def zone_limits(self) -> list[ZoneLimit]:
+        """
+        The bits needed in each zone by each allocated (not fixed)
+        application vertex partition.
+        """
+        return self._zone_limits
+
+    @property
+    def machine_limiting(self) -> list[ZoneLimit]:
+        """
+        The partitions with the most machine vertices, which set the
+        width of the machine zone.
+        """
+        return [limit for limit in self._zone_limits
+                if limit.machine_bits == self._routing_info.max_bits_machine]
+
+    @property
+    def atom_limiting(self) -> list[ZoneLimit]:
+        """
+        The partitions with the most keys in a machine vertex, which set the
+        width of the atom zone.
+        """
+        return [limit for limit in self._zone_limits
+                if limit.atom_bits == self._routing_info.max_bits_atoms]
+
+    @property
+    def machine_bits_without_limits(self) -> int:
+        """
+        The machine zone width needed if the
+        :py:attr:`machine_limiting` partitions needed one bit less.
+        """
+        return max(self._machine_bits_without_limits,
+                   self._routing_info.max_bits_machine - 1, 0)
+
+    @property
+    def atom_bits_without_limits(self) -> int:
+        """
+        The atom zone width needed if the
+        :py:attr:`atom_limiting` partitions needed one bit less.
+        """
+        return max(self._atom_bits_without_limits,
+                   self._routing_info.max_bits_atoms - 1, 0)
+
+    def write(self, f: TextIO) -> None:
+        """
+        Write the report as text.
+
+        :param f: Where to write the report
+        """
+        routing_info = self._routing_info
+        f.write("Key space utilisation\n")
+        f.write("=====================\n\n")
+        f.write(f"Application bits: {routing_info.target_app_bits} "
+                f"(needed {routing_info.size_app_part_bits})\n")
+        f.write(f"Machine bits: {routing_info.target_machine_bits} "
+                f"(needed {routing_info.max_bits_machine})\n")
+        f.write(f"Atom bits: {routing_info.target_atom_bits} "
+                f"(needed {routing_info.max_bits_atoms})\n\n")
+        f.write(f"Keys allocated: {self.n_keys_allocated} "
+                f"({self.key_space_allocated:.2%} of the key space)\n")
+        f.write(f"Keys used: {self.n_keys_used}\n")
+        f.write(f"Fragmentation: {self.fragmentation:.2%}\n\n")
+
+        f.write(f"Partitions setting the machine zone to "
+                f"{routing_info.max_bits_machine} bits "
+                f"(else {self.machine_bits_without_limits}):\n")
+        for limit in self.machine_limiting:
+            f.write(f"    {limit.vertex.label} {limit.partition_id}\n")
+        f.write(f"Partitions setting the atom zone to "
+                f"{routing_info.max_bits_atoms} bits "
+                f"(else {self.atom_bits_without_limits}):\n")
+        for limit in self.atom_limiting:
+            f.write(f"    {limit.vertex.label} {limit.partition_id}\n")
+
+        f.write("\nVertex, Partition, Allocated, Used, Fixed\n")
+        for usage in self._app_usage + self._machine_usage:
+            f.write(f"{usage.vertex.label}, {usage.partition_id}, "
+                    f"{usage.n_keys_allocated}, {usage.n_keys_used}, "
+                    f"{usage.is_fixed}\n")
+
+
+def key_space_report(
+        routing_info: RoutingInfo | None = None) -> KeySpaceReport:
+    """
+    Analyse the use of the key space by the allocated keys.
+
+    :param routing_info:
+        The routing information to analyse; if None the current routing
+        information is used
+    :returns: The analysis of the key space
+    """
+    if routing_info is None:
+        routing_info = PacmanDataView.get_routing_infos()
+    return KeySpaceReport(routing_info)
@@ -20,7 +20,10 @@ from spinn_utilities.ordered_set import OrderedSet
 from spinn_utilities.progress_bar import ProgressBar
 
 from pacman.exceptions import PacmanRouteInfoAllocationException
-from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.application import (
+    ApplicationEdgePartition,
+    ApplicationVertex,
+)
 from pacman.model.graphs.machine import MachineVertex
 from pacman.model.routing_info import (
     BaseKeyAndMask,
@@ -33,12 +36,24 @@ from pacman.model.routing_info import (
     SpecificAppVertexRoutingInfo,
     SpecificMachineVertexRoutingInfo,
 )
+from pacman.model.routing_table_by_partition import (
+    MulticastRoutingTableByPartition,
+)
 from pacman.utilities.algorithm_utilities.routing_algorithm_utilities import (
     get_app_partitions,
 )
 from pacman.utilities.constants import BITS_IN_KEY, FULL_MASK
+from pacman.utilities.instrumentation import span
 from pacman.utilities.utility_calls import allocator_bits_needed, calc_shift
 
+from .key_ordering import (
+    KeyOrderingReport,
+    assign_indices,
+    estimate_table_sizes,
+    get_route_signatures,
+    group_by_route_similarity,
+)
+
 _XAlloc = Iterable[tuple[ApplicationVertex, str]]
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -94,6 +109,19 @@ class ZonedRoutingInfoAllocator:
     Most vertices will be able to use this split.
     The few vertices with a large number of atoms will then not respect the
     split between machine and atoms zones.
+
+    By default the ``AP`` indices are given out in the order of the
+    partitions.  When asked to order by routes the partitions which
+    follow the same routes are instead given adjacent ``AP`` indices,
+    in a power of two aligned block where there is space for it,
+    so that the compressors can merge their entries.
+
+    When given the routing information of a previous allocation the
+    allocator is sticky: the previous zone widths are kept if they still
+    fit, and each partition keeps its previous ``AP`` index if it is still
+    free, so only new partitions get new keys.
+    The partitions whose keys had to change are reported by
+    :py:attr:`moved_partitions`.
     """
 
     __slots__ = (
@@ -114,6 +142,10 @@ class ZonedRoutingInfoAllocator:
         "__max_bits_machine",
         # Maximum number of bits to represent the atoms for any vertex
         "__min_bits_machine_and_atoms",
+        # Partitions whose keys changed from the previous allocation
+        "__moved_partitions",
+        # Estimated table sizes of the last route based ordering
+        "__ordering_report",
         # Needed size of the App vertex / Partition name zone
         "__size_app_part_bits",
         # The size of the App vertex / Partition name zone
@@ -147,27 +179,72 @@ class ZonedRoutingInfoAllocator:
         self.__target_atom_bits = -10000
         self.__global_app_mask = -10000
         self.__global_machine_mask = -10000
-
-    def allocate(self) -> RoutingInfo:
+        self.__ordering_report: KeyOrderingReport | None = None
+        self.__moved_partitions: list[tuple[ApplicationVertex, str]] = []
+
+    @span("ZonedRoutingInfoAllocator.allocate")
+    def allocate(
+            self, order_by_routes: bool = False,
+            routes: MulticastRoutingTableByPartition | None = None,
+            previous: RoutingInfo | None = None) -> RoutingInfo:
         """
         Perform routing information allocation.
 
+        :param order_by_routes:
+            If True the ``AP`` indices are ordered so that partitions
+            following the same routes get adjacent keys
+        :param routes:
+            The routes to order by. If None and order_by_routes is True
+            the routes are estimated from the placements.
+        :param previous:
+            The routing information of a previous allocation whose keys
+            should be kept where possible
         :return: The routing information
         :raise PacmanRouteInfoAllocationException:
             If something goes wrong with the allocation
         """
+        partitions = get_app_partitions()
         self.__vertex_partitions = OrderedSet(
-            (p.pre_vertex, p.identifier)
-            for p in get_app_partitions())
+            (p.pre_vertex, p.identifier) for p in partitions)
+        self.__ordering_report = None
+        self.__moved_partitions = []
 
         routing_info = RoutingInfo()
         self.__allocate_fixed(routing_info)
         self.__calculate_zone_sizes_needed(routing_info)
         self.__set_target_zones(routing_info)
+        if previous is not None:
+            self.__use_previous_zones(routing_info, previous)
         self.__set_fixed_used(routing_info)
-        self.__allocate(routing_info)
+        app_part_indices = self.__default_app_part_indices(routing_info)
+        if order_by_routes:
+            app_part_indices = self.__order_by_routes(
+                partitions, routes, app_part_indices)
+        if previous is not None:
+            app_part_indices = self.__keep_previous_indices(
+                previous, app_part_indices)
+        self.__allocate(routing_info, app_part_indices)
+        if previous is not None:
+            self.__find_moved(routing_info, previous)
         return routing_info
 
+    @property
+    def ordering_report(self) -> KeyOrderingReport | None:
+        """
+        The estimated table sizes of the default and the route based
+        ordering, or None if the last allocation was not ordered by routes.
+        """
+        return self.__ordering_report
+
+    @property
+    def moved_partitions(self) -> list[tuple[ApplicationVertex, str]]:
+        """
+        The application vertex and partition identifier of each partition
+        whose keys changed from the previous routing information given to
+        the last allocation.
+        """
+        return self.__moved_partitions
+
     def __check_no_fixed(
             self, pre: ApplicationVertex, identifier: str) -> None:
         for vert in pre.splitter.get_out_going_vertices(identifier):
@@ -239,6 +316,7 @@ class ZonedRoutingInfoAllocator:
             app_key_and_mask, part_id, pre,
             len(pre.machine_vertices) - 1, machine_mask))
 
+    @span("allocate fixed keys")
     def __allocate_fixed(self, routing_info: RoutingInfo) -> None:
         for pre, part_id in self.__vertex_partitions:
             app_key_and_mask = pre.get_fixed_key_and_mask(part_id)
@@ -258,6 +336,7 @@ class ZonedRoutingInfoAllocator:
                         "Application {pre} has fixed key {key_and_mask} for "
                         "partition {identifier} but no out_going_vertices")
 
+    @span("calculate zone sizes")
     def __calculate_zone_sizes_needed(
             self, routing_info: RoutingInfo) -> None:
         """
@@ -366,6 +445,7 @@ class ZonedRoutingInfoAllocator:
         assert best_app + self.__min_bits_machine_and_atoms <= BITS_IN_KEY
         return best_app, None
 
+    @span("set target zones")
     def __set_target_zones(self, routing_info: RoutingInfo) -> None:
         self.__target_app_bits, atom_bits = (
             self.__find_target_app_bits(routing_info))
@@ -395,6 +475,38 @@ class ZonedRoutingInfoAllocator:
             self.__target_machine_bits + self.__target_atom_bits)
         self.__global_machine_mask = self.__mask(self.__target_atom_bits)
 
+    @span("use previous zones")
+    def __use_previous_zones(
+            self, routing_info: RoutingInfo, previous: RoutingInfo) -> None:
+        """
+        Switch to the zones of the previous allocation if they still fit.
+        """
+        app_bits = previous.target_app_bits
+        machine_bits = previous.target_machine_bits
+        atom_bits = previous.target_atom_bits
+        if app_bits < 0:
+            # previous allocation never got as far as setting the zones
+            return
+        if (app_bits == self.__target_app_bits and
+                machine_bits == self.__target_machine_bits):
+            return
+        if (app_bits < self.__size_app_part_bits or
+                app_bits + self.__min_bits_machine_and_atoms > BITS_IN_KEY or
+                machine_bits < self.__max_bits_machine or
+                atom_bits < min(self.__max_bits_atoms,
+                                self.__target_atom_bits)):
+            logger.info("The previous key zones no longer fit")
+            return
+        if len(routing_info) > 0 and app_bits != self.__target_app_bits:
+            logger.info(
+                "The previous key zones do not match the fixed keys")
+            return
+        self.__target_app_bits = app_bits
+        self.__target_machine_bits = machine_bits
+        self.__target_atom_bits = atom_bits
+        self.__global_app_mask = self.__mask(machine_bits + atom_bits)
+        self.__global_machine_mask = self.__mask(atom_bits)
+
     def __set_fixed_used(self, routing_info: RoutingInfo) -> None:
         repeats = set()
         for info in routing_info:
@@ -423,23 +535,154 @@ class ZonedRoutingInfoAllocator:
             self.__target_app_bits, self.__target_machine_bits,
             self.__target_atom_bits)
 
-    def __allocate(self, routing_info: RoutingInfo) -> None:
+    def __default_app_part_indices(
+            self, routing_info: RoutingInfo) -> dict[
+                tuple[ApplicationVertex, str], int]:
+        """
+        Give out the AP indices in partition order, avoiding the fixed ones.
+        """
+        app_part_indices: dict[tuple[ApplicationVertex, str], int] = {}
+        app_part_index = 0
+        for pre, identifier in self.__vertex_partitions:
+            if routing_info.has_info_from(pre, identifier):
+                continue
+            if not pre.splitter.get_out_going_vertices(identifier):
+                continue
+            while app_part_index in self.__ap_keys_blocked_by_fixed:
+                app_part_index += 1
+            app_part_indices[pre, identifier] = app_part_index
+            app_part_index += 1
+        return app_part_indices
+
+    @span("order by routes")
+    def __order_by_routes(
+            self, partitions: list[ApplicationEdgePartition],
+            routes: MulticastRoutingTableByPartition | None,
+            default_indices: dict[tuple[ApplicationVertex, str], int]
+            ) -> dict[tuple[ApplicationVertex, str], int]:
+        """
+        Give out the AP indices so that partitions with similar routes
+        are next to each other.
+        """
+        signatures = get_route_signatures(partitions, routes)
+        groups = group_by_route_similarity(
+            list(default_indices), signatures)
+        n_indices = 2 ** self.__target_app_bits
+        app_part_indices = assign_indices(
+            groups, n_indices, self.__ap_keys_blocked_by_fixed, align=True)
+        if app_part_indices is None:
+            logger.warning(
+                "Not enough spare keys to align the partitions with similar "
+                "routes so they will be allocated next to each other only")
+            app_part_indices = assign_indices(
+                groups, n_indices, self.__ap_keys_blocked_by_fixed,
+                align=False)
+        assert app_part_indices is not None
+
+        # Fixed keys are left out as they are the same in both orderings
+        default_sizes = estimate_table_sizes(signatures, default_indices)
+        ordered_sizes = estimate_table_sizes(signatures, app_part_indices)
+        self.__ordering_report = KeyOrderingReport(
+            sum(default_sizes.values()),
+            max(default_sizes.values(), default=0),
+            sum(ordered_sizes.values()),
+            max(ordered_sizes.values(), default=0))
+        logger.info(
+            "Ordering keys by routes estimates {} table entries in total "
+            "with at most {} on a chip, against {} with at most {} using "
+            "the default order",
+            self.__ordering_report.ordered_total,
+            self.__ordering_report.ordered_max,
+            self.__ordering_report.default_total,
+            self.__ordering_report.default_max)
+        return app_part_indices
+
+    @span("keep previous indices")
+    def __keep_previous_indices(
+            self, previous: RoutingInfo,
+            app_part_indices: dict[tuple[ApplicationVertex, str], int]
+            ) -> dict[tuple[ApplicationVertex, str], int]:
+        """
+        Give each partition its previous AP index if still free,
+        and the rest the free indices in their current order.
+        """
+        n_indices = 2 ** self.__target_app_bits
+        used = set(self.__ap_keys_blocked_by_fixed)
+        kept: dict[tuple[ApplicationVertex, str], int] = {}
+        # The indices are found using the previous zones, which are the
+        # current ones unless they no longer fit
+        if previous.target_app_bits >= 0:
+            shift = BITS_IN_KEY - previous.target_app_bits
+            for pre, identifier in app_part_indices:
+                if not previous.has_info_from(pre, identifier):
+                    continue
+                info = previous.get_info_from(pre, identifier)
+                if info.has_fixed_keys:
+                    continue
+                index = info.key >> shift
+                if index < n_indices and index not in used:
+                    kept[pre, identifier] = index
+                    used.add(index)
+
+        sticky_indices: dict[tuple[ApplicationVertex, str], int] = {}
+        app_part_index = 0
+        for vertex_partition in sorted(
+                app_part_indices, key=app_part_indices.__getitem__):
+            if vertex_partition in kept:
+                sticky_indices[vertex_partition] = kept[vertex_partition]
+                continue
+            while app_part_index in used:
+                app_part_index += 1
+            sticky_indices[vertex_partition] = app_part_index
+            used.add(app_part_index)
+        return sticky_indices
+
+    def __find_moved(
+            self, routing_info: RoutingInfo, previous: RoutingInfo) -> None:
+        """
+        Find the partitions whose keys are not the same as before.
+        """
+        for pre, identifier in self.__vertex_partitions:
+            if not previous.has_info_from(pre, identifier):
+                continue
+            if not routing_info.has_info_from(pre, identifier):
+                continue
+            moved = (routing_info.get_info_from(pre, identifier).key_and_mask
+                     != previous.get_info_from(pre, identifier).key_and_mask)
+            for m_vertex in pre.splitter.get_out_going_vertices(identifier):
+                if moved:
+                    break
+                if (previous.has_info_from(m_vertex, identifier) and
+                        routing_info.has_info_from(m_vertex, identifier)):
+                    moved = (
+                        routing_info.get_info_from(
+                            m_vertex, identifier).key_and_mask !=
+                        previous.get_info_from(
+                            m_vertex, identifier).key_and_mask)
+            if moved:
+                self.__moved_partitions.append((pre, identifier))
+        if self.__moved_partitions:
+            logger.info(
+                "{} partitions have different keys to before",
+                len(self.__moved_partitions))
+
+    @span("allocate keys")
+    def __allocate(
+            self, routing_info: RoutingInfo,
+            app_part_indices: dict[tuple[ApplicationVertex, str], int]
+            ) -> None:
         progress = ProgressBar(
             len(self.__vertex_partitions), "Allocating routing keys")
-        app_part_index = 0
         for pre, identifier in progress.over(self.__vertex_partitions):
-            if routing_info.has_info_from(pre, identifier):
+            if (pre, identifier) not in app_part_indices:
                 continue
             # Get a list of machine vertices ordered by pre-slice
             splitter = pre.splitter
             machine_vertices = list(splitter.get_out_going_vertices(
                 identifier))
-            if not machine_vertices:
-                continue
 
             n_bits_atoms = self.__atom_bits_per_app_part[pre, identifier]
-            while app_part_index in self.__ap_keys_blocked_by_fixed:
-                app_part_index += 1
+            app_part_index = app_part_indices[pre, identifier]
 
             machine_vertices.sort(key=lambda x: x.vertex_slice.lo_atom)
             if n_bits_atoms <= self.__target_atom_bits:
@@ -484,7 +727,6 @@ class ZonedRoutingInfoAllocator:
                 routing_info.add_routing_info(GlobalAppVertexRoutingInfo(
                     bka, identifier, pre, len(machine_vertices) - 1,
                     mac_mask))
-            app_part_index += 1
 
     @staticmethod
     def __mask(bits: int) -> int:
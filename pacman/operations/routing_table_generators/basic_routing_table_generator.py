@@ -24,8 +24,10 @@ from pacman.model.routing_tables import (
     MulticastRoutingTables,
     UnCompressedMulticastRoutingTable,
 )
+from pacman.utilities.instrumentation import span
 
 
+@span("basic_routing_table_generator")
 def basic_routing_table_generator() -> MulticastRoutingTables:
     """
     An basic algorithm that can produce routing tables.
@@ -15,6 +15,7 @@ from collections.abc import Iterable
 from typing import Generic, TypeVar
 
 from spinn_utilities.progress_bar import ProgressBar
+from spinn_utilities.typing.coords import XY
 
 from spinn_machine import MulticastRoutingEntry, RoutingEntry
 
@@ -32,6 +33,11 @@ from pacman.model.routing_tables import (
     MulticastRoutingTables,
     UnCompressedMulticastRoutingTable,
 )
+from pacman.utilities.algorithm_utilities.parallel_utilities import (
+    get_n_mapping_processes,
+    map_in_processes,
+)
+from pacman.utilities.instrumentation import span
 
 #: :meta private:
 E = TypeVar("E")
@@ -85,29 +91,47 @@ class _IteratorWithNext(Generic[E]):
         return nxt
 
 
+@span("merged_routing_table_generator")
 def merged_routing_table_generator() -> MulticastRoutingTables:
     """
     Creates routing entries by merging adjacent entries from the same
     application vertex when possible.
 
+    Each chip is independent, so the chips are shared between the number
+    of processes set by ``n_mapping_processes`` in the ``Mapping`` section
+    of the configuration.
+
     :returns: The merged routing tables.
     """
     routing_table_by_partitions = (
         PacmanDataView.get_routing_table_by_partition())
-    routing_infos = PacmanDataView.get_routing_infos()
-    progress = ProgressBar(
-        routing_table_by_partitions.n_routers, "Generating routing tables")
+    routers = list(routing_table_by_partitions.get_routers())
+    progress = ProgressBar(len(routers), "Generating routing tables")
     routing_tables = MulticastRoutingTables()
-    for x, y in progress.over(routing_table_by_partitions.get_routers()):
-        parts = routing_table_by_partitions.get_entries_for_router(x, y)
-        if parts is None:
-            continue
-        routing_tables.add_routing_table(__create_routing_table(
-            x, y, parts, routing_infos))
+    for table in progress.over(map_in_processes(
+            __create_routing_table_for_router, routers,
+            get_n_mapping_processes())):
+        if table is not None:
+            routing_tables.add_routing_table(table)
 
     return routing_tables
 
 
+def __create_routing_table_for_router(
+        xy: XY) -> UnCompressedMulticastRoutingTable | None:
+    """
+    Create the table for one router from the data in the view, so that
+    only the chip coordinates and the table go between processes.
+    """
+    x, y = xy
+    parts = PacmanDataView.get_routing_table_by_partition(
+        ).get_entries_for_router(x, y)
+    if parts is None:
+        return None
+    return __create_routing_table(
+        x, y, parts, PacmanDataView.get_routing_infos())
+
+
 def __create_routing_table(
         x: int, y: int,
         partitions_in_table: dict[tuple[AbstractVertex, str],
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .balanced_tag_allocator import balanced_tag_allocator
 from .basic_tag_allocator import basic_tag_allocator
 
-__all__ = ['basic_tag_allocator', ]
+__all__ = ['balanced_tag_allocator', 'basic_tag_allocator', ]
@@ -0,0 +1,138 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from spinn_utilities.config_holder import get_config_int_or_none
+from spinn_utilities.progress_bar import ProgressBar
+
+from spinn_machine import Chip
+
+from pacman.data import PacmanDataView
+from pacman.model.placements import Placement
+from pacman.model.resources.iptag_resource import IPtagResource
+from pacman.model.tags import Tags
+from pacman.utilities.instrumentation import span
+
+from .basic_tag_allocator import (
+    _allocate_ip_tag,
+    _allocate_reverse_ip_tag,
+    _FreeTags,
+)
+
+
+@span("balanced_tag_allocator")
+def balanced_tag_allocator(max_distance: int | None = None) -> Tags:
+    """
+    Tag allocator that spreads the traffic of the IP tags between the
+    Ethernet chips, so that no one board's Ethernet link carries much more
+    than the others.
+
+    IP tags with a fixed tag, and all reverse IP tags, are allocated first
+    as by :py:func:`basic_tag_allocator`.  The other IP tags are then
+    allocated in order of their :py:attr:`IPtagResource.rate`, highest
+    first, each to the Ethernet chip with a free tag which would carry the
+    least traffic once the tag is added.  Ties go to the Ethernet chip
+    nearest to the vertex.  Tags without a rate are counted as having the
+    mean rate of those with one, or 1 if none have one.
+
+    .. note::
+        This does not actually allocate the tags, but just produces the plan
+        of what to allocate. Allocations need access to the running machine.
+
+    :param max_distance:
+        The most chips away from a vertex that an Ethernet chip may be for
+        its IP tags to be allocated there, the nearest Ethernet chip always
+        being allowed; if None ``balanced_tag_max_distance`` in the
+        ``Mapping`` section of the configuration is used, and if that is
+        None any Ethernet chip may be used
+    :return: tag allocation holder
+    """
+    if max_distance is None:
+        max_distance = get_config_int_or_none(
+            "Mapping", "balanced_tag_max_distance")
+    tags = Tags()
+    machine = PacmanDataView.get_machine()
+    free_tags = _FreeTags(machine)
+    loads = {eth_chip: 0.0 for eth_chip in machine.ethernet_connected_chips}
+
+    progress = ProgressBar(
+        PacmanDataView.get_n_placements(), "Allocating balanced tags")
+    fixed: list[tuple[Chip, IPtagResource]] = []
+    to_balance: list[tuple[Placement, IPtagResource]] = []
+    for placement in progress.over(
+            PacmanDataView.iterate_placemements(), finish_at_end=False):
+        place_chip = machine[placement.x, placement.y]
+        eth_chip = machine[place_chip.nearest_ethernet_x,
+                           place_chip.nearest_ethernet_y]
+        for iptag in placement.vertex.iptags:
+            if iptag.tag is None:
+                to_balance.append((placement, iptag))
+            else:
+                fixed.append((_allocate_ip_tag(
+                    tags, placement, iptag, eth_chip, free_tags), iptag))
+        for reverse_iptag in placement.vertex.reverse_iptags:
+            _allocate_reverse_ip_tag(
+                tags, placement, reverse_iptag, eth_chip, free_tags)
+
+    rates = [iptag.rate for _, iptag in fixed + to_balance
+             if iptag.rate is not None]
+    default_rate = sum(rates) / len(rates) if rates else 1.0
+
+    def rate_of(iptag: IPtagResource) -> float:
+        return default_rate if iptag.rate is None else iptag.rate
+
+    for eth_chip, iptag in fixed:
+        loads[eth_chip] += rate_of(iptag)
+
+    # Placing the largest first gives a peak close to the best possible
+    to_balance.sort(key=lambda item: rate_of(item[1]), reverse=True)
+    candidates: dict[Chip, list[Chip]] = {}
+    with span("balance tags"):
+        for placement, iptag in to_balance:
+            place_chip = machine[placement.x, placement.y]
+            if place_chip not in candidates:
+                candidates[place_chip] = __candidates(
+                    place_chip, max_distance)
+            # Ties go to the nearest as the candidates are in distance order
+            alloc_chip = min(
+                (eth_chip for eth_chip in candidates[place_chip]
+                 if free_tags.has_free_tag(eth_chip)),
+                key=loads.__getitem__, default=candidates[place_chip][0])
+            alloc_chip = _allocate_ip_tag(
+                tags, placement, iptag, alloc_chip, free_tags)
+            loads[alloc_chip] += rate_of(iptag)
+    progress.end()
+    return tags
+
+
+def __candidates(place_chip: Chip, max_distance: int | None) -> list[Chip]:
+    """
+    Get the Ethernet chips that the IP tags of a vertex may go to.
+
+    :param place_chip: The chip the vertex is placed on
+    :param max_distance: The most chips away an Ethernet chip may be, or
+        None for no limit
+    :return: The Ethernet chips in order of distance, nearest first
+    """
+    machine = PacmanDataView.get_machine()
+    xy = (place_chip.x, place_chip.y)
+    nearest = machine[place_chip.nearest_ethernet_x,
+                      place_chip.nearest_ethernet_y]
+    distances = {
+        eth_chip: machine.get_vector_length(xy, (eth_chip.x, eth_chip.y))
+        for eth_chip in machine.ethernet_connected_chips
+        if eth_chip != nearest}
+    return [nearest] + sorted(
+        (eth_chip for eth_chip, distance in distances.items()
+         if max_distance is None or distance <= max_distance),
+        key=distances.__getitem__)
@@ -12,8 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import defaultdict
-
 from spinn_utilities.progress_bar import ProgressBar
 
 from spinn_machine import Chip, Machine
@@ -25,6 +23,7 @@ from pacman.model.placements import Placement
 from pacman.model.resources.iptag_resource import IPtagResource
 from pacman.model.resources.reverse_iptag_resource import ReverseIPtagResource
 from pacman.model.tags import Tags
+from pacman.utilities.instrumentation import span
 
 # An arbitrary range of ports from which to allocate ports to Reverse IP Tags
 _BOARD_PORTS = range(17896, 18000)
@@ -33,6 +32,134 @@ _BOARD_PORTS = range(17896, 18000)
 _CHIP_TAGS = range(1, 8)
 
 
+class _FreeTags(object):
+    """
+    The tags and ports still free on each Ethernet chip, as bitsets.
+
+    Tags are only ever taken, so the first Ethernet chip, in the order of
+    the machine, with any tag free and the first with each tag free only
+    ever move later; they are kept so that they need not be searched for.
+    """
+
+    __slots__ = (
+        # The Ethernet chips of the machine, in order
+        "_eth_chips",
+        # The free tags of each Ethernet chip, bit n set if tag n is free
+        "_tags",
+        # The free ports of each Ethernet chip, bit n set if the nth port of
+        # _BOARD_PORTS is free
+        "_ports",
+        # The index in _eth_chips of the first chip with any tag free
+        "_first_free",
+        # The index in _eth_chips of the first chip with each tag free
+        "_first_with_tag")
+
+    def __init__(self, machine: Machine):
+        """
+        :param machine: The machine to allocate the tags of
+        """
+        self._eth_chips = list(machine.ethernet_connected_chips)
+        self._tags: dict[Chip, int] = dict()
+        self._ports: dict[Chip, int] = dict()
+        self._first_free = 0
+        self._first_with_tag = {tag: 0 for tag in _CHIP_TAGS}
+
+    def __chip_tags(self, eth_chip: Chip) -> int:
+        if eth_chip not in self._tags:
+            self._tags[eth_chip] = sum(1 << tag for tag in _CHIP_TAGS)
+        return self._tags[eth_chip]
+
+    def take_tag(self, eth_chip: Chip, tag: int) -> bool:
+        """
+        Take a tag on a chip if it is free.
+
+        :param eth_chip: The Ethernet chip to take the tag on
+        :param tag: The tag to take
+        :return: Whether the tag was free
+        """
+        tags = self.__chip_tags(eth_chip)
+        if not tags & (1 << tag):
+            return False
+        self._tags[eth_chip] = tags & ~(1 << tag)
+        return True
+
+    def has_free_tag(self, eth_chip: Chip) -> bool:
+        """
+        Whether a chip has any tag free.
+
+        :param eth_chip: The Ethernet chip to check
+        :returns: True if at least one tag is free
+        """
+        return bool(self.__chip_tags(eth_chip))
+
+    def take_highest_tag(self, eth_chip: Chip) -> int | None:
+        """
+        Take the highest free tag on a chip.
+
+        :param eth_chip: The Ethernet chip to take the tag on
+        :return: The tag taken, or None if the chip has no free tags
+        """
+        tags = self.__chip_tags(eth_chip)
+        if not tags:
+            return None
+        tag = tags.bit_length() - 1
+        self._tags[eth_chip] = tags & ~(1 << tag)
+        return tag
+
+    def find_chip_with_tag(self, tag: int) -> Chip:
+        """
+        Take a tag on the first Ethernet chip with it free.
+
+        :param tag: The tag to take
+        :return: The chip the tag was taken on
+        :raise PacmanNotFoundError: If no chip has the tag free
+        """
+        index = self._first_with_tag.get(tag, len(self._eth_chips))
+        while index < len(self._eth_chips):
+            eth_chip = self._eth_chips[index]
+            if self.take_tag(eth_chip, tag):
+                self._first_with_tag[tag] = index
+                return eth_chip
+            index += 1
+        self._first_with_tag[tag] = index
+        raise PacmanNotFoundError(
+            f"Tag {tag} not available on any Ethernet chip")
+
+    def find_free_tag(self) -> tuple[Chip, int]:
+        """
+        Take the lowest free tag on the first Ethernet chip with any free.
+
+        :return: The chip the tag was taken on, and the tag
+        :raise PacmanNotFoundError: If no chip has any free tags
+        """
+        while self._first_free < len(self._eth_chips):
+            eth_chip = self._eth_chips[self._first_free]
+            tags = self.__chip_tags(eth_chip)
+            if tags:
+                tag = (tags & -tags).bit_length() - 1
+                self._tags[eth_chip] = tags & ~(1 << tag)
+                return eth_chip, tag
+            self._first_free += 1
+        raise PacmanNotFoundError("Out of tags!")
+
+    def take_highest_port(self, eth_chip: Chip) -> int:
+        """
+        Take the highest free port on a chip.
+
+        :param eth_chip: The Ethernet chip to take the port on
+        :return: The port taken
+        :raise PacmanNotFoundError: If the chip has no free ports
+        """
+        ports = self._ports.get(eth_chip, (1 << len(_BOARD_PORTS)) - 1)
+        if not ports:
+            raise PacmanNotFoundError(
+                f"Out of ports on Ethernet chip {eth_chip.x}, {eth_chip.y}")
+        index = ports.bit_length() - 1
+        self._ports[eth_chip] = ports & ~(1 << index)
+        return _BOARD_PORTS[index]
+
+
+@span("basic_tag_allocator")
 def basic_tag_allocator() -> Tags:
     """
     Basic tag allocator that goes though the boards available and applies
@@ -44,79 +171,81 @@ def basic_tag_allocator() -> Tags:
 
     :return: tag allocation holder
     """
-    # Keep track of which tags are free by Ethernet chip
-    tags_available: dict[Chip, list[int]] = defaultdict(
-        lambda: list(_CHIP_TAGS))
-
-    # Keep track of which ports are free by Ethernet chip
-    ports_available: dict[Chip, list[int]] = defaultdict(
-        lambda: list(_BOARD_PORTS))
-
     # Go through placements and find tags
     tags = Tags()
 
     progress = ProgressBar(
         PacmanDataView.get_n_placements(), "Allocating tags")
     machine = PacmanDataView.get_machine()
+    # Keep track of which tags and ports are free by Ethernet chip
+    free_tags = _FreeTags(machine)
     for placement in progress.over(PacmanDataView.iterate_placemements()):
         place_chip = machine[placement.x, placement.y]
         eth_chip = machine[place_chip.nearest_ethernet_x,
                            place_chip.nearest_ethernet_y]
         for iptag in placement.vertex.iptags:
-            alloc_chip, tag = __get_chip_and_tag(
-                iptag, eth_chip, machine, tags_available)
-            tags.add_ip_tag(
-                __create_tag(alloc_chip, placement, iptag, tag),
-                placement.vertex)
+            _allocate_ip_tag(tags, placement, iptag, eth_chip, free_tags)
         for reverse_iptag in placement.vertex.reverse_iptags:
-            alloc_chip, tag = __get_chip_and_tag(
-                reverse_iptag, eth_chip, machine, tags_available)
-            port = __get_port(reverse_iptag, eth_chip, ports_available)
-            tags.add_reverse_ip_tag(
-                __create_reverse_tag(
-                    eth_chip, placement, reverse_iptag, tag, port),
-                placement.vertex)
+            _allocate_reverse_ip_tag(
+                tags, placement, reverse_iptag, eth_chip, free_tags)
 
     return tags
 
 
+def _allocate_ip_tag(
+        tags: Tags, placement: Placement, iptag: IPtagResource,
+        eth_chip: Chip, free_tags: _FreeTags) -> Chip:
+    """
+    Allocate an IP tag on the given Ethernet chip if possible, or on the
+    first Ethernet chip with a suitable tag free if not.
+
+    :param tags: Where to add the tag allocated
+    :param placement: The placement of the vertex that needs the tag
+    :param iptag: The tag needed
+    :param eth_chip: The Ethernet chip to try first
+    :param free_tags: The tags still free
+    :return: The Ethernet chip the tag was allocated on
+    """
+    alloc_chip, tag = __get_chip_and_tag(iptag, eth_chip, free_tags)
+    tags.add_ip_tag(
+        __create_tag(alloc_chip, placement, iptag, tag), placement.vertex)
+    return alloc_chip
+
+
+def _allocate_reverse_ip_tag(
+        tags: Tags, placement: Placement,
+        reverse_iptag: ReverseIPtagResource, eth_chip: Chip,
+        free_tags: _FreeTags) -> None:
+    """
+    Allocate a reverse IP tag for a vertex on its nearest Ethernet chip.
+
+    :param tags: Where to add the tag allocated
+    :param placement: The placement of the vertex that needs the tag
+    :param reverse_iptag: The tag needed
+    :param eth_chip: The Ethernet chip nearest the placement
+    :param free_tags: The tags and ports still free
+    """
+    _, tag = __get_chip_and_tag(reverse_iptag, eth_chip, free_tags)
+    port = __get_port(reverse_iptag, eth_chip, free_tags)
+    tags.add_reverse_ip_tag(
+        __create_reverse_tag(eth_chip, placement, reverse_iptag, tag, port),
+        placement.vertex)
+
+
 def __get_chip_and_tag(
         iptag: IPtagResource | ReverseIPtagResource, eth_chip: Chip,
-        machine: Machine, tags_available: dict[Chip, list[int]]
-        ) -> tuple[Chip, int]:
-    tags_on_chip = tags_available[eth_chip]
+        free_tags: _FreeTags) -> tuple[Chip, int]:
     tag = iptag.tag
     if tag is not None:
         # Try the nearest Ethernet
-        if tag in tags_on_chip:
-            tags_on_chip.remove(tag)
+        if free_tags.take_tag(eth_chip, tag):
             return eth_chip, tag
-        return __find_tag_chip(machine, tags_available, tag), tag
-    else:
-        if tags_on_chip:
-            # pop from back so automatic allocation starts with highest
-            return eth_chip, tags_on_chip.pop()
-        return __find_free_tag(machine, tags_available)
-
-
-def __find_tag_chip(machine: Machine, tags_available: dict[Chip, list[int]],
-                    tag: int) -> Chip:
-    for eth_chip in machine.ethernet_connected_chips:
-        tags_on_chip = tags_available[eth_chip]
-        if tag in tags_on_chip:
-            tags_on_chip.remove(tag)
-            return eth_chip
-    raise PacmanNotFoundError(f"Tag {tag} not available on any Ethernet chip")
-
-
-def __find_free_tag(
-        machine: Machine,
-        tags_available: dict[Chip, list[int]]) -> tuple[Chip, int]:
-    for eth_chip in machine.ethernet_connected_chips:
-        tags_on_chip = tags_available[eth_chip]
-        if tags_on_chip:
-            return eth_chip, tags_on_chip.pop(0)
-    raise PacmanNotFoundError("Out of tags!")
+        return free_tags.find_chip_with_tag(tag), tag
+    # Take from the top so automatic allocation starts with highest
+    auto_tag = free_tags.take_highest_tag(eth_chip)
+    if auto_tag is not None:
+        return eth_chip, auto_tag
+    return free_tags.find_free_tag()
 
 
 def __create_tag(
@@ -143,7 +272,7 @@ def __create_reverse_tag(
 
 def __get_port(
         reverse_ip_tag: ReverseIPtagResource, eth_chip: Chip,
-        ports_available: dict[Chip, list[int]]) -> int:
+        free_tags: _FreeTags) -> int:
     if reverse_ip_tag.port is not None:
         return reverse_ip_tag.port
-    return ports_available[eth_chip].pop()
+    return free_tags.take_highest_port(eth_chip)
@@ -0,0 +1,463 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections import defaultdict, deque
+from collections.abc import Callable
+from typing import NamedTuple
+
+import numpy
+from numpy.typing import NDArray
+
+from spinn_utilities.progress_bar import ProgressBar
+from spinn_utilities.typing.coords import XY
+
+from spinn_machine import Machine
+
+from pacman.data import PacmanDataView
+from pacman.model.graphs import AbstractVirtual
+from pacman.model.graphs.machine import MachineVertex
+from pacman.model.placements import Placements
+from pacman.model.routing_info import MachineVertexRoutingInfo, RoutingInfo
+from pacman.model.routing_tables import (
+    MulticastRoutingTables,
+    RoutingTableIndex,
+)
+from pacman.model.routing_tables.routing_table_index import NO_MATCH
+from pacman.utilities.constants import FULL_MASK
+
+#: A link out of a chip, as the x and y coordinates of the chip and the ID of
+#: the link
+LinkXY = tuple[int, int, int]
+
+#: A core, as the x and y coordinates of the chip and the ID of the processor
+CoreXY = tuple[int, int, int]
+
+# The number of links of a router, which come first in a route
+_N_LINKS = 6
+# The number of bits in a route
+_ROUTE_BITS = 32
+# The in-link of packets which were sent by a core on the chip
+_FROM_CORE = -1
+
+
+class TrafficPath(NamedTuple):
+    """
+    The links used by the packets of one outgoing partition of a vertex.
+    """
+    #: The vertex sending the packets
+    vertex: MachineVertex
+    #: The ID of the partition the packets are sent for
+    partition_id: str
+    #: The packets per second sent by the vertex for the partition
+    rate: float
+    #: The links the packets are sent over
+    links: tuple[LinkXY, ...]
+    #: The link of :py:attr:`links` with the most traffic from all sources
+    peak_link: LinkXY
+    #: The packets per second over :py:attr:`peak_link` from all sources
+    peak_rate: float
+
+
+class _Packets(NamedTuple):
+    # The keys of the packets
+    keys: NDArray[numpy.uint32]
+    # The packets per second sent with each key
+    rates: NDArray[numpy.float64]
+    # The index of the source of each key
+    sources: NDArray[numpy.intp]
+    # The link each key came in on, or _FROM_CORE
+    in_links: NDArray[numpy.int8]
+    # The number of links each key has been sent over
+    hops: NDArray[numpy.int32]
+
+
+class MulticastTrafficReport(object):
+    """
+    The packet rates found by :py:func:`simulate_multicast_traffic`.
+    """
+
+    __slots__ = (
+        # The packets per second sent over each link used
+        "_link_rates",
+        # The packets per second through each router used
+        "_router_rates",
+        # The packets per second delivered to each core
+        "_core_rates",
+        # The packets per second dropped by each router
+        "_dropped_rates",
+        # The vertex and partition ID of each source of packets
+        "_sources",
+        # The packets per second sent by each source
+        "_source_rates",
+        # The links used by each source
+        "_source_links")
+
+    def __init__(
+            self, link_rates: dict[LinkXY, float],
+            router_rates: dict[XY, float], core_rates: dict[CoreXY, float],
+            dropped_rates: dict[XY, float],
+            sources: list[tuple[MachineVertex, str]],
+            source_rates: list[float],
+            source_links: dict[int, set[LinkXY]]):
+        """
+        :param link_rates: The packets per second sent over each link used
+        :param router_rates: The packets per second through each router used
+        :param core_rates: The packets per second delivered to each core
+        :param dropped_rates: The packets per second dropped by each router
+        :param sources: The vertex and partition ID of each source
+        :param source_rates: The packets per second sent by each source
+        :param source_links: The links used by each source, by the index of
+            the source
+        """
+        self._link_rates = dict(link_rates)
+        self._router_rates = dict(router_rates)
+        self._core_rates = dict(core_rates)
+        self._dropped_rates = dict(dropped_rates)
+        self._sources = sources
+        self._source_rates = source_rates
+        self._source_links = source_links
+
+    @property
+    def link_rates(self) -> dict[LinkXY, float]:
+        """
+        The packets per second sent over each link which is used, by chip
+        coordinates and link ID.
+        """
+        return self._link_rates
+
+    @property
+    def router_rates(self) -> dict[XY, float]:
+        """
+        The packets per second arriving at each router which is used,
+        whether from a core or a link.
+        """
+        return self._router_rates
+
+    @property
+    def core_rates(self) -> dict[CoreXY, float]:
+        """
+        The packets per second delivered to each core which receives any.
+        """
+        return self._core_rates
+
+    @property
+    def dropped_rates(self) -> dict[XY, float]:
+        """
+        The packets per second dropped by each router which drops any.
+
+        A packet is dropped when it is sent by a core on the chip and no
+        entry matches its key, when it is routed to a link which does not
+        exist, or when it has been sent over too many links, which suggests
+        that the route goes round in a circle.
+        """
+        return self._dropped_rates
+
+    @property
+    def injected_rate(self) -> float:
+        """
+        The total packets per second sent by all the sources.
+        """
+        return sum(self._source_rates)
+
+    def hottest_links(self, n_links: int) -> list[tuple[LinkXY, float]]:
+        """
+        Get the links with the most traffic.
+
+        :param n_links: The number of links to get
+        :return: The links and their packets per second, busiest first
+        """
+        return sorted(
+            self._link_rates.items(), key=lambda item: item[1],
+            reverse=True)[:n_links]
+
+    def hottest_paths(self, n_paths: int) -> list[TrafficPath]:
+        """
+        Get the outgoing partitions which send packets over the links with
+        the most traffic.
+
+        :param n_paths: The number of paths to get
+        :return: The paths, ordered by the traffic over their busiest link,
+            and then by their own rate, highest first
+        """
+        paths = []
+        for source, links in self._source_links.items():
+            peak_link = max(links, key=lambda link: (
+                self._link_rates[link], link))
+            vertex, partition_id = self._sources[source]
+            paths.append(TrafficPath(
+                vertex, partition_id, self._source_rates[source],
+                tuple(sorted(links)), peak_link, self._link_rates[peak_link]))
+        paths.sort(key=lambda path: (path.peak_rate, path.rate), reverse=True)
+        return paths[:n_paths]
+
+    def drop_risk(
+            self, link_capacity: float,
+            router_capacity: float) -> dict[XY, float]:
+        """
+        Estimate the fraction of the packets through each router which
+        would be dropped, because the router or one of its links could not
+        keep up.
+
+        This assumes that the packets are evenly spread in time, so is
+        optimistic for bursty traffic.  Packets dropped for having no route
+        are included.
+
+        :param link_capacity: The packets per second a link can send
+        :param router_capacity: The packets per second a router can route
+        :return: The estimated fraction of packets dropped, for each router
+            which would drop any
+        """
+        over: dict[XY, float] = defaultdict(float)
+        for (x, y, _), rate in self._link_rates.items():
+            if rate > link_capacity:
+                over[x, y] += rate - link_capacity
+        for xy, rate in self._router_rates.items():
+            over[xy] += max(rate - router_capacity, 0.0)
+            over[xy] += self._dropped_rates.get(xy, 0.0)
+        return {
+            xy: min(over[xy] / self._router_rates[xy], 1.0)
+            for xy in self._router_rates if over.get(xy)}
+
+
+def simulate_multicast_traffic(
+        routing_tables: MulticastRoutingTables, routing_infos: RoutingInfo,
+        placements: Placements,
+        packet_rate: Callable[[MachineVertex, str], float],
+        max_hops: int | None = None) -> MulticastTrafficReport:
+    """
+    Estimate the packet rates over the links and routers of the machine
+    by following the keys of every vertex through the routing tables.
+
+    Each machine vertex sends a packet with each of its keys, one key for
+    each atom, at the rate given by ``packet_rate``.  At each router the
+    keys are looked up as the router would, all at once; keys which match
+    no entry are default routed on to the link opposite the one they came
+    in on.  The keys are then passed on to the next routers and the cores
+    of the routes found.
+
+    :param routing_tables: The routing tables of the chips
+    :param routing_infos: The keys of each vertex and partition
+    :param placements: Where each vertex is placed
+    :param packet_rate:
+        The packets per second sent with each key of a vertex for the
+        partition with the given ID
+    :param max_hops:
+        The number of links a packet can be sent over before it is dropped;
+        if None twice the width plus the height of the machine
+    :return: The packet rates found
+    """
+    machine = PacmanDataView.get_machine()
+    if max_hops is None:
+        max_hops = 2 * (machine.width + machine.height)
+    simulator = _TrafficSimulator(routing_tables, machine, max_hops)
+
+    infos = [info for info in routing_infos
+             if isinstance(info, MachineVertexRoutingInfo)]
+    progress = ProgressBar(len(infos) + 1, "Simulating multicast traffic")
+    for info in progress.over(infos, finish_at_end=False):
+        vertex = info.machine_vertex
+        if isinstance(vertex, AbstractVirtual):
+            continue
+        if not placements.is_vertex_placed(vertex):
+            continue
+        rate = packet_rate(vertex, info.partition_id)
+        if rate <= 0:
+            continue
+        placement = placements.get_placement_of_vertex(vertex)
+        simulator.add_source(
+            vertex, info.partition_id, placement.x, placement.y,
+            _keys(info, vertex.vertex_slice.n_atoms), rate)
+
+    simulator.run()
+    progress.end()
+    return simulator.report()
+
+
+def _keys(info: MachineVertexRoutingInfo,
+          n_atoms: int) -> NDArray[numpy.uint32]:
+    """
+    Get the key of each atom of a vertex.
+    """
+    free_bits = ~info.mask & FULL_MASK
+    if free_bits & (free_bits + 1) == 0 and n_atoms <= free_bits + 1:
+        # The keys are all the values of the low bits, in order
+        return info.key + numpy.arange(n_atoms, dtype=numpy.uint32)
+    return info.get_keys(n_atoms).astype(numpy.uint32)
+
+
+class _TrafficSimulator(object):
+    """
+    Sends packets through the routers, a chip at a time.
+    """
+
+    __slots__ = (
+        # The routing tables of the chips
+        "_routing_tables",
+        # The machine the tables are for
+        "_machine",
+        # The number of links a packet can go over before it is dropped
+        "_max_hops",
+        # The indexed routing table of each chip visited, or None if none
+        "_indexes",
+        # The packets waiting to be routed by the router of each chip
+        "_pending",
+        # The chips with packets waiting, in the order they first arrived
+        "_to_visit",
+        # The totals found, as described in MulticastTrafficReport
+        "_link_rates", "_router_rates", "_core_rates", "_dropped_rates",
+        "_sources", "_source_rates", "_source_links")
+
+    def __init__(self, routing_tables: MulticastRoutingTables,
+                 machine: Machine, max_hops: int):
+        """
+        :param routing_tables: The routing tables of the chips
+        :param machine: The machine the tables are for
+        :param max_hops:
+            The number of links a packet can go over before it is dropped
+        """
+        self._routing_tables = routing_tables
+        self._machine = machine
+        self._max_hops = max_hops
+        self._indexes: dict[XY, RoutingTableIndex | None] = dict()
+        self._pending: dict[XY, list[_Packets]] = defaultdict(list)
+        self._to_visit: deque[XY] = deque()
+        self._link_rates: dict[LinkXY, float] = defaultdict(float)
+        self._router_rates: dict[XY, float] = defaultdict(float)
+        self._core_rates: dict[CoreXY, float] = defaultdict(float)
+        self._dropped_rates: dict[XY, float] = defaultdict(float)
+        self._sources: list[tuple[MachineVertex, str]] = []
+        self._source_rates: list[float] = []
+        self._source_links: dict[int, set[LinkXY]] = defaultdict(set)
+
+    def add_source(
+            self, vertex: MachineVertex, partition_id: str, x: int, y: int,
+            keys: NDArray[numpy.uint32], rate: float) -> None:
+        """
+        Add the packets sent by a core.
+
+        :param vertex: The vertex sending the packets
+        :param partition_id: The ID of the partition the packets are for
+        :param x: The x-coordinate of the chip of the core
+        :param y: The y-coordinate of the chip of the core
+        :param keys: The keys sent
+        :param rate: The packets per second sent with each key
+        """
+        source = len(self._sources)
+        self._sources.append((vertex, partition_id))
+        self._source_rates.append(rate * len(keys))
+        self._send(x, y, _Packets(
+            keys, numpy.full(len(keys), rate),
+            numpy.full(len(keys), source, dtype=numpy.intp),
+            numpy.full(len(keys), _FROM_CORE, dtype=numpy.int8),
+            numpy.zeros(len(keys), dtype=numpy.int32)))
+
+    def run(self) -> None:
+        """
+        Route packets until none are left.
+        """
+        while self._to_visit:
+            x, y = self._to_visit.popleft()
+            self._route(x, y, self._pending.pop((x, y)))
+
+    def report(self) -> MulticastTrafficReport:
+        """
+        Get the totals found.
+
+        :returns: The rates of the links, routers, cores and sources
+        """
+        return MulticastTrafficReport(
+            self._link_rates, self._router_rates, self._core_rates,
+            self._dropped_rates, self._sources, self._source_rates,
+            self._source_links)
+
+    def _send(self, x: int, y: int, packets: _Packets) -> None:
+        """
+        Add packets to those waiting for the router of a chip.
+        """
+        if (x, y) not in self._pending:
+            self._to_visit.append((x, y))
+        self._pending[x, y].append(packets)
+
+    def _index(self, x: int, y: int) -> RoutingTableIndex | None:
+        """
+        Get the indexed routing table of a chip, if it has any entries.
+        """
+        if (x, y) not in self._indexes:
+            table = self._routing_tables.get_routing_table_for_chip(x, y)
+            self._indexes[x, y] = (
+                None if table is None or not table.number_of_entries
+                else RoutingTableIndex(table))
+        return self._indexes[x, y]
+
+    def _route(self, x: int, y: int, arrived: list[_Packets]) -> None:
+        """
+        Route all the packets waiting for the router of a chip.
+        """
+        packets = _Packets(*(
+            numpy.concatenate(arrays) for arrays in zip(*arrived)))
+        self._router_rates[x, y] += float(packets.rates.sum())
+
+        index = self._index(x, y)
+        if index is None:
+            entries = numpy.full(
+                len(packets.keys), NO_MATCH, dtype=numpy.intp)
+            routes = numpy.zeros(len(packets.keys), dtype=numpy.uint32)
+        else:
+            entries = index.lookup_keys(packets.keys)
+            routes = index.routes[entries]
+        unmatched = entries == NO_MATCH
+        from_core = packets.in_links == _FROM_CORE
+        # Default routing sends a packet out of the link opposite its
+        # in-link; packets from a core with no entry are dropped
+        routes[unmatched] = numpy.left_shift(
+            1, ((packets.in_links[unmatched] + 3) % _N_LINKS).astype(
+                numpy.uint32), dtype=numpy.uint32)
+        routes[unmatched & from_core] = 0
+        dropped = float(packets.rates[unmatched & from_core].sum())
+        too_far = packets.hops >= self._max_hops
+
+        # Only look at the links and cores some packet goes to
+        all_routes = int(numpy.bitwise_or.reduce(routes)) if len(routes) else 0
+        chip = self._machine.get_chip_at(x, y)
+        for link_id in range(_N_LINKS):
+            if not all_routes & (1 << link_id):
+                continue
+            used = (routes & (1 << link_id)) != 0
+            dropped += float(packets.rates[used & too_far].sum())
+            used &= ~too_far
+            link = None if chip is None else chip.router.get_link(link_id)
+            if link is None:
+                dropped += float(packets.rates[used].sum())
+                continue
+            if not used.any():
+                continue
+            self._link_rates[x, y, link_id] += float(
+                packets.rates[used].sum())
+            for source in numpy.flatnonzero(
+                    numpy.bincount(packets.sources[used])).tolist():
+                self._source_links[source].add((x, y, link_id))
+            self._send(link.destination_x, link.destination_y, _Packets(
+                packets.keys[used], packets.rates[used],
+                packets.sources[used],
+                numpy.full(numpy.count_nonzero(used),
+                           (link_id + 3) % _N_LINKS, dtype=numpy.int8),
+                packets.hops[used] + 1))
+
+        for bit in range(_N_LINKS, _ROUTE_BITS):
+            if all_routes & (1 << bit):
+                used = (routes & (1 << bit)) != 0
+                self._core_rates[x, y, bit - _N_LINKS] += float(
+                    packets.rates[used].sum())
+
+        if dropped:
+            self._dropped_rates[x, y] += dropped
@@ -0,0 +1,75 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Support for running the per-chip parts of the mapping algorithms in worker
+processes.
+
+The workers are forked, so they see the same :py:class:`PacmanDataView` as
+the parent without it having to be pickled.
+Only the items to work on and the results are passed between processes.
+"""
+import multiprocessing
+import os
+from collections.abc import Callable, Iterator, Sequence
+from typing import TypeVar
+
+from spinn_utilities.config_holder import get_config_int
+
+#: :meta private:
+T = TypeVar("T")
+#: :meta private:
+R = TypeVar("R")
+
+# How many chunks to give each process, to balance uneven work
+_CHUNKS_PER_PROCESS = 4
+
+
+def get_n_mapping_processes() -> int:
+    """
+    Get the number of processes the mapping algorithms may use.
+
+    :returns: The configured number of processes, one per CPU if configured
+        as 0 or less, or 1 if processes can not be forked on this platform.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return 1
+    n_processes = get_config_int("Mapping", "n_mapping_processes")
+    if n_processes < 1:
+        n_processes = os.cpu_count() or 1
+    return n_processes
+
+
+def map_in_processes(
+        function: Callable[[T], R], items: Sequence[T],
+        n_processes: int) -> Iterator[R]:
+    """
+    Apply a function to each item, possibly in parallel.
+
+    The function must be defined at module level so it can be found by the
+    workers, and the items and results must be picklable.
+
+    :param function: The function to apply to each item
+    :param items: The items to apply the function to
+    :param n_processes:
+        The number of processes to use; 1 or less runs in this process
+    :returns: The results in the same order as the items
+    """
+    if n_processes <= 1 or len(items) <= 1:
+        yield from map(function, items)
+        return
+    n_processes = min(n_processes, len(items))
+    chunk_size = max(1, len(items) // (n_processes * _CHUNKS_PER_PROCESS))
+    context = multiprocessing.get_context("fork")
+    with context.Pool(n_processes) as pool:
+        yield from pool.imap(function, items, chunk_size)
@@ -0,0 +1,346 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Saving the results of mapping to a file, and loading them again, so that
+the later stages of a run can be repeated without mapping again.
+"""
+
+import io
+import pickle
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import numpy
+
+from spinn_utilities.exceptions import SpiNNUtilsException
+
+from spinn_machine import MulticastRoutingEntry, RoutingEntry
+
+from pacman.data import PacmanDataView
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.exceptions import PacmanConfigurationException
+from pacman.model.graphs import AbstractVertex
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.placements import Placements
+from pacman.model.routing_tables import (
+    AbstractMulticastRoutingTable,
+    ColumnarMulticastRoutingTable,
+    CompressedMulticastRoutingTable,
+    UnCompressedMulticastRoutingTable,
+)
+
+# The version of the checkpoint format written
+_FORMAT_VERSION = 1
+
+# The kinds of routing table saved as arrays, by their code in the file
+_TABLE_KINDS: tuple[type[AbstractMulticastRoutingTable], ...] = (
+    UnCompressedMulticastRoutingTable, CompressedMulticastRoutingTable,
+    ColumnarMulticastRoutingTable)
+
+# The packages whose classes may be loaded from a checkpoint
+_SAFE_PACKAGES = ("pacman", "spinn_machine", "spinn_utilities")
+
+# Other classes and functions that may be loaded from a checkpoint
+_SAFE_NAMES = frozenset([
+    ("builtins", "dict"), ("builtins", "frozenset"), ("builtins", "list"),
+    ("builtins", "set"), ("builtins", "tuple"),
+    ("collections", "defaultdict"), ("collections", "OrderedDict"),
+    ("numpy", "dtype"), ("numpy", "ndarray"),
+    ("numpy.core.multiarray", "_reconstruct"),
+    ("numpy.core.multiarray", "scalar"),
+    ("numpy._core.multiarray", "_reconstruct"),
+    ("numpy._core.multiarray", "scalar")])
+
+
+def write_checkpoint(path: str) -> None:
+    """
+    Write the placements, routing information, tags, routing tables and
+    routing table by partition to a file, so that they can be loaded by
+    :py:func:`read_checkpoint` instead of mapping again.
+
+    Only the items currently available are written.
+    The vertices are not written; they are recorded by their labels, which
+    must be unique, and found again by label when the checkpoint is read.
+    The routing tables are written as arrays of keys, masks and routes, and
+    the whole file is compressed.
+
+    :param path: The file to write
+    :raises PacmanConfigurationException:
+        If a vertex has no label, or two vertices have the same label
+    """
+    state: dict[str, Any] = {}
+    getters: dict[str, Callable[[], Any]] = {
+        "placements": lambda: Placements(
+            PacmanDataView.iterate_placemements()),
+        "routing_infos": PacmanDataView.get_routing_infos,
+        "tags": PacmanDataView.get_tags,
+        "uncompressed": PacmanDataView.get_uncompressed,
+        "precompressed": PacmanDataView.get_precompressed,
+        "routing_table_by_partition":
+            PacmanDataView.get_routing_table_by_partition}
+    for name, getter in getters.items():
+        try:
+            state[name] = getter()
+        except SpiNNUtilsException:
+            pass
+    state["plan_n_timesteps"] = PacmanDataView.get_plan_n_timestep()
+
+    buffer = io.BytesIO()
+    pickler = _CheckpointPickler(buffer)
+    pickler.dump(state)
+
+    tables = pickler.tables
+    columns = [_columns(table) for table in tables]
+    arrays: dict[str, Any] = {
+        name: numpy.concatenate(
+            [numpy.zeros(0, dtype=dtype)] +
+            [column[i] for column in columns]).astype(dtype)
+        for i, (name, dtype) in enumerate((
+            ("keys", numpy.uint32), ("masks", numpy.uint32),
+            ("routes", numpy.uint32), ("defaultable", numpy.bool_)))}
+    with open(path, "wb") as f:
+        numpy.savez_compressed(
+            f, version=numpy.array(_FORMAT_VERSION),
+            state=numpy.frombuffer(buffer.getvalue(), dtype=numpy.uint8),
+            labels=numpy.array(
+                [label for _, label in pickler.labels], dtype=numpy.str_),
+            label_is_app=numpy.array(
+                [is_app for is_app, _ in pickler.labels], dtype=numpy.bool_),
+            table_kinds=numpy.array(
+                [_TABLE_KINDS.index(type(table)) for table in tables],
+                dtype=numpy.uint8),
+            table_xs=numpy.array(
+                [table.x for table in tables], dtype=numpy.uint32),
+            table_ys=numpy.array(
+                [table.y for table in tables], dtype=numpy.uint32),
+            table_sizes=numpy.array(
+                [table.number_of_entries for table in tables],
+                dtype=numpy.uint32),
+            **arrays)
+
+
+def _columns(table: AbstractMulticastRoutingTable) -> tuple[
+        numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """
+    Get the keys, masks, routes and defaultable flags of the entries of a
+    routing table as arrays.
+
+    :param table: The table to get the entries of
+    """
+    if isinstance(table, ColumnarMulticastRoutingTable):
+        return table.keys, table.masks, table.routes, table.defaultable
+    entries = table.multicast_routing_entries
+    return (
+        numpy.array([entry.key for entry in entries], dtype=numpy.uint32),
+        numpy.array([entry.mask for entry in entries], dtype=numpy.uint32),
+        numpy.array([entry.spinnaker_route for entry in entries],
+                    dtype=numpy.uint32),
+        numpy.array([entry.defaultable for entry in entries],
+                    dtype=numpy.bool_))
+
+
+def read_checkpoint(
+        path: str, writer: PacmanDataWriter,
+        vertices: Iterable[AbstractVertex] | None = None) -> None:
+    """
+    Read a file written by :py:func:`write_checkpoint` and set the items in
+    it on the writer.
+
+    .. warning::
+        Only read checkpoints from a trusted source; although only PACMAN,
+        SpiNNMachine and SpiNNUtils classes are loaded, these could still be
+        made to do unexpected things.
+
+    :param path: The file to read
+    :param writer: The writer to set the items on
+    :param vertices:
+        The vertices to find by label; if None the application vertices of
+        the graph and their machine vertices are used
+    :raises PacmanConfigurationException:
+        If the file is not a checkpoint of a known version, or a vertex
+        recorded in it is not found or not unique
+    """
+    try:
+        data = numpy.load(path, allow_pickle=False)
+    except ValueError as ex:
+        raise PacmanConfigurationException(
+            f"{path} is not a checkpoint") from ex
+    with data:
+        if "version" not in data or int(data["version"]) != _FORMAT_VERSION:
+            raise PacmanConfigurationException(
+                f"{path} is not a version {_FORMAT_VERSION} checkpoint")
+        state_bytes, labels = _read_index(data)
+        tables = _read_tables(data)
+
+    if vertices is None:
+        vertices = __graph_vertices()
+    found: dict[tuple[bool, str], AbstractVertex | None] = {}
+    for vertex in vertices:
+        key = (isinstance(vertex, ApplicationVertex), vertex.label or "")
+        # Remember that a label is not unique by mapping it to None
+        found[key] = None if key in found else vertex
+    loaded = []
+    for is_app, label in labels:
+        match = found.get((is_app, label))
+        if match is None:
+            state = "not unique" if (is_app, label) in found else "not found"
+            raise PacmanConfigurationException(
+                f"{'Application' if is_app else 'Machine'} vertex {label} "
+                f"in checkpoint {path} is {state}")
+        loaded.append(match)
+
+    state = _CheckpointUnpickler(
+        io.BytesIO(state_bytes), loaded, tables).load()
+    if "placements" in state:
+        writer.set_placements(state["placements"])
+    if "routing_infos" in state:
+        writer.set_routing_infos(state["routing_infos"])
+    if "tags" in state:
+        writer.set_tags(state["tags"])
+    if "uncompressed" in state:
+        writer.set_uncompressed(state["uncompressed"])
+    if "precompressed" in state:
+        writer.set_precompressed(state["precompressed"])
+    if "routing_table_by_partition" in state:
+        writer.set_routing_table_by_partition(
+            state["routing_table_by_partition"])
+    writer.set_plan_n_timesteps(state["plan_n_timesteps"])
+
+
+def __graph_vertices() -> Iterable[AbstractVertex]:
+    for app_vertex in PacmanDataView.iterate_vertices():
+        yield app_vertex
+        yield from app_vertex.machine_vertices
+
+
+def _read_index(data: Any) -> tuple[bytes, list[tuple[bool, str]]]:
+    """
+    Get the pickled state and the vertex labels saved in a checkpoint.
+
+    :param data: The arrays of the checkpoint
+    """
+    return data["state"].tobytes(), list(zip(
+        data["label_is_app"].tolist(), data["labels"].tolist()))
+
+
+def _read_tables(data: Any) -> list[AbstractMulticastRoutingTable]:
+    """
+    Make the routing tables saved as arrays in a checkpoint.
+
+    :param data: The arrays of the checkpoint
+    """
+    ends = numpy.cumsum(data["table_sizes"]).tolist()
+    keys = data["keys"]
+    masks = data["masks"]
+    routes = data["routes"]
+    defaultable = data["defaultable"]
+    tables: list[AbstractMulticastRoutingTable] = []
+    start = 0
+    for kind, x, y, end in zip(
+            data["table_kinds"].tolist(), data["table_xs"].tolist(),
+            data["table_ys"].tolist(), ends):
+        table_class = _TABLE_KINDS[kind]
+        if table_class is ColumnarMulticastRoutingTable:
+            table = ColumnarMulticastRoutingTable(x, y)
+            table.add_entries(
+                keys[start:end], masks[start:end], routes[start:end],
+                defaultable[start:end])
+        else:
+            table = table_class(x, y, [
+                MulticastRoutingEntry(key, mask, RoutingEntry(
+                    spinnaker_route=route, defaultable=is_defaultable))
+                for key, mask, route, is_defaultable in zip(
+                    keys[start:end].tolist(), masks[start:end].tolist(),
+                    routes[start:end].tolist(),
+                    defaultable[start:end].tolist())])
+        tables.append(table)
+        start = end
+    return tables
+
+
+class _CheckpointPickler(pickle.Pickler):
+    """
+    Pickles the mapping results, recording vertices by label and routing
+    tables by index so that they can be saved separately.
+    """
+
+    def __init__(self, file: io.BytesIO):
+        """
+        :param file: Where to write the pickle
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        #: Whether each vertex recorded is an application vertex, and its
+        #: label
+        self.labels: list[tuple[bool, str]] = []
+        #: The routing tables recorded
+        self.tables: list[AbstractMulticastRoutingTable] = []
+        self.__vertex_ids: dict[AbstractVertex, int] = {}
+        self.__labels_used: dict[tuple[bool, str], AbstractVertex] = {}
+        self.__table_ids: dict[int, int] = {}
+
+    def persistent_id(self, obj: Any) -> tuple[str, int] | None:
+        if isinstance(obj, AbstractVertex):
+            return ("vertex", self.__vertex_id(obj))
+        if type(obj) in _TABLE_KINDS:
+            if id(obj) not in self.__table_ids:
+                self.__table_ids[id(obj)] = len(self.tables)
+                self.tables.append(obj)
+            return ("table", self.__table_ids[id(obj)])
+        return None
+
+    def __vertex_id(self, vertex: AbstractVertex) -> int:
+        if vertex in self.__vertex_ids:
+            return self.__vertex_ids[vertex]
+        if vertex.label is None:
+            raise PacmanConfigurationException(
+                f"Vertex {vertex} can not be saved as it has no label")
+        key = (isinstance(vertex, ApplicationVertex), vertex.label)
+        if key in self.__labels_used:
+            raise PacmanConfigurationException(
+                f"Vertices {self.__labels_used[key]} and {vertex} can not "
+                f"be saved as they have the same label {vertex.label}")
+        self.__labels_used[key] = vertex
+        self.__vertex_ids[vertex] = len(self.labels)
+        self.labels.append(key)
+        return self.__vertex_ids[vertex]
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+    """
+    Unpickles the mapping results, finding the vertices and routing tables
+    by the index they were recorded with.
+    """
+
+    def __init__(
+            self, file: io.BytesIO, vertices: list[AbstractVertex],
+            tables: list[AbstractMulticastRoutingTable]):
+        """
+        :param file: Where to read the pickle from
+        :param vertices: The vertices in the order they were recorded
+        :param tables: The routing tables in the order they were recorded
+        """
+        super().__init__(file)
+        self.__loaded: dict[str, list[Any]] = {
+            "vertex": vertices, "table": tables}
+
+    def persistent_load(self, pid: Any) -> Any:
+        kind, index = pid
+        return self.__loaded[kind][index]
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module.split(".")[0] not in _SAFE_PACKAGES and
+                (module, name) not in _SAFE_NAMES):
+            raise PacmanConfigurationException(
+                f"Checkpoint may not contain {module}.{name}")
+        return super().find_class(module, name)
@@ -0,0 +1,241 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Named spans recording the time and memory taken by the phases of mapping.
+
+The mapping algorithms mark their phases with :py:func:`span`, which does
+nothing unless a :py:class:`SpanRecorder` is recording.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import TracebackType
+from typing import NamedTuple
+
+from spinn_utilities.typing.json import JsonArray, JsonObject
+
+# The recorder the spans are currently recorded by, if any
+_recorder: "SpanRecorder | None" = None
+
+
+class Span(NamedTuple):
+    """
+    The time and memory taken by one named phase.
+    """
+    #: The name of the phase
+    name: str
+    #: The number of spans this span is inside
+    depth: int
+    #: When the span started, in seconds after the recording started
+    start: float
+    #: The wall clock time taken, in seconds
+    wall_time: float
+    #: The CPU time taken by this process, in seconds
+    cpu_time: float
+    #: The most bytes allocated at once during the span above those
+    #: allocated when it started, or None if memory was not traced
+    memory_peak: int | None
+
+
+class _OpenSpan:
+    """
+    The measurements taken at the start of a span which has not ended.
+    """
+    __slots__ = ("name", "start", "cpu_start", "memory_start", "peak")
+
+    def __init__(self, name: str, trace_memory: bool):
+        """
+        :param name: The name of the span
+        :param trace_memory: Whether to take the memory in use, resetting
+            the traced peak
+        """
+        self.name = name
+        self.start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        if trace_memory:
+            self.memory_start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        else:
+            self.memory_start = 0
+        # The highest peak seen before the peak was last reset
+        self.peak = 0
+
+
+class SpanRecorder:
+    """
+    Records the spans of the phases run while it is in use as a context
+    manager.
+
+    Only spans in this process are recorded; the work done by worker
+    processes is in the wall time of the span that waits for them, but not
+    in its CPU time or memory.
+
+    .. code-block:: python
+
+        with SpanRecorder(trace_memory=True) as recorder:
+            place_application_graph(Placements())
+        recorder.write_json("mapping_trace.json")
+    """
+
+    __slots__ = (
+        # Whether the memory allocated is measured
+        "_trace_memory",
+        # Whether tracemalloc was started by this recorder
+        "_started_tracing",
+        # The spans which have ended, in the order they ended
+        "_spans",
+        # The spans which have started but not ended, outermost first
+        "_open",
+        # The perf_counter value when recording started
+        "_origin",
+        # The recorder in use before this one
+        "_previous")
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        :param trace_memory:
+            Whether to measure the peak memory allocated in each span, which
+            makes everything run more slowly.  If needed, tracemalloc is
+            started while recording and stopped afterwards.
+        """
+        self._trace_memory = trace_memory
+        self._started_tracing = False
+        self._spans: list[Span] = []
+        self._open: list[_OpenSpan] = []
+        self._origin = time.perf_counter()
+        self._previous: SpanRecorder | None = None
+
+    def __enter__(self) -> "SpanRecorder":
+        global _recorder  # pylint: disable=global-statement
+        if self._trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._origin = time.perf_counter()
+        self._previous = _recorder
+        _recorder = self
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc_val: BaseException | None,
+                 exc_tb: TracebackType | None) -> None:
+        global _recorder  # pylint: disable=global-statement
+        _recorder = self._previous
+        self._previous = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _begin(self, name: str) -> None:
+        if self._trace_memory and self._open:
+            # The peak is about to be reset, so keep it for the outer spans
+            _, peak = tracemalloc.get_traced_memory()
+            outer = self._open[-1]
+            outer.peak = max(outer.peak, peak)
+        self._open.append(_OpenSpan(name, self._trace_memory))
+
+    def _end(self) -> None:
+        wall_end = time.perf_counter()
+        cpu_end = time.process_time()
+        opened = self._open.pop()
+        memory_peak = None
+        if self._trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(opened.peak, peak)
+            memory_peak = max(0, peak - opened.memory_start)
+            if self._open:
+                outer = self._open[-1]
+                outer.peak = max(outer.peak, peak)
+        self._spans.append(Span(
+            opened.name, len(self._open), opened.start - self._origin,
+            wall_end - opened.start, cpu_end - opened.cpu_start,
+            memory_peak))
+
+    @property
+    def spans(self) -> list[Span]:
+        """
+        The spans which have ended, in the order they started.
+        """
+        return sorted(self._spans, key=lambda s: (s.start, s.depth))
+
+    def total(self, name: str) -> float:
+        """
+        Get the total wall clock time of all the spans with a name.
+
+        :param name: The name of the spans
+        :return: The time in seconds
+        """
+        return sum(s.wall_time for s in self._spans if s.name == name)
+
+    def to_json(self) -> JsonObject:
+        """
+        Get the spans in the Trace Event Format, which can be viewed in
+        a trace viewer or compared between runs.
+
+        :return: An object with a ``traceEvents`` list holding a complete
+            event for each span, in microseconds
+        """
+        pid = os.getpid()
+        events: JsonArray = []
+        for s in self.spans:
+            args: JsonObject = {
+                "depth": s.depth, "cpu_time_us": s.cpu_time * 1e6}
+            if s.memory_peak is not None:
+                args["memory_peak_bytes"] = s.memory_peak
+            events.append({
+                "name": s.name, "cat": "pacman", "ph": "X", "pid": pid,
+                "tid": 0, "ts": s.start * 1e6, "dur": s.wall_time * 1e6,
+                "args": args})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_json(self, path: str) -> None:
+        """
+        Write the spans to a file in the Trace Event Format.
+
+        :param path: The file to write
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f, indent=1)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Mark a phase of the work to be recorded by the :py:class:`SpanRecorder`
+    in use, if any.
+
+    Can be used as a context manager or a decorator:
+
+    .. code-block:: python
+
+        @span("my_algorithm")
+        def my_algorithm():
+            with span("first stage"):
+                ...
+
+    :param name: The name of the phase
+    :returns: A context manager, which can also be used as a decorator
+    """
+    recorder = _recorder
+    if recorder is None:
+        yield
+        return
+    recorder._begin(name)  # pylint: disable=protected-access
+    try:
+        yield
+    finally:
+        recorder._end()  # pylint: disable=protected-access
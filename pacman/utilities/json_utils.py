@@ -78,6 +78,8 @@ def iptag_resource_to_json(iptag: IPtagResource) -> JsonObject:
         if iptag.tag is not None:
             json_dict["tag"] = iptag.tag
         json_dict["traffic_identifier"] = iptag.traffic_identifier
+        if iptag.rate is not None:
+            json_dict["rate"] = iptag.rate
     except Exception as ex:  # pylint: disable=broad-except
         json_dict["exception"] = str(ex)
     return json_dict
@@ -93,7 +95,8 @@ def iptag_resource_from_json(json_dict: JsonObject) -> IPtagResource:
     return IPtagResource(
         cast(str, json_dict["ip_address"]), cast(int, json_dict.get("port")),
         cast(bool, json_dict["strip_sdp"]), cast(int, json_dict.get("tag")),
-        cast(str, json_dict["traffic_identifier"]))
+        cast(str, json_dict["traffic_identifier"]),
+        cast(float | None, json_dict.get("rate")))
 
 
 def iptag_resources_to_json(iptags: Iterable[IPtagResource]) -> JsonArray:
@@ -13,10 +13,12 @@
 # limitations under the License.
 
 from .non_legacy_app_vertex import NonLegacyApplicationVertex
+from .simple_test_2d_vertex import SimpleTest2DVertex
 from .simple_test_edge import SimpleTestEdge
 from .simple_test_vertex import SimpleTestVertex
 
 __all__ = [
     "NonLegacyApplicationVertex",
+    "SimpleTest2DVertex",
     "SimpleTestEdge",
     "SimpleTestVertex"]
@@ -0,0 +1,41 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks of the mapping algorithms on synthetic networks of several sizes.
+
+Run them with ``python -m pacman_test_objects.benchmarks --help``.
+"""
+
+from .mapping_benchmark import (
+    COMPRESSORS,
+    NETWORKS,
+    BenchmarkResult,
+    run_mapping_benchmark,
+)
+from .networks import (
+    all_to_all_network,
+    convolution_network,
+    local_network,
+    random_network,
+)
+
+__all__ = [
+    "BenchmarkResult",
+    "COMPRESSORS",
+    "NETWORKS",
+    "all_to_all_network",
+    "convolution_network",
+    "local_network",
+    "random_network",
+    "run_mapping_benchmark"]
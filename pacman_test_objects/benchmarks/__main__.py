@@ -0,0 +1,77 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Runs the mapping benchmarks for each network on machines of each size,
+printing the time of each phase and optionally saving all the results.
+"""
+
+import argparse
+import json
+
+from spinn_utilities.config_holder import set_config
+
+from pacman.config_setup import unittest_setup
+
+from .mapping_benchmark import COMPRESSORS, NETWORKS, run_mapping_benchmark
+
+
+def main() -> None:
+    """
+    Run the benchmarks selected on the command line.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m pacman_test_objects.benchmarks",
+        description="Time the mapping algorithms on synthetic networks")
+    parser.add_argument(
+        "--networks", nargs="+", choices=sorted(NETWORKS),
+        default=sorted(NETWORKS), help="the networks to map")
+    parser.add_argument(
+        "--boards", nargs="+", type=int, default=[1, 3, 6],
+        help="the numbers of boards in the machines to map onto")
+    parser.add_argument(
+        "--compressors", nargs="+", choices=sorted(COMPRESSORS),
+        default=sorted(COMPRESSORS), help="the compressors to run")
+    parser.add_argument(
+        "--memory", action="store_true",
+        help="record the peak memory of each phase, which is slower")
+    parser.add_argument(
+        "--output", help="a JSON file to save the results and spans to")
+    args = parser.parse_args()
+
+    unittest_setup()
+    set_config("Machine", "version", "5")
+    results = []
+    for network in args.networks:
+        for n_boards in args.boards:
+            result = run_mapping_benchmark(
+                network, n_boards, args.compressors, args.memory)
+            results.append(result)
+            print(f"\n{network} on {n_boards} boards: "
+                  f"{result.n_vertices} vertices, {result.n_edges} edges, "
+                  f"{result.n_machine_vertices} machine vertices, "
+                  f"largest table {result.max_table_size} entries")
+            peaks = {s.name: s.memory_peak
+                     for s in result.spans if s.depth == 0}
+            for phase, wall_time in result.phase_times.items():
+                peak = peaks[phase]
+                memory = "" if peak is None else f" {peak / 2 ** 20:9.2f}MiB"
+                print(f"    {phase:45} {wall_time:9.3f}s{memory}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump([result.to_json() for result in results], f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Runs the mapping algorithms end to end on synthetic networks, recording
+the time and memory taken by each phase.
+"""
+
+import functools
+import logging
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.typing.json import JsonObject
+
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.exceptions import MinimisationFailedError
+from pacman.model.placements import Placements
+from pacman.model.routing_tables import MulticastRoutingTables
+from pacman.operations.partition_algorithms import splitter_partitioner
+from pacman.operations.placer_algorithms import place_application_graph
+from pacman.operations.router_algorithms.application_router import (
+    route_application_graph,
+)
+from pacman.operations.router_compressors import (
+    budgeted_compressor,
+    pair_compressor,
+    portfolio_compressor,
+    range_compressor,
+)
+from pacman.operations.router_compressors.\
+    ordered_covering_router_compressor import ordered_covering_compressor
+from pacman.operations.routing_info_allocator_algorithms import (
+    ZonedRoutingInfoAllocator,
+)
+from pacman.operations.routing_table_generators import (
+    merged_routing_table_generator,
+)
+from pacman.utilities.instrumentation import Span, SpanRecorder, span
+
+from .networks import (
+    all_to_all_network,
+    convolution_network,
+    local_network,
+    random_network,
+)
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The networks which can be benchmarked, each made by a function which is
+#: given the number of boards and uses about half of their cores
+NETWORKS: dict[str, Callable[[int], None]] = {
+    "random": lambda n_boards: random_network(50 * n_boards, seed=1),
+    "local": lambda n_boards: local_network(5 * n_boards, 10),
+    "all_to_all": lambda n_boards: all_to_all_network(10 * n_boards),
+    "convolution": lambda n_boards: convolution_network(5, 5 * n_boards),
+}
+
+#: The compressors which can be benchmarked, none of which fail if the
+#: tables are too big, except ordered covering which does not allow it
+COMPRESSORS: dict[str, Callable[[], MulticastRoutingTables]] = {
+    "range_compressor": functools.partial(
+        range_compressor, accept_overflow=True),
+    "pair_compressor": functools.partial(
+        pair_compressor, accept_overflow=True),
+    "ordered_covering_compressor": ordered_covering_compressor,
+    "budgeted_compressor": functools.partial(
+        budgeted_compressor, accept_overflow=True),
+    "portfolio_compressor": functools.partial(
+        portfolio_compressor, accept_overflow=True),
+}
+
+
+class BenchmarkResult(NamedTuple):
+    """
+    The result of running the mapping algorithms on one network.
+    """
+    #: The name of the network in :py:data:`NETWORKS`
+    network: str
+    #: The number of boards in the machine
+    n_boards: int
+    #: The number of application vertices
+    n_vertices: int
+    #: The number of application edges
+    n_edges: int
+    #: The number of machine vertices made by partitioning
+    n_machine_vertices: int
+    #: The number of entries in the largest table before compression
+    max_table_size: int
+    #: The number of entries in the largest table made by each compressor,
+    #: or None if the compressor failed
+    compressed_sizes: dict[str, int | None]
+    #: The spans of the phases and of the algorithms within them
+    spans: list[Span]
+
+    @property
+    def phase_times(self) -> dict[str, float]:
+        """
+        The wall clock time taken by each phase, in seconds.
+        """
+        return {s.name: s.wall_time for s in self.spans if s.depth == 0}
+
+    def to_json(self) -> JsonObject:
+        """
+        Get the result in a form which can be saved as JSON.
+
+        :return: The result, with a list of the spans
+        """
+        return {
+            "network": self.network,
+            "n_boards": self.n_boards,
+            "n_vertices": self.n_vertices,
+            "n_edges": self.n_edges,
+            "n_machine_vertices": self.n_machine_vertices,
+            "max_table_size": self.max_table_size,
+            "compressed_sizes": dict(self.compressed_sizes),
+            "spans": [{
+                "name": s.name, "depth": s.depth, "start": s.start,
+                "wall_time": s.wall_time, "cpu_time": s.cpu_time,
+                "memory_peak": s.memory_peak} for s in self.spans]}
+
+
+def run_mapping_benchmark(
+        network: str, n_boards: int,
+        compressors: Iterable[str] | None = None,
+        trace_memory: bool = False) -> BenchmarkResult:
+    """
+    Partition, place, route, allocate keys, generate routing tables and
+    compress them for a network on a virtual machine, recording each phase.
+
+    The data is reset and a new machine set before the network is made.
+    The version of the machine must already be set in the configuration.
+    Tables are compressed as far as possible, so every compressor works
+    on every table, not just those too big to fit.
+
+    :param network: The name of the network in :py:data:`NETWORKS`
+    :param n_boards: The number of boards in the virtual machine
+    :param compressors: The names of the compressors in
+        :py:data:`COMPRESSORS` to run, or None to run all of them
+    :param trace_memory:
+        Whether to record the peak memory of each phase, which makes them
+        take longer
+    :return: The sizes of the network and its tables, and the spans
+    :raises KeyError: If the network or a compressor is not known
+    """
+    build_network = NETWORKS[network]
+    if compressors is None:
+        compressors = COMPRESSORS
+    compressor_calls = {name: COMPRESSORS[name] for name in compressors}
+
+    writer = PacmanDataWriter.mock()
+    writer.set_machine(virtual_machine_by_boards(n_boards))
+    set_config(
+        "Mapping", "router_table_compress_as_far_as_possible", "True")
+    build_network(n_boards)
+
+    compressed_sizes: dict[str, int | None] = {}
+    with SpanRecorder(trace_memory) as recorder:
+        with span("partitioning"):
+            splitter_partitioner()
+        with span("placement"):
+            writer.set_placements(place_application_graph(Placements()))
+        with span("routing"):
+            writer.set_routing_table_by_partition(route_application_graph())
+        with span("key allocation"):
+            writer.set_routing_infos(ZonedRoutingInfoAllocator().allocate())
+        with span("table generation"):
+            tables = merged_routing_table_generator()
+        writer.set_uncompressed(tables)
+        writer.set_precompressed(tables)
+        for name, compress in compressor_calls.items():
+            try:
+                with span(f"compression with {name}"):
+                    compressed = compress()
+                compressed_sizes[name] = (
+                    compressed.get_max_number_of_entries())
+            except MinimisationFailedError as e:
+                logger.warning("{} failed: {}", name, e)
+                compressed_sizes[name] = None
+
+    return BenchmarkResult(
+        network, n_boards, writer.get_n_vertices(), len(writer.get_edges()),
+        writer.get_n_machine_vertices(), tables.get_max_number_of_entries(),
+        compressed_sizes, recorder.spans)
@@ -0,0 +1,147 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Generators of synthetic application graphs of different shapes.
+
+Each adds its vertices and edges to the application graph of the
+:py:class:`PacmanDataWriter`, which must be requiring mapping.
+"""
+
+import random
+
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.model.partitioner_splitters import SplitterFixedLegacy
+
+from pacman_test_objects.simple_test_2d_vertex import SimpleTest2DVertex
+from pacman_test_objects.simple_test_edge import SimpleTestEdge
+from pacman_test_objects.simple_test_vertex import SimpleTestVertex
+
+#: The name of the outgoing edge partition of every vertex
+PARTITION_NAME = "benchmark"
+
+
+def __add_vertices(
+        prefix: str, n_vertices: int, n_atoms: int,
+        atoms_per_core: int) -> list[SimpleTestVertex]:
+    vertices = [
+        SimpleTestVertex(
+            n_atoms, f"{prefix}{i}", max_atoms_per_core=atoms_per_core,
+            splitter=SplitterFixedLegacy())
+        for i in range(n_vertices)]
+    for vertex in vertices:
+        PacmanDataWriter.add_vertex(vertex)
+    return vertices
+
+
+def __add_edge(pre: SimpleTestVertex, post: SimpleTestVertex) -> None:
+    PacmanDataWriter.add_edge(SimpleTestEdge(pre, post), PARTITION_NAME)
+
+
+def random_network(
+        n_vertices: int, n_targets: int = 10, n_atoms: int = 256,
+        atoms_per_core: int = 32, seed: int | None = None) -> None:
+    """
+    Add vertices which each send to a number of vertices chosen at random,
+    possibly including themselves.
+
+    :param n_vertices: The number of vertices to add
+    :param n_targets: The number of vertices each vertex sends to, which
+        is reduced to n_vertices if larger
+    :param n_atoms: The number of atoms in each vertex
+    :param atoms_per_core: The most atoms of a vertex on each core
+    :param seed: The seed of the random choices, or None for different
+        choices each time
+    """
+    rng = random.Random(seed)
+    vertices = __add_vertices("random", n_vertices, n_atoms, atoms_per_core)
+    for pre in vertices:
+        for post in rng.sample(vertices, min(n_targets, n_vertices)):
+            __add_edge(pre, post)
+
+
+def local_network(
+        width: int, height: int, radius: int = 1, n_atoms: int = 256,
+        atoms_per_core: int = 32) -> None:
+    """
+    Add a grid of vertices which each send to themselves and the vertices
+    around them, with the grid wrapping around at the edges.
+
+    :param width: The number of vertices across the grid
+    :param height: The number of vertices up the grid
+    :param radius: How many vertices away in each direction the vertices
+        each send to
+    :param n_atoms: The number of atoms in each vertex
+    :param atoms_per_core: The most atoms of a vertex on each core
+    """
+    vertices = __add_vertices(
+        "local", width * height, n_atoms, atoms_per_core)
+    for x in range(width):
+        for y in range(height):
+            pre = vertices[x * height + y]
+            # A set so that small grids do not have the same edge twice
+            targets = {
+                ((x + dx) % width) * height + (y + dy) % height
+                for dx in range(-radius, radius + 1)
+                for dy in range(-radius, radius + 1)}
+            for target in sorted(targets):
+                __add_edge(pre, vertices[target])
+
+
+def all_to_all_network(
+        n_vertices: int, n_atoms: int = 1024,
+        atoms_per_core: int = 32) -> None:
+    """
+    Add vertices which each send to every vertex, including themselves.
+
+    :param n_vertices: The number of vertices to add
+    :param n_atoms: The number of atoms in each vertex
+    :param atoms_per_core: The most atoms of a vertex on each core
+    """
+    vertices = __add_vertices(
+        "all_to_all", n_vertices, n_atoms, atoms_per_core)
+    for pre in vertices:
+        for post in vertices:
+            __add_edge(pre, post)
+
+
+def convolution_network(
+        n_layers: int, n_channels: int, width: int = 32, height: int = 32,
+        atoms_per_core: tuple[int, int] = (8, 8)) -> None:
+    """
+    Add layers of two dimensional vertices, one for each channel, where
+    every channel of a layer sends to every channel of the next layer, as
+    in a convolutional network.  The vertices are split into rectangles,
+    each described by an :py:class:`MDSlice`.
+
+    :param n_layers: The number of layers
+    :param n_channels: The number of vertices in each layer
+    :param width: The number of atoms across each vertex
+    :param height: The number of atoms up each vertex
+    :param atoms_per_core: The size of the rectangle of atoms on each core,
+        which must divide the width and height
+    """
+    layers: list[list[SimpleTestVertex]] = []
+    for layer in range(n_layers):
+        vertices: list[SimpleTestVertex] = [
+            SimpleTest2DVertex(
+                width, height, f"conv{layer}_{channel}", atoms_per_core,
+                splitter=SplitterFixedLegacy())
+            for channel in range(n_channels)]
+        for vertex in vertices:
+            PacmanDataWriter.add_vertex(vertex)
+        layers.append(vertices)
+    for pres, posts in zip(layers, layers[1:]):
+        for pre in pres:
+            for post in posts:
+                __add_edge(pre, post)
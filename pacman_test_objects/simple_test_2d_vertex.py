@@ -0,0 +1,55 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" test vertex with two dimensional atoms
+"""
+
+from spinn_utilities.overrides import overrides
+
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.partitioner_splitters import AbstractSplitterCommon
+
+from .simple_test_vertex import SimpleTestVertex
+
+
+class SimpleTest2DVertex(SimpleTestVertex):
+    """
+    test vertex with its atoms in a grid, split into rectangles which are
+    each described by an :py:class:`MDSlice`
+    """
+
+    def __init__(self, width: int, height: int,
+                 label: str = "test2DVertex",
+                 atoms_per_core: tuple[int, int] = (16, 16),
+                 fixed_sdram_value: int | None = None,
+                 splitter: AbstractSplitterCommon | None = None):
+        """
+        :param width: The number of atoms in the first dimension
+        :param height: The number of atoms in the second dimension
+        :param label:
+        :param atoms_per_core: The size of the rectangle on each core, which
+            must divide the width and height
+        :param fixed_sdram_value:
+        :param splitter:
+        """
+        super().__init__(
+            width * height, label, atoms_per_core[0] * atoms_per_core[1],
+            fixed_sdram_value, splitter)
+        self.__atoms_shape = (width, height)
+        self._set_max_atoms_per_dimension_per_core(atoms_per_core)
+
+    @property
+    @overrides(ApplicationVertex.atoms_shape)
+    def atoms_shape(self) -> tuple[int, ...]:
+        return self.__atoms_shape
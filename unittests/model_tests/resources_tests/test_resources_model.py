@@ -135,6 +135,14 @@ class TestResourceModels(unittest.TestCase):
         self.assertEqual(str(iptr),
                          "IPTagResource(ip_address=1.2.3.4, port=2, "
                          "strip_sdp=False, tag=4, traffic_identifier=bacon)")
+        self.assertIsNone(iptr.rate)
+        iptr2 = IPtagResource("1.2.3.4", 2, False, 4, "bacon", rate=2.5)
+        self.assertEqual(iptr2.rate, 2.5)
+        self.assertNotEqual(iptr, iptr2)
+        self.assertEqual(str(iptr2),
+                         "IPTagResource(ip_address=1.2.3.4, port=2, "
+                         "strip_sdp=False, tag=4, traffic_identifier=bacon, "
+                         "rate=2.5)")
 
         ReverseIPtagResource()  # Minimal args
         riptr = ReverseIPtagResource(1, 2, 3)
@@ -14,16 +14,20 @@
 
 import unittest
 
+import numpy
+
 from pacman.config_setup import unittest_setup
 from pacman.exceptions import (
     IrregularFixedMaskException,
     PacmanAlreadyExistsException,
     PacmanConfigurationException,
+    PacmanRouteInfoAllocationException,
     PacmanValueError,
 )
 from pacman.model.graphs.machine import SimpleMachineVertex
 from pacman.model.resources import ConstantSDRAM
 from pacman.model.routing_info import (
+    NO_VERTEX,
     BaseKeyAndMask,
     FixedAppVertexRoutingInfo,
     FixedMachineVertexRoutingInfo,
@@ -382,6 +386,99 @@ class TestRoutingInfo(unittest.TestCase):
         self.assertEqual(info.machine_index_mask, 0x00FFFF00)
         self.assertEqual(info.atom_mask, 0x000000FF)
 
+    def test_key_index(self) -> None:
+        global_app = 0xff000000
+        global_mac = 0xffffff00
+        routing_info = RoutingInfo()
+        vertex1 = SimpleMachineVertex(ConstantSDRAM(0))
+        vertex2 = SimpleMachineVertex(ConstantSDRAM(0))
+        vertex3 = SimpleMachineVertex(ConstantSDRAM(0))
+        info1 = GlobalMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x01000100, global_mac), "test", vertex1, 1,
+            global_app)
+        info2 = GlobalMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x01000000, global_mac), "test", vertex2, 0,
+            global_app)
+        routing_info.add_routing_info(info1)
+        routing_info.add_routing_info(info2)
+        # App level info must not be decoded
+        app_vertex = SimpleTestVertex(4, "app")
+        routing_info.add_routing_info(GlobalAppVertexRoutingInfo(
+            BaseKeyAndMask(0x01000000, global_app), "test", app_vertex, 1,
+            global_mac))
+
+        index = routing_info.get_key_index()
+        self.assertIs(index, routing_info.get_key_index())
+        self.assertEqual(2, len(index))
+        vertex_ids, atoms = index.decode(numpy.array(
+            [0x01000105, 0x010000FF, 0x01000200, 0x02000000]))
+        self.assertEqual(
+            [index.vertices[v] for v in vertex_ids[:2]], [vertex1, vertex2])
+        self.assertEqual(list(atoms[:2]), [5, 255])
+        self.assertEqual(list(vertex_ids[2:]), [NO_VERTEX, NO_VERTEX])
+        self.assertEqual(list(atoms[2:]), [NO_VERTEX, NO_VERTEX])
+
+        # Adding info throws away the old index
+        bka = BaseKeyAndMask(0x11000000, 0xFFF00000)
+        bkm = BaseKeyAndMask(0x11002000, 0xFFF3b000)
+        routing_info.add_routing_info(FixedMachineVertexRoutingInfo(
+            bkm, "test", vertex3, 2, bka))
+        index = routing_info.get_key_index()
+        self.assertEqual(3, len(index))
+        decoded = index.decode_key(0x11002000 | (1 << 14) | 5)
+        assert decoded is not None
+        self.assertEqual(decoded[0].vertex, vertex3)
+        self.assertEqual(decoded[1], (1 << 12) | 5)
+        self.assertIsNone(index.decode_key(0x11001000))
+
+    def test_key_index_overlap(self) -> None:
+        routing_info = RoutingInfo()
+        vertex1 = SimpleMachineVertex(ConstantSDRAM(0))
+        vertex2 = SimpleMachineVertex(ConstantSDRAM(0))
+        routing_info.add_routing_info(GlobalMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x100, 0xFFFFFF00), "test", vertex1, 0,
+            0xFFFF0000))
+        routing_info.add_routing_info(GlobalMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x180, 0xFFFFFFF0), "test", vertex2, 1,
+            0xFFFF0000))
+        with self.assertRaises(PacmanRouteInfoAllocationException):
+            routing_info.get_key_index()
+
+    def test_key_index_irregular_overlap(self) -> None:
+        vertex1 = SimpleMachineVertex(ConstantSDRAM(0))
+        vertex2 = SimpleMachineVertex(ConstantSDRAM(0))
+        vertex3 = SimpleMachineVertex(ConstantSDRAM(0))
+        bka = BaseKeyAndMask(0x11000000, 0xFFF00000)
+        irregular = FixedMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x11002000, 0xFFF3b000), "test", vertex1, 0, bka)
+
+        # Overlapping a regular interval
+        routing_info = RoutingInfo()
+        routing_info.add_routing_info(irregular)
+        routing_info.add_routing_info(GlobalMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x11006000, 0xFFFFF000), "test", vertex2, 1,
+            0xFFF00000))
+        with self.assertRaises(PacmanRouteInfoAllocationException):
+            routing_info.get_key_index()
+
+        # Overlapping another irregular mask
+        routing_info = RoutingInfo()
+        routing_info.add_routing_info(irregular)
+        routing_info.add_routing_info(FixedMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x11002001, 0xFFF3b001), "test", vertex3, 2, bka))
+        with self.assertRaises(PacmanRouteInfoAllocationException):
+            routing_info.get_key_index()
+
+        # Not overlapping either
+        routing_info = RoutingInfo()
+        routing_info.add_routing_info(irregular)
+        routing_info.add_routing_info(GlobalMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x11001000, 0xFFFFF000), "test", vertex2, 1,
+            0xFFF00000))
+        routing_info.add_routing_info(FixedMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x11003000, 0xFFF3b000), "test", vertex3, 2, bka))
+        self.assertEqual(3, len(routing_info.get_key_index()))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,8 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
 
+import numpy
 from parameterized import parameterized
 
 from spinn_utilities.config_holder import set_config
@@ -23,19 +29,31 @@ from spinn_machine.exceptions import SpinnMachineInvalidParameterException
 from spinn_machine.version import MANY_BOARD_TYPES
 
 from pacman.config_setup import unittest_setup
-from pacman.exceptions import PacmanAlreadyExistsException
+from pacman.exceptions import (
+    PacmanAlreadyExistsException,
+    PacmanInvalidParameterException,
+)
 from pacman.model.graphs.machine import SimpleMachineVertex
 from pacman.model.routing_table_by_partition import (
     MulticastRoutingTableByPartition,
 )
 from pacman.model.routing_tables import (
+    ColumnarMulticastRoutingTable,
+    CompressedMulticastRoutingTable,
     MulticastRoutingTables,
+    RoutingTableIndex,
     UnCompressedMulticastRoutingTable,
+    to_columnar,
 )
 from pacman.model.routing_tables.multicast_routing_tables import (
+    from_binary,
     from_json,
+    iter_json_tables,
+    read_binary_table,
+    to_binary,
     to_json,
 )
+from pacman.model.routing_tables.routing_table_index import NO_MATCH
 from pacman.utilities import file_format_schemas
 
 
@@ -174,6 +192,95 @@ class TestRoutingTable(unittest.TestCase):
         self.assertEqual(new_tables.get_routing_table_for_chip(1, 0), t2)
         self.assertEqual(new_tables.get_routing_table_for_chip(2, 0), None)
 
+    def test_binary_multicast_routing_tables(self) -> None:
+        t1 = UnCompressedMulticastRoutingTable(0, 0, [
+            MulticastRoutingEntry(key, 0xFFFFFF00, RoutingEntry(
+                spinnaker_route=key >> 8, defaultable=(key == 0x300)))
+            for key in range(0, 0x1000, 0x100)])
+        t2 = UnCompressedMulticastRoutingTable(3, 2, [
+            MulticastRoutingEntry(0x80000000, 0x80000000, RoutingEntry(
+                processor_ids=[2, 17], link_ids=[5]))])
+        t3 = UnCompressedMulticastRoutingTable(1, 1)
+        tables = MulticastRoutingTables([t1, t2, t3])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, "tables.bin")
+            to_binary(tables, file_name)
+            new_tables = from_binary(file_name)
+            self.assertEqual(3, len(new_tables))
+            for table in tables:
+                new_table = new_tables.get_routing_table_for_chip(
+                    table.x, table.y)
+                assert new_table is not None
+                self.assertEqual(
+                    list(table.multicast_routing_entries),
+                    list(new_table.multicast_routing_entries))
+                self.assertEqual(
+                    table.number_of_defaultable_entries,
+                    new_table.number_of_defaultable_entries)
+
+            chip_table = read_binary_table(file_name, 3, 2)
+            assert chip_table is not None
+            self.assertEqual(
+                list(t2.multicast_routing_entries),
+                list(chip_table.multicast_routing_entries))
+            self.assertIsNone(read_binary_table(file_name, 2, 3))
+
+            empty_name = os.path.join(tmp_dir, "empty.bin")
+            to_binary(MulticastRoutingTables(), empty_name)
+            self.assertEqual(0, len(from_binary(empty_name)))
+
+            bad_name = os.path.join(tmp_dir, "bad.bin")
+            with open(bad_name, "wb") as f:
+                f.write(b"not a table file at all")
+            with self.assertRaises(PacmanInvalidParameterException):
+                from_binary(bad_name)
+
+    def test_iter_json_tables(self) -> None:
+        tables = MulticastRoutingTables(
+            UnCompressedMulticastRoutingTable(x, 0, [
+                MulticastRoutingEntry(key, 0xFFFFFF00, RoutingEntry(
+                    spinnaker_route=key >> 8 | x))
+                for key in range(0, 0x100 * x, 0x100)])
+            for x in range(5))
+        json_obj = to_json(tables)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, "tables.json")
+            with open(file_name, "w", encoding="utf-8") as f:
+                json.dump(json_obj, f)
+            gz_name = os.path.join(tmp_dir, "tables.json.gz")
+            with gzip.open(gz_name, "wt", encoding="utf-8") as f:
+                json.dump(json_obj, f)
+            for name in (file_name, gz_name):
+                read = list(iter_json_tables(name))
+                self.assertEqual(list(tables), read)
+
+            bad_name = os.path.join(tmp_dir, "bad.json")
+            with open(bad_name, "w", encoding="utf-8") as f:
+                f.write('[{"x": 0, "y": 0, "entries": []}, {"x": 1')
+            bad_tables = iter_json_tables(bad_name)
+            self.assertEqual(0, next(bad_tables).x)
+            with self.assertRaises(json.JSONDecodeError):
+                next(bad_tables)
+
+    def test_iter_json_tables_small_reads(self) -> None:
+        tables = MulticastRoutingTables(
+            UnCompressedMulticastRoutingTable(x, 1, [
+                MulticastRoutingEntry(key, 0xFFFFFFF0, RoutingEntry(
+                    spinnaker_route=key >> 4 | x, defaultable=key % 3 == 0))
+                for key in range(0, 0x10 * x * x, 0x10)])
+            for x in range(6))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, "tables.json")
+            with open(file_name, "w", encoding="utf-8") as f:
+                json.dump(to_json(tables), f, indent=2)
+            # Reads much smaller than a table, so tables span many reads
+            with mock.patch(
+                    "pacman.model.routing_tables.multicast_routing_tables."
+                    "_JSON_READ_SIZE", 7):
+                read = list(iter_json_tables(file_name))
+            self.assertEqual(list(from_json(file_name)), read)
+            self.assertEqual(list(tables), read)
+
     def test_new_multicast_routing_tables_empty(self) -> None:
         MulticastRoutingTables()
 
@@ -248,6 +355,89 @@ class TestRoutingTable(unittest.TestCase):
         assert str(e3) == "{12, 13, 14, 15}:{3, 4}"
         assert str(e6) == ("{0, 1, 2, 3, 12, 13, 14, 15}:{0, 1, 3, 4}")
 
+    def test_columnar_multicast_routing_table(self) -> None:
+        entries = [
+            MulticastRoutingEntry(
+                key, 0xFFFFFFF0, RoutingEntry(spinnaker_route=key >> 4))
+            for key in range(0, 0x400, 0x10)]
+        entries.append(MulticastRoutingEntry(
+            0x1000, 0xFFFFF000,
+            RoutingEntry(spinnaker_route=1, defaultable=True)))
+        table = ColumnarMulticastRoutingTable(1, 2, entries[:10])
+        for entry in entries[10:]:
+            table.add_multicast_routing_entry(entry)
+        self.assertEqual(1, table.x)
+        self.assertEqual(2, table.y)
+        self.assertEqual(len(entries), table.number_of_entries)
+        self.assertEqual(1, table.number_of_defaultable_entries)
+        self.assertEqual(entries, list(table.multicast_routing_entries))
+        self.assertEqual(0x3F0, table.keys[-2])
+        self.assertEqual(0x3F, table.routes[-2])
+        with self.assertRaises(ValueError):
+            table.keys[0] = 1
+
+        uncompressed = UnCompressedMulticastRoutingTable(1, 2, entries)
+        self.assertEqual(table, to_columnar(uncompressed))
+        self.assertIs(table, to_columnar(table))
+        self.assertNotEqual(
+            table, ColumnarMulticastRoutingTable(1, 2, entries[:-1]))
+
+    def test_columnar_add_entries(self) -> None:
+        table = ColumnarMulticastRoutingTable(0, 0)
+        table.add_entries(
+            numpy.arange(100) << 8, numpy.full(100, 0xFFFFFF00),
+            numpy.arange(100))
+        self.assertEqual(100, table.number_of_entries)
+        self.assertEqual(0, table.number_of_defaultable_entries)
+        entry = list(table.multicast_routing_entries)[5]
+        self.assertEqual(0x500, entry.key)
+        self.assertEqual(5, entry.spinnaker_route)
+        with self.assertRaises(PacmanInvalidParameterException):
+            table.add_entries([1], [0xFFFFFF00], [1])
+        with self.assertRaises(PacmanInvalidParameterException):
+            table.add_entries([0, 0x100], [0xFFFFFF00], [1, 1])
+        self.assertEqual(100, table.number_of_entries)
+
+    def test_routing_table_index(self) -> None:
+        entries = [
+            MulticastRoutingEntry(0x100, 0xFFFFFFFF, RoutingEntry(
+                spinnaker_route=1)),
+            MulticastRoutingEntry(0x100, 0xFFFFFF00, RoutingEntry(
+                spinnaker_route=2)),
+            MulticastRoutingEntry(0x200, 0xFFFFFF00, RoutingEntry(
+                spinnaker_route=3)),
+            MulticastRoutingEntry(0x0, 0xFFFFF000, RoutingEntry(
+                spinnaker_route=4))]
+        index = RoutingTableIndex(
+            CompressedMulticastRoutingTable(0, 0, entries))
+        self.assertEqual(4, len(index))
+        self.assertEqual([0, 1, 3], index.matches(0x100).tolist())
+        self.assertEqual(0, index.lookup(0x100))
+        self.assertEqual(1, index.lookup(0x1FF))
+        self.assertEqual(3, index.lookup(0x300))
+        self.assertIsNone(index.lookup(0x1000))
+        self.assertIs(entries[2], index.lookup_entry(0x2AB))
+        self.assertIsNone(index.lookup_entry(0x1000))
+        self.assertEqual(
+            [0, 1, 2, 3, NO_MATCH],
+            index.lookup_keys([0x100, 0x101, 0x200, 0xFFF, 0x1000]).tolist())
+        self.assertEqual(
+            [1, 2, 3, 4],
+            index.routes[index.lookup_keys([0x100, 0x101, 0x2FF, 0x3FF])]
+            .tolist())
+        with self.assertRaises(ValueError):
+            index.keys[0] = 1
+
+        # Many keys at once agree with one at a time
+        keys = numpy.arange(0x1100)
+        self.assertEqual(
+            [NO_MATCH if index.lookup(key) is None else index.lookup(key)
+             for key in keys.tolist()],
+            index.lookup_keys(keys).tolist())
+        empty = RoutingTableIndex(UnCompressedMulticastRoutingTable(0, 0))
+        self.assertIsNone(empty.lookup(0))
+        self.assertEqual([NO_MATCH], empty.lookup_keys([0]).tolist())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,223 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import unittest
+
+from spinn_utilities.config_holder import set_config
+
+from spinn_machine import MulticastRoutingEntry, RoutingEntry
+from spinn_machine.version import Spin1Gen
+
+from pacman.config_setup import unittest_setup
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.exceptions import (
+    PacmanConfigurationException,
+    PacmanRoutingException,
+)
+from pacman.model.graphs.application import ApplicationEdge
+from pacman.model.partitioner_splitters import SplitterFixedLegacy
+from pacman.model.placements import Placements
+from pacman.model.routing_tables import (
+    CompressedMulticastRoutingTable,
+    MulticastRoutingTables,
+    UnCompressedMulticastRoutingTable,
+)
+from pacman.operations.multi_cast_router_check_functionality import (
+    validate_routes,
+)
+from pacman.operations.multi_cast_router_check_functionality.\
+    valid_routes_checker import (
+        _check_all_keys_hit_entry,
+        _IndexedTable,
+        _locate_routing_entry,
+        range_masks,
+    )
+from pacman.operations.partition_algorithms import splitter_partitioner
+from pacman.operations.placer_algorithms import place_application_graph
+from pacman.operations.router_algorithms.application_router import (
+    route_application_graph,
+)
+from pacman.operations.routing_info_allocator_algorithms import (
+    ZonedRoutingInfoAllocator,
+)
+from pacman.operations.routing_table_generators import (
+    basic_routing_table_generator,
+)
+from pacman.utilities.constants import FULL_MASK
+
+from pacman_test_objects import SimpleTestVertex
+
+
+def _entry(key: int, mask: int) -> MulticastRoutingEntry:
+    return MulticastRoutingEntry(key & mask, mask, RoutingEntry(
+        spinnaker_route=1 << (key % 24), defaultable=False))
+
+
+def _locate_by_scan(
+        entries: list[MulticastRoutingEntry], key: int,
+        n_atoms: int) -> MulticastRoutingEntry | str:
+    """
+    The checks of _locate_routing_entry made one entry at a time.
+    """
+    found_entry = None
+    for entry in entries:
+        e_key = entry.key
+        last_key = e_key + (~entry.mask & FULL_MASK)
+        if entry.mask & key == e_key:
+            if found_entry is None:
+                found_entry = entry
+            if entry.mask in range_masks and last_key < key + n_atoms - 1:
+                return "not covered"
+        elif entry.mask in range_masks:
+            if min(last_key, key + n_atoms) - max(e_key, key) + 1 > 0:
+                return "partially covered"
+    if found_entry is None:
+        return "no entry"
+    return found_entry
+
+
+def _locate(entries: list[MulticastRoutingEntry], key: int,
+            n_atoms: int) -> MulticastRoutingEntry | str:
+    table = _IndexedTable(CompressedMulticastRoutingTable(0, 0, entries))
+    try:
+        return _locate_routing_entry(table, key, n_atoms)
+    except PacmanRoutingException as ex:
+        return "no entry" if "no entry" in str(ex) else "not covered"
+    except PacmanConfigurationException:
+        return "partially covered"
+
+
+class TestValidRoutesChecker(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_locate_routing_entry(self) -> None:
+        entries = [
+            _entry(0x100, 0xFFFFFF00),
+            _entry(0x200, 0xFFFFFFF0),
+            _entry(0x300, 0xFFFFFFFF),
+            _entry(0x1000, 0xFFFF10FF)]
+        self.assertIs(entries[0], _locate(entries, 0x100, 255))
+        self.assertIs(entries[2], _locate(entries, 0x300, 1))
+        self.assertIs(entries[3], _locate(entries, 0x1200, 1))
+        self.assertEqual("not covered", _locate(entries, 0x200, 17))
+        self.assertEqual("not covered", _locate(entries, 0x1F0, 17))
+        self.assertEqual("partially covered", _locate(entries, 0x0F0, 17))
+        self.assertEqual("no entry", _locate(entries, 0x400, 1))
+        self.assertEqual("no entry", _locate([], 0x400, 1))
+
+    def test_same_as_scan(self) -> None:
+        rng = random.Random(1)
+        n_errors = 0
+        for _ in range(500):
+            entries = [
+                _entry(rng.getrandbits(12), FULL_MASK - (
+                    (1 << rng.randrange(9)) - 1 if rng.random() < 0.8
+                    else rng.getrandbits(8)))
+                for _ in range(rng.randrange(1, 10))]
+            # Mostly use keys near those in the table
+            key = rng.choice(entries).key + rng.randrange(-8, 8)
+            if key < 0 or rng.random() < 0.2:
+                key = rng.getrandbits(12)
+            n_atoms = rng.randrange(1, 16)
+            expected = _locate_by_scan(entries, key, n_atoms)
+            self.assertEqual(expected, _locate(entries, key, n_atoms))
+            if isinstance(expected, str):
+                n_errors += 1
+        # Make sure both found and not found were tested
+        self.assertGreater(n_errors, 50)
+        self.assertLess(n_errors, 450)
+
+    def test_check_all_keys_hit_entry(self) -> None:
+        rng = random.Random(2)
+        for _ in range(500):
+            entry = _entry(rng.getrandbits(12), FULL_MASK - (
+                (1 << rng.randrange(9)) - 1 if rng.random() < 0.5
+                else rng.getrandbits(8)))
+            base_key = rng.getrandbits(12)
+            n_atoms = rng.randrange(1, 300)
+            self.assertEqual(
+                [key for key in range(base_key, base_key + n_atoms)
+                 if key & entry.mask != entry.key],
+                _check_all_keys_hit_entry(entry, n_atoms, base_key))
+
+    def _route(self) -> MulticastRoutingTables:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        writer = PacmanDataWriter.mock()
+        vertices = [
+            SimpleTestVertex(
+                n_atoms, f"app{i}", max_atoms_per_core=10,
+                splitter=SplitterFixedLegacy())
+            for i, n_atoms in enumerate((300, 300, 10, 10))]
+        for vertex in vertices:
+            writer.add_vertex(vertex)
+        for pre, post in ((0, 1), (2, 3), (0, 2), (1, 3), (0, 0)):
+            writer.add_edge(ApplicationEdge(vertices[pre], vertices[post]),
+                            "foo")
+        splitter_partitioner()
+        writer.set_placements(place_application_graph(Placements()))
+        writer.set_routing_table_by_partition(route_application_graph())
+        writer.set_routing_infos(ZonedRoutingInfoAllocator().allocate())
+        return basic_routing_table_generator()
+
+    def test_validate_routes(self) -> None:
+        tables = self._route()
+        validate_routes(tables)
+        validate_routes(tables, n_processes=2)
+
+        # Break the routes of two partitions on different chips
+        broken = MulticastRoutingTables()
+        n_broken = 0
+        for table in tables:
+            entries = list(table.multicast_routing_entries)
+            if n_broken < 2 and len(entries) > 1:
+                entries = entries[1:]
+                n_broken += 1
+            broken.add_routing_table(
+                UnCompressedMulticastRoutingTable(table.x, table.y, entries))
+        self.assertEqual(2, n_broken)
+        for n_processes in (1, 2):
+            with self.assertRaises(PacmanRoutingException) as context:
+                validate_routes(broken, n_processes)
+            # All the failures are found, not just the first
+            self.assertGreater(str(context.exception).count("app"), 1)
+
+        # Add entries which cover only part of the keys of two different
+        # sources, as a trace stops at its first failure
+        overlapping = MulticastRoutingTables()
+        broken_keys: set[int] = set()
+        for table in tables:
+            entries = list(table.multicast_routing_entries)
+            unbroken = [
+                entry for entry in entries if entry.key not in broken_keys]
+            if len(broken_keys) < 2 and unbroken:
+                entry = unbroken[0]
+                entries.insert(0, MulticastRoutingEntry(
+                    entry.key + 8, FULL_MASK - 7, RoutingEntry(
+                        spinnaker_route=entry.spinnaker_route,
+                        defaultable=False)))
+                broken_keys.add(entry.key)
+            overlapping.add_routing_table(
+                UnCompressedMulticastRoutingTable(table.x, table.y, entries))
+        for n_processes in (1, 2):
+            with self.assertRaises(PacmanRoutingException) as context:
+                validate_routes(overlapping, n_processes)
+            self.assertEqual(
+                2, str(context.exception).count("Key range partially"))
+
+
+if __name__ == '__main__':
+    unittest.main()
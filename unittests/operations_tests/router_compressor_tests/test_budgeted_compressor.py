@@ -0,0 +1,109 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import unittest
+
+from spinn_utilities.config_holder import set_config
+
+from spinn_machine import virtual_machine
+from spinn_machine.version import Spin1Gen
+
+from pacman.config_setup import unittest_setup
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.model.routing_tables import (
+    MulticastRoutingTables,
+    UnCompressedMulticastRoutingTable,
+)
+from pacman.model.routing_tables.multicast_routing_tables import from_json
+from pacman.operations.router_compressors import (
+    RangeCompressor,
+    budgeted_compressor,
+)
+from pacman.operations.router_compressors.routing_compression_checker import (
+    compare_tables,
+)
+
+
+class TestBudgetedCompressor(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        # tests against version 5 as Spin2 would not need compression
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def _original_tables(self) -> MulticastRoutingTables:
+        class_file = sys.modules[self.__module__].__file__
+        assert class_file is not None
+        path = os.path.dirname(os.path.abspath(class_file))
+        original_tables = from_json(os.path.join(path, "many_to_one.json.gz"))
+        writer = PacmanDataWriter.mock()
+        writer.set_precompressed(original_tables)
+        # This tests requires a full wrap machine
+        writer.set_machine(virtual_machine(24, 24))
+        return original_tables
+
+    def _check(self, original_tables: MulticastRoutingTables,
+               compressed_tables: MulticastRoutingTables) -> None:
+        for original in original_tables:
+            compressed = compressed_tables.get_routing_table_for_chip(
+                original.x, original.y)
+            assert compressed is not None
+            compare_tables(original, compressed)
+
+    def test_no_limit(self) -> None:
+        original_tables = self._original_tables()
+        compressed_tables = budgeted_compressor()
+        self._check(original_tables, compressed_tables)
+        self.assertLessEqual(
+            compressed_tables.get_max_number_of_entries(), 1023)
+
+    def test_in_processes(self) -> None:
+        original_tables = self._original_tables()
+        set_config("Mapping", "n_mapping_processes", "2")
+        set_config("Mapping", "compression_time_budget", "60")
+        compressed_tables = budgeted_compressor()
+        self._check(original_tables, compressed_tables)
+
+    def test_out_of_time(self) -> None:
+        original_tables = self._original_tables()
+        # No time for anything but the range compressor
+        compressed_tables = budgeted_compressor(0.0, accept_overflow=True)
+        self._check(original_tables, compressed_tables)
+        for original in original_tables:
+            compressed = compressed_tables.get_routing_table_for_chip(
+                original.x, original.y)
+            assert compressed is not None
+            self.assertEqual(
+                list(RangeCompressor().compress_table(
+                    UnCompressedMulticastRoutingTable(
+                        original.x, original.y,
+                        original.multicast_routing_entries))
+                     .multicast_routing_entries),
+                list(compressed.multicast_routing_entries))
+
+    def test_as_far_as_possible(self) -> None:
+        original_tables = self._original_tables()
+        set_config(
+            "Mapping", "router_table_compress_as_far_as_possible", str(True))
+        compressed_tables = budgeted_compressor()
+        self._check(original_tables, compressed_tables)
+        self.assertLess(
+            compressed_tables.get_total_number_of_entries(),
+            original_tables.get_total_number_of_entries())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import tempfile
+import unittest
+
+from spinn_utilities.config_holder import set_config
+
+from spinn_machine import MulticastRoutingEntry, RoutingEntry, virtual_machine
+from spinn_machine.version import Spin1Gen
+
+from pacman.config_setup import unittest_setup
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.model.routing_tables import (
+    MulticastRoutingTables,
+    UnCompressedMulticastRoutingTable,
+)
+from pacman.model.routing_tables.multicast_routing_tables import from_json
+from pacman.model.routing_tables.uncompressed_multicast_routing_table import (
+    from_csv,
+)
+from pacman.operations.router_compressors import (
+    CompressionCache,
+    pair_compressor,
+    range_compressor,
+)
+from pacman.operations.router_compressors.compression_cache import (
+    get_compression_cache,
+)
+from pacman.operations.router_compressors.routing_compression_checker import (
+    compare_tables,
+)
+
+
+def _table(x: int, n_entries: int) -> UnCompressedMulticastRoutingTable:
+    table = UnCompressedMulticastRoutingTable(x, 0)
+    for key in range(x * n_entries, (x + 1) * n_entries):
+        table.add_multicast_routing_entry(MulticastRoutingEntry(
+            key, 0xFFFFFFFF, RoutingEntry(
+                spinnaker_route=1 << (key % 6), defaultable=False)))
+    return table
+
+
+class TestCompressionCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        # tests against version 5 as Spin2 would not need compression
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def test_put_and_get(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = CompressionCache(directory, 1024 ** 2)
+            table = _table(0, 10)
+            key = cache.cache_key(table, "test", 1023)
+            self.assertIsNone(cache.get(key))
+            entries = list(table.multicast_routing_entries)
+            cache.put(key, entries)
+            self.assertEqual(entries, cache.get(key))
+            self.assertEqual(1, cache.n_hits)
+            self.assertEqual(1, cache.n_misses)
+            self.assertEqual(0.5, cache.hit_rate)
+
+            # The key depends on the entries, not their order
+            reordered = UnCompressedMulticastRoutingTable(
+                0, 0, reversed(entries))
+            self.assertEqual(key, cache.cache_key(reordered, "test", 1023))
+            self.assertNotEqual(key, cache.cache_key(table, "other", 1023))
+            self.assertNotEqual(key, cache.cache_key(table, "test", None))
+
+            # A new cache finds the results of the old one
+            cache = CompressionCache(directory, 1024 ** 2)
+            self.assertEqual(1, len(cache))
+            self.assertEqual(entries, cache.get(key))
+
+    def test_lru_eviction(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = CompressionCache(directory, 1024 ** 2)
+            tables = [_table(x, 10) for x in range(3)]
+            keys = [cache.cache_key(table, "test", None) for table in tables]
+            cache.put(keys[0], tables[0].multicast_routing_entries)
+            size = cache.n_bytes
+
+            # Room for two tables; using the first makes the second the oldest
+            cache = CompressionCache(directory, size * 2)
+            cache.put(keys[1], tables[1].multicast_routing_entries)
+            self.assertIsNotNone(cache.get(keys[0]))
+            cache.put(keys[2], tables[2].multicast_routing_entries)
+            self.assertEqual(2, len(cache))
+            self.assertEqual(size * 2, cache.n_bytes)
+            self.assertIsNotNone(cache.get(keys[0]))
+            self.assertIsNone(cache.get(keys[1]))
+            self.assertIsNotNone(cache.get(keys[2]))
+            self.assertEqual(2, len(os.listdir(directory)))
+
+    def test_not_configured(self) -> None:
+        self.assertIsNone(get_compression_cache())
+
+    def test_range_compressor(self) -> None:
+        file_path = sys.modules[self.__module__].__file__
+        assert file_path is not None
+        path = os.path.dirname(file_path)
+        tables = MulticastRoutingTables()
+        csv_table = from_csv(os.path.join(path, "table2.csv.gz"))
+        tables.add_routing_table(UnCompressedMulticastRoutingTable(
+            0, 0, csv_table.multicast_routing_entries))
+        tables.add_routing_table(_table(1, 10))
+        PacmanDataWriter.mock().set_uncompressed(tables)
+        with tempfile.TemporaryDirectory() as directory:
+            set_config("Mapping", "compression_cache_directory", directory)
+            first = range_compressor()
+            second = range_compressor()
+            # Only the table needing compression is cached
+            cache = get_compression_cache()
+            assert cache is not None
+            self.assertEqual(1, len(cache))
+        for table in tables:
+            f_table = first.get_routing_table_for_chip(table.x, table.y)
+            s_table = second.get_routing_table_for_chip(table.x, table.y)
+            assert f_table is not None and s_table is not None
+            self.assertEqual(
+                list(f_table.multicast_routing_entries),
+                list(s_table.multicast_routing_entries))
+            compare_tables(table, s_table)
+
+    def test_pair_compressor(self) -> None:
+        class_file = sys.modules[self.__module__].__file__
+        assert class_file is not None
+        path = os.path.dirname(os.path.abspath(class_file))
+        original_tables = from_json(os.path.join(path, "many_to_one.json.gz"))
+        writer = PacmanDataWriter.mock()
+        writer.set_precompressed(original_tables)
+        writer.set_machine(virtual_machine(24, 24))
+        set_config(
+            "Mapping", "router_table_compress_as_far_as_possible", str(True))
+        # Tables with the same entries share a result
+        n_different = len({
+            CompressionCache.cache_key(table, "", None)
+            for table in original_tables})
+        with tempfile.TemporaryDirectory() as directory:
+            set_config("Mapping", "compression_cache_directory", directory)
+            first = pair_compressor()
+            self.assertEqual(n_different, len(os.listdir(directory)))
+            second = pair_compressor()
+            # Different settings do not find the same results
+            pair_compressor(c_sort=True)
+            self.assertEqual(n_different * 2, len(os.listdir(directory)))
+        for original in original_tables:
+            f_table = first.get_routing_table_for_chip(
+                original.x, original.y)
+            s_table = second.get_routing_table_for_chip(
+                original.x, original.y)
+            assert f_table is not None and s_table is not None
+            self.assertEqual(
+                list(f_table.multicast_routing_entries),
+                list(s_table.multicast_routing_entries))
+            compare_tables(original, s_table)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import unittest
+
+from pacman.config_setup import unittest_setup
+from pacman.operations.router_compressors import KeyMaskIndex
+from pacman.operations.router_compressors.\
+    ordered_covering_router_compressor import intersect
+
+
+class TestKeyMaskIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_simple(self) -> None:
+        index: KeyMaskIndex[str] = KeyMaskIndex()
+        index.add(0b0000, 0xFFFFFFFC, "00XX")
+        index.add(0b0010, 0xFFFFFFFE, "001X")
+        index.add(0b1100, 0xFFFFFFFC, "11XX")
+        index.add(0b1100, 0xFFFFFFFC, "11XX again")
+        self.assertEqual(4, len(index))
+        self.assertEqual(
+            ["001X", "00XX"], sorted(index.intersecting(0b0011, 0xFFFFFFFF)))
+        self.assertEqual(
+            ["11XX", "11XX again"],
+            sorted(index.intersecting(0b0100, 0xFFFFFFF4)))
+        self.assertFalse(index.any_intersecting(0b0100, 0xFFFFFFFC))
+        self.assertTrue(index.any_intersecting(0, 0))
+
+        index.remove(0b1100, 0xFFFFFFFC, "11XX")
+        self.assertEqual(
+            ["11XX again"], list(index.intersecting(0b1101, 0xFFFFFFFF)))
+        with self.assertRaises(KeyError):
+            index.remove(0b1100, 0xFFFFFFFC, "11XX")
+        with self.assertRaises(KeyError):
+            index.remove(0b0100, 0xFFFFFFFC, "01XX")
+        self.assertEqual(3, len(index))
+
+    def test_matches_intersect(self) -> None:
+        rng = random.Random(42)
+        key_masks = []
+        for _ in range(500):
+            mask = rng.choice([
+                0xFFFFFFFF, 0xFFFFFF00, 0xFFFF0000, rng.getrandbits(32)])
+            key_masks.append((rng.getrandbits(32) & mask, mask))
+        index: KeyMaskIndex[int] = KeyMaskIndex()
+        for i, (key, mask) in enumerate(key_masks):
+            index.add(key, mask, i)
+        for i in range(0, len(key_masks), 3):
+            index.remove(*key_masks[i], i)
+
+        for key, mask in key_masks[:100]:
+            expected = [
+                i for i, (o_key, o_mask) in enumerate(key_masks)
+                if i % 3 and intersect(key, mask, o_key, o_mask)]
+            self.assertEqual(expected, sorted(index.intersecting(key, mask)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,9 +23,14 @@ from spinn_machine.version import Spin1Gen
 
 from pacman.config_setup import unittest_setup
 from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.exceptions import MinimisationFailedError
+from pacman.model.routing_tables import CompressedMulticastRoutingTable
 from pacman.model.routing_tables.multicast_routing_tables import from_json
 from pacman.operations.router_compressors.\
-    ordered_covering_router_compressor import ordered_covering_compressor
+    ordered_covering_router_compressor import (
+        ordered_covering,
+        ordered_covering_compressor,
+    )
 from pacman.operations.router_compressors.routing_compression_checker import (
     compare_tables,
 )
@@ -58,3 +63,35 @@ class TestOrderedCoveringCompressor(unittest.TestCase):
                 original.x, original.y)
             assert compressed is not None
             compare_tables(original, compressed)
+
+    def test_oc_incremental(self) -> None:
+        class_file = sys.modules[self.__module__].__file__
+        assert class_file is not None
+        path = os.path.dirname(os.path.abspath(class_file))
+        original_tables = from_json(os.path.join(path, "many_to_one.json.gz"))
+        for original in original_tables:
+            entries = list(original.multicast_routing_entries)
+            table, aliases = ordered_covering(
+                entries, None, {}, no_raise=True, incremental=False)
+            inc_table, inc_aliases = ordered_covering(
+                entries, None, {}, no_raise=True, incremental=True)
+            self.assertEqual(table, inc_table)
+            self.assertEqual(aliases, inc_aliases)
+
+    def test_oc_out_of_time(self) -> None:
+        class_file = sys.modules[self.__module__].__file__
+        assert class_file is not None
+        path = os.path.dirname(os.path.abspath(class_file))
+        original_tables = from_json(os.path.join(path, "many_to_one.json.gz"))
+        original = max(original_tables, key=lambda t: t.number_of_entries)
+        entries = list(original.multicast_routing_entries)
+        with self.assertRaises(MinimisationFailedError):
+            ordered_covering(entries, 1, {}, time_to_run_for=0)
+        # Without raising only one merge is done
+        table, _ = ordered_covering(
+            entries, 1, {}, no_raise=True, time_to_run_for=0)
+        self.assertLess(len(table), len(entries))
+        full_table, _ = ordered_covering(entries, 1, {}, no_raise=True)
+        self.assertLess(len(full_table), len(table))
+        compare_tables(original, CompressedMulticastRoutingTable(
+            original.x, original.y, table))
@@ -62,3 +62,7 @@ class TestPairCompressor(unittest.TestCase):
 
     def test_pair_big_python_sort(self) -> None:
         self.do_pair_big(False)
+
+    def test_pair_big_in_processes(self) -> None:
+        set_config("Mapping", "n_mapping_processes", "4")
+        self.do_pair_big(False)
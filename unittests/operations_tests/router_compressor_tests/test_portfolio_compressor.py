@@ -0,0 +1,166 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import unittest
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.progress_bar import ProgressBar
+
+from spinn_machine import (
+    MulticastRoutingEntry,
+    RoutingEntry,
+    virtual_machine,
+)
+from spinn_machine.version import Spin1Gen
+
+from pacman.config_setup import unittest_setup
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.exceptions import MinimisationFailedError
+from pacman.model.routing_tables import (
+    MulticastRoutingTables,
+    UnCompressedMulticastRoutingTable,
+)
+from pacman.model.routing_tables.multicast_routing_tables import from_json
+from pacman.operations.router_compressors import (
+    PortfolioCompressor,
+    portfolio_compressor,
+)
+from pacman.operations.router_compressors.portfolio_compressor import (
+    NONE,
+    ORDERED_COVERING,
+    PAIR,
+    RANGE,
+)
+from pacman.operations.router_compressors.routing_compression_checker import (
+    compare_tables,
+)
+from pacman.utilities.constants import FULL_MASK
+
+
+class TestPortfolioCompressor(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        # tests against version 5 as Spin2 would not need compression
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def _original_tables(self) -> MulticastRoutingTables:
+        class_file = sys.modules[self.__module__].__file__
+        assert class_file is not None
+        path = os.path.dirname(os.path.abspath(class_file))
+        original_tables = from_json(os.path.join(path, "many_to_one.json.gz"))
+        writer = PacmanDataWriter.mock()
+        writer.set_precompressed(original_tables)
+        # This tests requires a full wrap machine
+        writer.set_machine(virtual_machine(24, 24))
+        return original_tables
+
+    def test_portfolio(self) -> None:
+        original_tables = self._original_tables()
+        compressed_tables = portfolio_compressor()
+        for original in original_tables:
+            compressed = compressed_tables.get_routing_table_for_chip(
+                original.x, original.y)
+            assert compressed is not None
+            compare_tables(original, compressed)
+
+    def test_records(self) -> None:
+        original_tables = self._original_tables()
+        set_config("Mapping", "n_mapping_processes", "2")
+        compressor = PortfolioCompressor()
+        compressed_tables = compressor.compress_tables(
+            original_tables, ProgressBar(original_tables.routing_tables, ""))
+        self.assertEqual(len(original_tables), len(compressor.records))
+        for record in compressor.records:
+            compressed = compressed_tables.get_routing_table_for_chip(
+                record.x, record.y)
+            assert compressed is not None
+            self.assertEqual(compressed.number_of_entries, record.n_compressed)
+            self.assertLessEqual(record.n_compressed, 1023)
+            if record.n_original <= 1023:
+                self.assertEqual(NONE, record.strategy)
+                self.assertEqual({}, record.times)
+            else:
+                # Stops at the first which fits
+                self.assertIn(record.strategy, record.times)
+                self.assertEqual(
+                    record.strategy, list(record.times)[-1])
+
+    def test_as_far_as_possible(self) -> None:
+        original_tables = self._original_tables()
+        set_config(
+            "Mapping", "router_table_compress_as_far_as_possible", str(True))
+        compressor = PortfolioCompressor()
+        compressed_tables = compressor.compress_tables(
+            original_tables, ProgressBar(original_tables.routing_tables, ""))
+        for record in compressor.records:
+            # Everything is tried
+            self.assertEqual(
+                [RANGE, PAIR, ORDERED_COVERING], list(record.times))
+            original = original_tables.get_routing_table_for_chip(
+                record.x, record.y)
+            compressed = compressed_tables.get_routing_table_for_chip(
+                record.x, record.y)
+            assert original is not None and compressed is not None
+            compare_tables(original, compressed)
+
+    def _too_big_tables(self) -> MulticastRoutingTables:
+        # Each route is on four neighbouring keys, which the range
+        # compressor merges, but there are more routes than router entries
+        original_tables = MulticastRoutingTables([
+            UnCompressedMulticastRoutingTable(0, 0, [
+                MulticastRoutingEntry(key, FULL_MASK, RoutingEntry(
+                    spinnaker_route=(key >> 2) + 1, defaultable=False))
+                for key in range(4 * 1030)]),
+            UnCompressedMulticastRoutingTable(1, 0, [
+                MulticastRoutingEntry(0, FULL_MASK, RoutingEntry(
+                    spinnaker_route=1, defaultable=False))])])
+        writer = PacmanDataWriter.mock()
+        writer.set_precompressed(original_tables)
+        writer.set_machine(virtual_machine(8, 8))
+        return original_tables
+
+    def test_overflow(self) -> None:
+        original_tables = self._too_big_tables()
+        set_config("Mapping", "n_mapping_processes", "2")
+        compressor = PortfolioCompressor(accept_overflow=True)
+        compressed_tables = compressor.compress_tables(
+            original_tables, ProgressBar(original_tables.routing_tables, ""))
+        record = compressor.records[0]
+        self.assertEqual((0, 0, 4 * 1030), record[:3])
+        # Nothing does better than the range compressor
+        self.assertEqual(RANGE, record.strategy)
+        self.assertEqual(1030, record.n_compressed)
+        self.assertEqual([RANGE, ORDERED_COVERING], list(record.times))
+        original = original_tables.get_routing_table_for_chip(0, 0)
+        compressed = compressed_tables.get_routing_table_for_chip(0, 0)
+        assert original is not None and compressed is not None
+        self.assertEqual(1030, compressed.number_of_entries)
+        compare_tables(original, compressed)
+
+        self._too_big_tables()
+        compressed_tables = portfolio_compressor(accept_overflow=True)
+        compressed = compressed_tables.get_routing_table_for_chip(0, 0)
+        assert compressed is not None
+        self.assertEqual(1030, compressed.number_of_entries)
+
+        with self.assertRaises(MinimisationFailedError) as context:
+            portfolio_compressor()
+        self.assertIn("(x:0,y:0)=1030", str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
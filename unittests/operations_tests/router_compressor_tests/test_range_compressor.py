@@ -22,7 +22,10 @@ from spinn_machine.version import Spin1Gen
 
 from pacman.config_setup import unittest_setup
 from pacman.data.pacman_data_writer import PacmanDataWriter
-from pacman.model.routing_tables import MulticastRoutingTables
+from pacman.model.routing_tables import (
+    MulticastRoutingTables,
+    UnCompressedMulticastRoutingTable,
+)
 from pacman.model.routing_tables.uncompressed_multicast_routing_table import (
     from_csv,
 )
@@ -70,6 +73,28 @@ class TestRangeCompressor(unittest.TestCase):
         assert c_table is not None
         compare_tables(table, c_table)
 
+    def test_tables_in_processes(self) -> None:
+        file_path = sys.modules[self.__module__].__file__
+        assert file_path is not None
+        path = os.path.dirname(file_path)
+        tables = MulticastRoutingTables()
+        for x, name in enumerate(["table1.csv.gz", "table2.csv.gz"]):
+            csv_table = from_csv(os.path.join(path, name))
+            tables.add_routing_table(UnCompressedMulticastRoutingTable(
+                x, 0, csv_table.multicast_routing_entries))
+        PacmanDataWriter.mock().set_uncompressed(tables)
+        serial = range_compressor()
+        set_config("Mapping", "n_mapping_processes", "2")
+        parallel = range_compressor()
+        for table in tables:
+            s_table = serial.get_routing_table_for_chip(table.x, table.y)
+            p_table = parallel.get_routing_table_for_chip(table.x, table.y)
+            assert s_table is not None and p_table is not None
+            self.assertEqual(
+                list(s_table.multicast_routing_entries),
+                list(p_table.multicast_routing_entries))
+            compare_tables(table, p_table)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,157 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import random
+import sys
+import unittest
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.progress_bar import ProgressBar
+
+from spinn_machine import MulticastRoutingEntry, RoutingEntry, virtual_machine
+from spinn_machine.version import Spin1Gen
+
+from pacman.config_setup import unittest_setup
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.exceptions import PacmanRoutingException
+from pacman.model.routing_tables import (
+    AbstractMulticastRoutingTable,
+    CompressedMulticastRoutingTable,
+    UnCompressedMulticastRoutingTable,
+)
+from pacman.model.routing_tables.multicast_routing_tables import from_json
+from pacman.operations.router_compressors import AbstractCompressor
+from pacman.operations.router_compressors.\
+    ordered_covering_router_compressor import (
+        ordered_covering,
+        remove_default_routes,
+    )
+from pacman.operations.router_compressors.routing_compression_checker import (
+    codify_table,
+    compare_route,
+    compare_tables,
+)
+
+
+class _DropLastCompressor(AbstractCompressor):
+    """
+    A broken compressor which loses the last entry.
+    """
+    __slots__ = ()
+
+    def compress_table(
+            self, router_table: UnCompressedMulticastRoutingTable
+            ) -> list[MulticastRoutingEntry]:
+        return list(router_table.multicast_routing_entries)[:-1]
+
+
+def _error_by_codes(
+        original: AbstractMulticastRoutingTable,
+        compressed: AbstractMulticastRoutingTable) -> str | None:
+    compressed_dict = codify_table(compressed)
+    try:
+        for o_route in original.multicast_routing_entries:
+            compare_route(o_route, compressed_dict)
+    except PacmanRoutingException as ex:
+        return str(ex)
+    return None
+
+
+def _error(original: AbstractMulticastRoutingTable,
+           compressed: AbstractMulticastRoutingTable) -> str | None:
+    try:
+        compare_tables(original, compressed)
+    except PacmanRoutingException as ex:
+        return str(ex)
+    return None
+
+
+class TestRoutingCompressionChecker(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        # tests against version 5 as Spin2 would not need compression
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def test_same_errors_as_codes(self) -> None:
+        class_file = sys.modules[self.__module__].__file__
+        assert class_file is not None
+        path = os.path.dirname(os.path.abspath(class_file))
+        original_tables = from_json(os.path.join(path, "many_to_one.json.gz"))
+        rng = random.Random(1)
+        n_errors = 0
+        for original in list(original_tables)[::8]:
+            entries, _ = ordered_covering(
+                original.multicast_routing_entries, None, {}, no_raise=True)
+            entries = remove_default_routes(entries, None)
+            if not entries:
+                continue
+            variants = [list(entries)]
+            # Break the table in each way the checker looks for
+            for kind in range(4):
+                variant = list(entries)
+                index = rng.randrange(len(variant))
+                entry = variant[index]
+                if kind == 0:
+                    del variant[index]
+                elif kind == 1:
+                    variant[index] = MulticastRoutingEntry(
+                        entry.key, entry.mask, RoutingEntry(
+                            spinnaker_route=entry.spinnaker_route ^ (
+                                1 << rng.randrange(24)),
+                            defaultable=entry.defaultable))
+                elif kind == 2:
+                    variant[index] = MulticastRoutingEntry(
+                        entry.key, entry.mask, RoutingEntry(
+                            spinnaker_route=entry.spinnaker_route,
+                            defaultable=not entry.defaultable))
+                else:
+                    mask = entry.mask & ~0xF
+                    variant.insert(index, MulticastRoutingEntry(
+                        entry.key & mask, mask, RoutingEntry(
+                            spinnaker_route=rng.getrandbits(8),
+                            defaultable=False)))
+                variants.append(variant)
+            for variant in variants:
+                compressed = CompressedMulticastRoutingTable(
+                    original.x, original.y, variant)
+                error = _error_by_codes(original, compressed)
+                self.assertEqual(error, _error(original, compressed))
+                if error is not None:
+                    n_errors += 1
+        # Make sure the broken tables were mostly found to be broken
+        self.assertGreater(n_errors, 100)
+
+    def test_check_after_compression(self) -> None:
+        class_file = sys.modules[self.__module__].__file__
+        assert class_file is not None
+        path = os.path.dirname(os.path.abspath(class_file))
+        original_tables = from_json(os.path.join(path, "many_to_one.json.gz"))
+        writer = PacmanDataWriter.mock()
+        writer.set_machine(virtual_machine(24, 24))
+        set_config(
+            "Mapping", "router_table_compress_as_far_as_possible", str(True))
+        with self.assertRaises(PacmanRoutingException):
+            _DropLastCompressor(accept_overflow=True).compress_tables(
+                original_tables, ProgressBar(
+                    original_tables.routing_tables, ""))
+
+        set_config("Mapping", "router_table_compression_check", str(False))
+        _DropLastCompressor(accept_overflow=True).compress_tables(
+            original_tables, ProgressBar(original_tables.routing_tables, ""))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,10 +13,13 @@
 # limitations under the License.
 
 from collections.abc import Iterable, Sequence
+from io import StringIO
 from typing import Any
 
 from spinn_utilities.overrides import overrides
 
+from spinn_machine import RoutingEntry
+
 from pacman.config_setup import unittest_setup
 from pacman.data import PacmanDataView
 from pacman.exceptions import (
@@ -30,6 +33,12 @@ from pacman.model.partitioner_splitters import AbstractSplitterCommon
 from pacman.model.resources import AbstractSDRAM
 from pacman.model.routing_info import MachineVertexRoutingInfo, RoutingInfo
 from pacman.model.routing_info.base_key_and_mask import BaseKeyAndMask
+from pacman.model.routing_table_by_partition import (
+    MulticastRoutingTableByPartition,
+)
+from pacman.operations.routing_info_allocator_algorithms import (
+    key_space_report,
+)
 from pacman.operations.routing_info_allocator_algorithms.\
     zoned_routing_info_allocator import ZonedRoutingInfoAllocator
 from pacman.utilities.utility_objs.chip_counter import ChipCounter
@@ -248,6 +257,29 @@ def create_graphs_no_edge() -> None:
     app_vertex.remember_machine_vertex(mac_vertex)
 
 
+def create_graphs_by_routes() -> MulticastRoutingTableByPartition:
+    out_app_vertex = MockAppVertex(splitter=MockSplitter())
+    PacmanDataView.add_vertex(out_app_vertex)
+    out_mac_vertex = TestMacVertex(app_vertex=out_app_vertex)
+    out_app_vertex.remember_machine_vertex(out_mac_vertex)
+
+    # Even vertices go to core 1 and odd ones to core 2
+    routes = MulticastRoutingTableByPartition()
+    for i in range(4):
+        app_vertex = MockAppVertex(splitter=MockSplitter())
+        PacmanDataView.add_vertex(app_vertex)
+        mac_vertex = TestMacVertex(
+            label=f"vertex{i}", app_vertex=app_vertex,
+            n_keys_required={"Part": 4})
+        app_vertex.remember_machine_vertex(mac_vertex)
+        PacmanDataView.add_edge(
+            ApplicationEdge(app_vertex, out_app_vertex), "Part")
+        routes.add_path_entry(
+            RoutingEntry(processor_ids=[1 + i % 2], link_ids=[]),
+            0, 0, mac_vertex, "Part")
+    return routes
+
+
 def check_masks_all_the_same(routing_info: RoutingInfo) -> None:
     # Check the mask is the same for all, and allows for the space required
     # for the maximum number of keys in total
@@ -323,6 +355,98 @@ def test_allocator_no_fixed() -> None:
     check_keys_for_application_partition_pairs(routing_info)
 
 
+def test_allocator_order_by_routes() -> None:
+    unittest_setup()
+    routes = create_graphs_by_routes()
+    allocator = ZonedRoutingInfoAllocator()
+    routing_info = allocator.allocate()
+    assert allocator.ordering_report is None
+
+    allocator = ZonedRoutingInfoAllocator()
+    routing_info = allocator.allocate(order_by_routes=True, routes=routes)
+    check_masks_all_the_same(routing_info)
+    shift = 32 - routing_info.target_app_bits
+    app_keys = {
+        r_info.vertex.label: r_info.key >> shift for r_info in routing_info
+        if isinstance(r_info, MachineVertexRoutingInfo)}
+    # Vertices with the same route are in the same aligned block
+    assert app_keys["vertex0"] // 2 == app_keys["vertex2"] // 2
+    assert app_keys["vertex1"] // 2 == app_keys["vertex3"] // 2
+    assert allocator.ordering_report is not None
+    assert allocator.ordering_report.default_total == 4
+    assert allocator.ordering_report.ordered_total == 2
+    assert allocator.ordering_report.ordered_max == 2
+
+
+def test_allocator_sticky() -> None:
+    unittest_setup()
+    routes = create_graphs_by_routes()
+    routing_info1 = ZonedRoutingInfoAllocator().allocate()
+
+    # Keys kept even if the order would have changed them
+    allocator = ZonedRoutingInfoAllocator()
+    routing_info2 = allocator.allocate(
+        order_by_routes=True, routes=routes, previous=routing_info1)
+    for r_info in routing_info1:
+        assert r_info.key_and_mask == routing_info2.get_info_from(
+            r_info.vertex, r_info.partition_id).key_and_mask
+    assert allocator.moved_partitions == []
+
+    # A vertex with more machine vertices changes the zones
+    out_app_vertex = next(iter(PacmanDataView.iterate_vertices()))
+    app_vertex = MockAppVertex(splitter=MockSplitter())
+    PacmanDataView.add_vertex(app_vertex)
+    for i in range(5):
+        app_vertex.remember_machine_vertex(TestMacVertex(
+            label=f"new{i}", app_vertex=app_vertex,
+            n_keys_required={"Part": 4}))
+    PacmanDataView.add_edge(
+        ApplicationEdge(app_vertex, out_app_vertex), "Part")
+    allocator = ZonedRoutingInfoAllocator()
+    routing_info3 = allocator.allocate(previous=routing_info2)
+    check_masks_all_the_same(routing_info3)
+    assert len(allocator.moved_partitions) == 4
+    assert (app_vertex, "Part") not in allocator.moved_partitions
+
+    # Nothing moves when nothing changed
+    allocator = ZonedRoutingInfoAllocator()
+    routing_info4 = allocator.allocate(previous=routing_info3)
+    assert allocator.moved_partitions == []
+    assert len(routing_info4) == len(routing_info3)
+
+
+def test_key_space_report() -> None:
+    unittest_setup()
+    create_graphs1(False)
+    routing_info = ZonedRoutingInfoAllocator().allocate()
+    report = key_space_report(routing_info)
+
+    n_app = sum(1 for info in routing_info
+                if not isinstance(info, MachineVertexRoutingInfo))
+    assert len(report.app_usage) == n_app
+    assert len(report.machine_usage) == len(routing_info) - n_app
+    for usage in report.machine_usage:
+        assert usage.n_keys_allocated == 2 ** 8
+        assert usage.n_keys_used <= usage.n_keys_allocated
+    assert report.n_keys_used == sum(
+        usage.n_keys_used for usage in report.machine_usage)
+    assert report.n_keys_allocated == n_app * 2 ** 15
+    assert 0 < report.fragmentation < 1
+
+    # Only the last vertex has 81 machine vertices with up to 161 keys
+    app_vertex = list(PacmanDataView.iterate_vertices())[-1]
+    assert len(report.machine_limiting) == 41
+    assert all(limit.vertex == app_vertex
+               for limit in report.machine_limiting)
+    assert len(report.atom_limiting) == 41
+    assert report.machine_bits_without_limits == 6
+    assert report.atom_bits_without_limits == 7
+
+    output = StringIO()
+    report.write(output)
+    assert "Fragmentation" in output.getvalue()
+
+
 def test_fixed_only() -> None:
     unittest_setup()
     fixed_keys_by_partition = {
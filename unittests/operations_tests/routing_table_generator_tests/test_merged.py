@@ -150,6 +150,24 @@ class TestMerged(unittest.TestCase):
         self.assertEqual(6, data.get_max_number_of_entries())
         self.assertEqual(5, len(list(data.routing_tables)))
 
+    def test_graph3_in_processes(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        writer = PacmanDataWriter.mock()
+        self.create_graphs3(writer)
+        self.make_infos(writer)
+        serial = merged_routing_table_generator()
+        set_config("Mapping", "n_mapping_processes", "2")
+        parallel = merged_routing_table_generator()
+        self.assertEqual(
+            len(list(serial.routing_tables)),
+            len(list(parallel.routing_tables)))
+        for table in serial.routing_tables:
+            other = parallel.get_routing_table_for_chip(table.x, table.y)
+            assert other is not None
+            self.assertEqual(
+                list(table.multicast_routing_entries),
+                list(other.multicast_routing_entries))
+
     @parameterized.expand(MANY_BOARD_TYPES)
     def test_bad_infos(self, _: str, ver_num: str) -> None:
         set_config("Machine", "version", ver_num)
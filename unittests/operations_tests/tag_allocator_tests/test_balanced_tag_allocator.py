@@ -0,0 +1,122 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from collections import Counter
+
+from spinn_utilities.config_holder import set_config
+
+from spinn_machine.version import Spin1Gen
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+from pacman.config_setup import unittest_setup
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import (
+    ConstantSDRAM,
+    IPtagResource,
+    ReverseIPtagResource,
+)
+from pacman.model.tags import Tags
+from pacman.operations.tag_allocator_algorithms import (
+    balanced_tag_allocator,
+    basic_tag_allocator,
+)
+
+
+def _loads(tags: Tags) -> Counter[str | None]:
+    loads: Counter[str | None] = Counter()
+    for ip_tag, vertex in tags.ip_tags_vertices:
+        rate = next(iter(vertex.iptags)).rate
+        assert rate is not None
+        loads[ip_tag.board_address] += int(rate)
+    return loads
+
+
+class TestBalancedTagAllocator(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        self.writer = PacmanDataWriter.mock()
+        self.machine = virtual_machine_by_boards(3)
+        self.writer.set_machine(self.machine)
+        self.eth_chips = list(self.machine.ethernet_connected_chips)
+
+    def _place(self, *resources: IPtagResource | ReverseIPtagResource
+               ) -> list[SimpleMachineVertex]:
+        """
+        Place a vertex for each resource on the first board.
+        """
+        placements = Placements()
+        vertices = []
+        for p, resource in enumerate(resources, start=1):
+            if isinstance(resource, IPtagResource):
+                vertex = SimpleMachineVertex(
+                    ConstantSDRAM(0), iptags=[resource])
+            else:
+                vertex = SimpleMachineVertex(
+                    ConstantSDRAM(0), reverse_iptags=[resource])
+            vertices.append(vertex)
+            placements.add_placement(Placement(vertex, 1, 1, p))
+        self.writer.set_placements(placements)
+        return vertices
+
+    def test_spread_by_rate(self) -> None:
+        self._place(*(
+            IPtagResource("127.0.0.1", port=rate, strip_sdp=True, rate=rate)
+            for rate in range(1, 9)))
+        # The basic allocator fills the nearest board in placement order
+        self.assertEqual(
+            _loads(basic_tag_allocator())[self.eth_chips[0].ip_address], 28)
+
+        # 8, 3, 2 on the nearest; 7, 4, 1 and 6, 5 on the others
+        loads = _loads(balanced_tag_allocator())
+        self.assertEqual(
+            [loads[eth_chip.ip_address] for eth_chip in self.eth_chips],
+            [13, 12, 11])
+
+        # Nothing else is near enough until the nearest board is full
+        loads = _loads(balanced_tag_allocator(max_distance=0))
+        self.assertEqual(
+            [loads[eth_chip.ip_address] for eth_chip in self.eth_chips],
+            [35, 1, 0])
+
+    def test_fixed_and_reverse_tags(self) -> None:
+        vertices = self._place(
+            IPtagResource("127.0.0.1", port=1, strip_sdp=True, tag=1,
+                          rate=10),
+            IPtagResource("127.0.0.1", port=2, strip_sdp=True),
+            IPtagResource("127.0.0.1", port=3, strip_sdp=True, rate=2),
+            ReverseIPtagResource())
+        tags = balanced_tag_allocator()
+        nearest = self.eth_chips[0].ip_address
+
+        # The fixed tag stays on the nearest board, making it the busiest
+        fixed_tags = tags.get_ip_tags_for_vertex(vertices[0])
+        assert fixed_tags is not None
+        self.assertEqual(
+            (fixed_tags[0].board_address, fixed_tags[0].tag), (nearest, 1))
+        for vertex in vertices[1:3]:
+            ip_tags = tags.get_ip_tags_for_vertex(vertex)
+            assert ip_tags is not None
+            self.assertNotEqual(ip_tags[0].board_address, nearest)
+        reverse_tags = tags.get_reverse_ip_tags_for_vertex(vertices[3])
+        assert reverse_tags is not None
+        self.assertEqual(reverse_tags[0].board_address, nearest)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -201,6 +201,70 @@ class TestTagsBoardAddresses(unittest.TestCase):
         machine = virtual_machine_by_boards(3)
         self.do_fixed_repeat_tag(machine)
 
+    @parameterized.expand(BIG_BOARD_TYPES)  # Needs multiple boards
+    def test_auto_tags_overflow_boards(self, _: str, ver_num: str) -> None:
+        set_config("Machine", "version", ver_num)
+        writer = PacmanDataWriter.mock()
+        machine = virtual_machine_by_boards(3)
+        writer.set_machine(machine)
+        eth_chips = machine.ethernet_connected_chips
+        n_tags = len(eth_chips[0].tag_ids)
+        procs = list(eth_chips[0].placable_processors_ids)
+        placements = Placements()
+        vertices = []
+        for i in range(n_tags * len(eth_chips)):
+            vertex = SimpleMachineVertex(
+                sdram=ConstantSDRAM(0),
+                iptags=[IPtagResource("127.0.0.1", port=i, strip_sdp=True)],
+                label=f"Vertex {i}")
+            vertices.append(vertex)
+            chip = machine[eth_chips[0].x + i // len(procs), eth_chips[0].y]
+            placements.add_placement(
+                Placement(vertex, chip.x, chip.y, procs[i % len(procs)]))
+        reverse_vertices = []
+        for i in range(3):
+            vertex = SimpleMachineVertex(
+                sdram=ConstantSDRAM(0),
+                reverse_iptags=[ReverseIPtagResource()],
+                label=f"Reverse Vertex {i}")
+            reverse_vertices.append(vertex)
+            placements.add_placement(Placement(
+                vertex, eth_chips[-1].x, eth_chips[-1].y, procs[i]))
+        writer.set_placements(placements)
+        writer.set_plan_n_timesteps(1000)
+        with self.assertRaises(PacmanNotFoundError):
+            basic_tag_allocator()
+
+        # The nearest board gives its tags from the top, then the other
+        # boards are filled in order from the bottom
+        writer.set_placements(Placements(
+            placement for placement in placements
+            if placement.vertex not in reverse_vertices))
+        tags = basic_tag_allocator()
+        allocated = []
+        for vertex in vertices:
+            iptags = tags.get_ip_tags_for_vertex(vertex)
+            assert iptags is not None
+            allocated.append((iptags[0].board_address, iptags[0].tag))
+        expected = [(eth_chips[0].ip_address, tag)
+                    for tag in sorted(eth_chips[0].tag_ids, reverse=True)]
+        for chip in eth_chips[1:]:
+            expected.extend(
+                (chip.ip_address, tag) for tag in sorted(chip.tag_ids))
+        self.assertEqual(expected, allocated)
+
+        # Ports are also taken from the top
+        writer.set_placements(Placements(
+            placement for placement in placements
+            if placement.vertex in reverse_vertices))
+        tags = basic_tag_allocator()
+        for i, vertex in enumerate(reverse_vertices):
+            reverse_tags = tags.get_reverse_ip_tags_for_vertex(vertex)
+            assert reverse_tags is not None
+            self.assertEqual(max(eth_chips[-1].tag_ids) - i,
+                             reverse_tags[0].tag)
+            self.assertEqual(17999 - i, reverse_tags[0].port)
+
     def do_reverse(self, machine: Machine) -> None:
         writer = PacmanDataWriter.mock()
         writer.set_machine(machine)
@@ -0,0 +1,120 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from spinn_utilities.config_holder import set_config
+
+from spinn_machine import MulticastRoutingEntry, RoutingEntry, virtual_machine
+from spinn_machine.version import Spin1Gen
+
+from pacman.config_setup import unittest_setup
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.model.graphs.common import Slice
+from pacman.model.graphs.machine import MachineVertex, SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ConstantSDRAM
+from pacman.model.routing_info import (
+    BaseKeyAndMask,
+    GlobalMachineVertexRoutingInfo,
+    RoutingInfo,
+)
+from pacman.model.routing_tables import (
+    MulticastRoutingTables,
+    UnCompressedMulticastRoutingTable,
+)
+from pacman.operations.traffic_simulator import simulate_multicast_traffic
+
+
+def _vertex(n_atoms: int) -> SimpleMachineVertex:
+    return SimpleMachineVertex(
+        ConstantSDRAM(0), vertex_slice=Slice(0, n_atoms - 1))
+
+
+def _table(x: int, y: int, *entries: tuple[int, int, int]
+           ) -> UnCompressedMulticastRoutingTable:
+    return UnCompressedMulticastRoutingTable(x, y, [
+        MulticastRoutingEntry(key, mask, RoutingEntry(
+            spinnaker_route=route, defaultable=False))
+        for key, mask, route in entries])
+
+
+class TestMulticastTrafficSimulator(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        PacmanDataWriter.mock().set_machine(virtual_machine(8, 8))
+        self.source = _vertex(10)
+        self.local = _vertex(5)
+        self.placements = Placements([
+            Placement(self.source, 0, 0, 1), Placement(self.local, 2, 0, 1)])
+        self.routing_infos = RoutingInfo()
+        self.routing_infos.add_routing_info(GlobalMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x100, 0xFFFFFFF0), "Part", self.source, 0,
+            0xFFFFFFF0))
+        self.routing_infos.add_routing_info(GlobalMachineVertexRoutingInfo(
+            BaseKeyAndMask(0x200, 0xFFFFFFF8), "Part", self.local, 0,
+            0xFFFFFFF8))
+
+    def _rate(self, vertex: MachineVertex, partition_id: str) -> float:
+        self.assertEqual("Part", partition_id)
+        return 2.0 if vertex is self.source else 1.0
+
+    def test_straight_line(self) -> None:
+        tables = MulticastRoutingTables([
+            # East and to core 2
+            _table(0, 0, (0x100, 0xFFFFFFF0, (1 << 0) | (1 << 8))),
+            # (1, 0) has no table so default routes east again; the keys of
+            # the local vertex have no entry so are dropped
+            _table(2, 0, (0x100, 0xFFFFFFF0, 1 << 9))])
+        report = simulate_multicast_traffic(
+            tables, self.routing_infos, self.placements, self._rate)
+        self.assertEqual(25.0, report.injected_rate)
+        self.assertEqual({(0, 0, 0): 20.0, (1, 0, 0): 20.0},
+                         report.link_rates)
+        self.assertEqual({(0, 0): 20.0, (1, 0): 20.0, (2, 0): 25.0},
+                         report.router_rates)
+        self.assertEqual({(0, 0, 2): 20.0, (2, 0, 3): 20.0},
+                         report.core_rates)
+        self.assertEqual({(2, 0): 5.0}, report.dropped_rates)
+
+        self.assertEqual([((0, 0, 0), 20.0)], report.hottest_links(1))
+        paths = report.hottest_paths(5)
+        self.assertEqual(1, len(paths))
+        self.assertIs(self.source, paths[0].vertex)
+        self.assertEqual(20.0, paths[0].rate)
+        self.assertEqual(((0, 0, 0), (1, 0, 0)), paths[0].links)
+        self.assertEqual(20.0, paths[0].peak_rate)
+
+        self.assertEqual({(0, 0): 0.5, (1, 0): 0.5, (2, 0): 0.2},
+                         report.drop_risk(10.0, 100.0))
+        self.assertEqual({(2, 0): 0.2}, report.drop_risk(100.0, 100.0))
+
+    def test_cycle(self) -> None:
+        tables = MulticastRoutingTables([
+            _table(0, 0, (0x100, 0xFFFFFFF0, 1 << 0)),
+            _table(1, 0, (0x100, 0xFFFFFFF0, 1 << 3))])
+        report = simulate_multicast_traffic(
+            tables, self.routing_infos, self.placements, self._rate,
+            max_hops=4)
+        # Four links are used, two each way, before the packets are dropped
+        self.assertEqual({(0, 0, 0): 40.0, (1, 0, 3): 40.0},
+                         report.link_rates)
+        self.assertEqual({(0, 0): 20.0, (2, 0): 5.0}, report.dropped_rates)
+        self.assertEqual({}, report.core_rates)
+
+
+if __name__ == '__main__':
+    unittest.main()
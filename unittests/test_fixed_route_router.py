@@ -18,7 +18,7 @@ from parameterized import parameterized
 
 from spinn_utilities.config_holder import set_config
 
-from spinn_machine import Machine, RoutingEntry, virtual_machine
+from spinn_machine import Chip, Machine, RoutingEntry, virtual_machine
 from spinn_machine.version import BIG_BOARD_TYPES, Spin1Gen, Spin2Gen
 
 from pacman.config_setup import unittest_setup
@@ -120,3 +120,28 @@ def test_unreachable(_: str, ver_num: str) -> None:
     set_config("Machine", "down_chips", "0,2:1,3:1,4")
     with pytest.raises(PacmanRoutingException):
         _check_setup(8, 8)
+
+
+@parameterized.expand(BIG_BOARD_TYPES)  # Needs several 8 x 8 boards
+def test_same_routes_on_same_boards(_: str, ver_num: str) -> None:
+    unittest_setup()
+    set_config("Machine", "version", ver_num)
+    set_config("Machine", "down_chips", "5,9")
+    _check_setup(12, 12)
+    machine = PacmanDataWriter.get_machine()
+    fixed_route_tables = fixed_route_router(SimpleMachineVertex)
+
+    def relative_routes(
+            ethernet_chip: Chip) -> dict[tuple[int, int], frozenset[int]]:
+        return {
+            ((x - ethernet_chip.x) % machine.width,
+             (y - ethernet_chip.y) % machine.height):
+            fixed_route_tables[x, y].link_ids
+            for x, y in machine.get_existing_xys_by_ethernet(
+                ethernet_chip.x, ethernet_chip.y)}
+
+    # The board with the down chip is routed around it
+    first, faulty, last = machine.ethernet_connected_chips
+    assert (faulty.x, faulty.y) == (4, 8)
+    assert relative_routes(first) == relative_routes(last)
+    assert relative_routes(first) != relative_routes(faulty)
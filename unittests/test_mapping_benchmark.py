@@ -0,0 +1,78 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from spinn_utilities.config_holder import set_config
+
+from spinn_machine.version import Spin1Gen
+
+from pacman.config_setup import unittest_setup
+from pacman.data import PacmanDataView
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.model.graphs.common import MDSlice
+from pacman.operations.partition_algorithms import splitter_partitioner
+
+from pacman_test_objects.benchmarks import (
+    NETWORKS,
+    convolution_network,
+    local_network,
+    run_mapping_benchmark,
+)
+
+
+class TestMappingBenchmark(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+
+    def test_networks(self) -> None:
+        for network in NETWORKS:
+            result = run_mapping_benchmark(network, 1, ["range_compressor"])
+            self.assertEqual(
+                result.n_vertices, PacmanDataView.get_n_vertices())
+            self.assertEqual(
+                result.n_machine_vertices,
+                PacmanDataView.get_n_placements())
+            self.assertEqual(list(result.phase_times), [
+                "partitioning", "placement", "routing", "key allocation",
+                "table generation", "compression with range_compressor"])
+            size = result.compressed_sizes["range_compressor"]
+            assert size is not None
+            self.assertLessEqual(size, result.max_table_size)
+            json.dumps(result.to_json())
+
+    def test_local_network(self) -> None:
+        PacmanDataWriter.mock()
+        local_network(3, 2)
+        # Each vertex sends to all six, as the grid wraps around
+        self.assertEqual(6, PacmanDataView.get_n_vertices())
+        self.assertEqual(36, len(PacmanDataView.get_edges()))
+
+    def test_convolution_network(self) -> None:
+        PacmanDataWriter.mock()
+        convolution_network(3, 2, width=16, height=8, atoms_per_core=(8, 4))
+        self.assertEqual(6, PacmanDataView.get_n_vertices())
+        self.assertEqual(8, len(PacmanDataView.get_edges()))
+        splitter_partitioner()
+        self.assertEqual(6 * 4, PacmanDataView.get_n_machine_vertices())
+        for vertex in PacmanDataView.iterate_machine_vertices():
+            self.assertIsInstance(vertex.vertex_slice, MDSlice)
+            self.assertEqual((8, 4), vertex.vertex_slice.shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.exceptions import SpiNNUtilsException
+
+from spinn_machine.version import Spin1Gen
+
+from pacman.config_setup import unittest_setup
+from pacman.data import PacmanDataView
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.exceptions import PacmanConfigurationException
+from pacman.model.graphs.application import ApplicationEdge
+from pacman.model.partitioner_splitters import SplitterFixedLegacy
+from pacman.model.placements import Placements
+from pacman.model.routing_tables import (
+    MulticastRoutingTables,
+    to_columnar,
+)
+from pacman.model.tags import Tags
+from pacman.operations.partition_algorithms import splitter_partitioner
+from pacman.operations.placer_algorithms import place_application_graph
+from pacman.operations.router_algorithms.application_router import (
+    route_application_graph,
+)
+from pacman.operations.routing_info_allocator_algorithms import (
+    ZonedRoutingInfoAllocator,
+)
+from pacman.operations.routing_table_generators import (
+    basic_routing_table_generator,
+)
+from pacman.utilities.checkpoint import read_checkpoint, write_checkpoint
+
+from pacman_test_objects import SimpleTestVertex
+
+
+def _make_graph(writer: PacmanDataWriter) -> None:
+    vertices = [
+        SimpleTestVertex(
+            n_atoms, f"app{i}", max_atoms_per_core=10,
+            splitter=SplitterFixedLegacy())
+        for i, n_atoms in enumerate((100, 100, 10))]
+    for vertex in vertices:
+        writer.add_vertex(vertex)
+    for pre, post in ((0, 1), (1, 2), (0, 0)):
+        writer.add_edge(ApplicationEdge(vertices[pre], vertices[post]), "foo")
+    splitter_partitioner()
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "checkpoint.npz")
+
+    def test_write_and_read(self) -> None:
+        writer = PacmanDataWriter.mock()
+        _make_graph(writer)
+        writer.set_placements(place_application_graph(Placements()))
+        writer.set_routing_table_by_partition(route_application_graph())
+        writer.set_routing_infos(ZonedRoutingInfoAllocator().allocate())
+        writer.set_tags(Tags())
+        uncompressed = basic_routing_table_generator()
+        writer.set_uncompressed(uncompressed)
+        writer.set_precompressed(MulticastRoutingTables(
+            to_columnar(table) for table in uncompressed))
+        writer.set_plan_n_timesteps(100)
+        placed = {placement.vertex.label: placement.location
+                  for placement in writer.iterate_placemements()}
+        infos = {(info.vertex.label, info.partition_id, info.key, info.mask)
+                 for info in writer.get_routing_infos()}
+        write_checkpoint(self.path)
+
+        # Make the graph again, as a new run of the same script would
+        writer = PacmanDataWriter.mock()
+        _make_graph(writer)
+        read_checkpoint(self.path, writer)
+        self.assertEqual(placed, {
+            placement.vertex.label: placement.location
+            for placement in writer.iterate_placemements()})
+        app_vertices = set(writer.iterate_vertices())
+        for placement in writer.iterate_placemements():
+            self.assertIn(placement.vertex.app_vertex, app_vertices)
+        self.assertEqual(infos, {
+            (info.vertex.label, info.partition_id, info.key, info.mask)
+            for info in writer.get_routing_infos()})
+        self.assertEqual(100, writer.get_plan_n_timestep())
+
+        restored = writer.get_uncompressed()
+        self.assertEqual(
+            uncompressed.get_max_number_of_entries(),
+            restored.get_max_number_of_entries())
+        for table in uncompressed:
+            self.assertEqual(table, restored.get_routing_table_for_chip(
+                table.x, table.y))
+        for table in writer.get_precompressed():
+            original = uncompressed.get_routing_table_for_chip(
+                table.x, table.y)
+            assert original is not None
+            self.assertEqual(table, to_columnar(original))
+
+        # The routes are those of the vertices of the new graph
+        new_vertices = app_vertices.union(writer.iterate_machine_vertices())
+        by_partition = writer.get_routing_table_by_partition()
+        for xy in by_partition.get_routers():
+            entries = by_partition.get_entries_for_router(*xy)
+            assert entries is not None
+            for vertex, _partition_id in entries:
+                self.assertIn(vertex, new_vertices)
+
+    def test_only_some_available(self) -> None:
+        writer = PacmanDataWriter.mock()
+        _make_graph(writer)
+        writer.set_placements(place_application_graph(Placements()))
+        write_checkpoint(self.path)
+
+        writer = PacmanDataWriter.mock()
+        _make_graph(writer)
+        read_checkpoint(self.path, writer)
+        self.assertEqual(
+            writer.get_n_machine_vertices(), writer.get_n_placements())
+        with self.assertRaises(SpiNNUtilsException):
+            PacmanDataView.get_routing_infos()
+
+    def test_vertices_not_found(self) -> None:
+        writer = PacmanDataWriter.mock()
+        _make_graph(writer)
+        writer.set_placements(place_application_graph(Placements()))
+        write_checkpoint(self.path)
+
+        # A different graph does not have the vertices
+        writer = PacmanDataWriter.mock()
+        writer.add_vertex(SimpleTestVertex(
+            10, "other", splitter=SplitterFixedLegacy()))
+        splitter_partitioner()
+        with self.assertRaises(PacmanConfigurationException):
+            read_checkpoint(self.path, writer)
+
+        with open(self.path, "wb") as f:
+            f.write(b"Not a checkpoint")
+        with self.assertRaises(PacmanConfigurationException):
+            read_checkpoint(self.path, writer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from spinn_utilities.config_holder import set_config
+
+from spinn_machine.version import Spin1Gen
+
+from pacman.config_setup import unittest_setup
+from pacman.data.pacman_data_writer import PacmanDataWriter
+from pacman.model.partitioner_splitters import SplitterFixedLegacy
+from pacman.model.placements import Placements
+from pacman.operations.partition_algorithms import splitter_partitioner
+from pacman.operations.placer_algorithms import place_application_graph
+from pacman.operations.routing_info_allocator_algorithms import (
+    ZonedRoutingInfoAllocator,
+)
+from pacman.utilities.instrumentation import SpanRecorder, span
+
+from pacman_test_objects import SimpleTestVertex
+
+
+@span("decorated")
+def _decorated() -> int:
+    with span("inner"):
+        return 42
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_nested_spans(self) -> None:
+        with SpanRecorder() as recorder:
+            with span("outer"):
+                self.assertEqual(_decorated(), 42)
+                self.assertEqual(_decorated(), 42)
+        self.assertEqual(
+            [(s.name, s.depth) for s in recorder.spans],
+            [("outer", 0), ("decorated", 1), ("inner", 2),
+             ("decorated", 1), ("inner", 2)])
+        outer = recorder.spans[0]
+        for s in recorder.spans[1:]:
+            self.assertGreaterEqual(s.start, outer.start)
+            self.assertLessEqual(s.wall_time, outer.wall_time)
+            self.assertIsNone(s.memory_peak)
+        self.assertLessEqual(recorder.total("decorated"), outer.wall_time)
+
+    def test_not_recording(self) -> None:
+        recorder = SpanRecorder()
+        self.assertEqual(_decorated(), 42)
+        with recorder:
+            pass
+        self.assertEqual(_decorated(), 42)
+        self.assertEqual(recorder.spans, [])
+
+    def test_memory(self) -> None:
+        self.assertFalse(tracemalloc.is_tracing())
+        with SpanRecorder(trace_memory=True) as recorder:
+            with span("outer"):
+                with span("big"):
+                    big = bytearray(1000000)
+                del big
+                with span("small"):
+                    small = bytearray(1000)
+                del small
+        self.assertFalse(tracemalloc.is_tracing())
+        peaks = {s.name: s.memory_peak for s in recorder.spans}
+        for name in ("outer", "big"):
+            peak = peaks[name]
+            assert peak is not None
+            self.assertGreater(peak, 900000)
+        small_peak = peaks["small"]
+        assert small_peak is not None
+        self.assertLess(small_peak, 100000)
+
+    def test_json(self) -> None:
+        with SpanRecorder(trace_memory=True) as recorder:
+            _decorated()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            recorder.write_json(path)
+            with open(path, encoding="utf-8") as f:
+                trace = json.load(f)
+        events = trace["traceEvents"]
+        self.assertEqual(["decorated", "inner"], [e["name"] for e in events])
+        for event in events:
+            self.assertEqual("X", event["ph"])
+            self.assertIn("memory_peak_bytes", event["args"])
+            self.assertIn("cpu_time_us", event["args"])
+        self.assertEqual(1, events[1]["args"]["depth"])
+
+    def test_mapping_spans(self) -> None:
+        set_config("Machine", "version", str(Spin1Gen.FIVE.value))
+        writer = PacmanDataWriter.mock()
+        writer.add_vertex(SimpleTestVertex(
+            100, "app", max_atoms_per_core=10,
+            splitter=SplitterFixedLegacy()))
+        with SpanRecorder() as recorder:
+            splitter_partitioner()
+            writer.set_placements(place_application_graph(Placements()))
+            ZonedRoutingInfoAllocator().allocate()
+        names = [s.name for s in recorder.spans if s.depth == 0]
+        self.assertEqual(names, [
+            "splitter_partitioner", "place_application_graph",
+            "ZonedRoutingInfoAllocator.allocate"])
+        self.assertIn("place vertices", [s.name for s in recorder.spans])
+        self.assertIn("allocate keys", [s.name for s in recorder.spans])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,7 +22,12 @@ from pacman.model.resources import (
     IPtagResource,
     ReverseIPtagResource,
 )
-from pacman.utilities.json_utils import placement_from_json, placement_to_json
+from pacman.utilities.json_utils import (
+    iptag_resource_from_json,
+    iptag_resource_to_json,
+    placement_from_json,
+    placement_to_json,
+)
 
 
 class TestJsonUtils(unittest.TestCase):
@@ -62,3 +67,10 @@ class TestJsonUtils(unittest.TestCase):
             label="PVertex")
         p1 = Placement(s1, 1, 2, 3)
         self.placement_there_and_back(p1)
+
+    def test_iptag_resource(self) -> None:
+        for iptag in (IPtagResource("127.0.0.1", port=456, strip_sdp=True),
+                      IPtagResource("127.0.0.1", 456, False, 3, "A", 1.5)):
+            back = iptag_resource_from_json(json.loads(json.dumps(
+                iptag_resource_to_json(iptag))))
+            self.assertEqual(iptag, back)